@@ -1,7 +1,8 @@
 from __future__ import annotations
 
-from dataclasses import dataclass, field
-from typing import Any, Protocol
+import sys
+from dataclasses import FrozenInstanceError
+from typing import Any, Protocol, Sequence
 
 
 class ContractValidationError(ValueError):
@@ -16,43 +17,135 @@ class ChannelRuntimeError(RuntimeError):
     """Raised for deterministic service/runtime failures."""
 
 
-@dataclass(frozen=True)
-class InboundMessage:
+_SANITIZED_MAX_CHARS = 500
+
+
+def sanitize_exception(exc: BaseException) -> str:
+    """Render ``exc`` as one whitespace-collapsed line of at most 500 characters."""
+    raw = f"{type(exc).__name__}: {exc}"
+    # Already clean: single spaces only (isprintable() rejects every other
+    # whitespace character) and nothing to strip or truncate.
+    if len(raw) <= _SANITIZED_MAX_CHARS and raw.isprintable() and "  " not in raw and not raw.endswith(" "):
+        return raw
+    return " ".join(raw.split())[:_SANITIZED_MAX_CHARS]
+
+
+def _require_nonempty_str(name: str, value: Any) -> None:
+    # Fast path for the common case: adapters already hand over real strings,
+    # and isspace() answers without allocating a stripped copy.
+    if type(value) is str:
+        if value and not value.isspace():
+            return
+    elif str(value).strip():
+        return
+    raise ContractValidationError(f"{name} must be a non-empty string")
+
+
+def _intern_id(value: Any) -> Any:
+    # Chat/user ids repeat across every update and key session/allowlist lookups;
+    # interned copies hash once and compare by identity. Non-str ids pass through.
+    return sys.intern(value) if type(value) is str else value
+
+
+class _FrozenSlots:
+    """Immutable ``__slots__`` base shared by the message contracts.
+
+    Hand-written instead of ``@dataclass(frozen=True)`` so construction skips the
+    generated ``__init__``/``__post_init__`` hop and instances carry no ``__dict__``.
+    """
+
+    __slots__ = ()
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        raise FrozenInstanceError(f"cannot assign to field {name!r}")
+
+    def __delattr__(self, name: str) -> None:
+        raise FrozenInstanceError(f"cannot delete field {name!r}")
+
+    def _astuple(self) -> tuple[Any, ...]:
+        return tuple(getattr(self, name) for name in self.__slots__)
+
+    def __reduce__(self) -> tuple[Any, ...]:
+        # copy/pickle rebuild through __init__ (slot order matches its positional
+        # parameters); the default protocol would trip over __setattr__.
+        return (self.__class__, self._astuple())
+
+    def __eq__(self, other: object) -> bool:
+        if other.__class__ is not self.__class__:
+            return NotImplemented
+        return self._astuple() == other._astuple()
+
+    def __hash__(self) -> int:
+        return hash(self._astuple())
+
+    def __repr__(self) -> str:
+        fields = ", ".join(f"{name}={getattr(self, name)!r}" for name in self.__slots__)
+        return f"{type(self).__name__}({fields})"
+
+
+class InboundMessage(_FrozenSlots):
     """Provider-agnostic inbound message contract."""
 
+    __slots__ = ("update_id", "chat_id", "user_id", "text", "message_id", "timestamp_s", "metadata")
+
     update_id: str
     chat_id: str
     user_id: str
     text: str
-    message_id: str | None = None
-    timestamp_s: int | None = None
-    metadata: dict[str, Any] = field(default_factory=dict)
-
-    def __post_init__(self) -> None:
-        if not str(self.update_id).strip():
-            raise ContractValidationError("update_id must be a non-empty string")
-        if not str(self.chat_id).strip():
-            raise ContractValidationError("chat_id must be a non-empty string")
-        if not str(self.user_id).strip():
-            raise ContractValidationError("user_id must be a non-empty string")
-        if not str(self.text).strip():
-            raise ContractValidationError("text must be a non-empty string")
-
-
-@dataclass(frozen=True)
-class OutboundMessage:
+    message_id: str | None
+    timestamp_s: int | None
+    metadata: dict[str, Any]
+
+    def __init__(
+        self,
+        update_id: str,
+        chat_id: str,
+        user_id: str,
+        text: str,
+        message_id: str | None = None,
+        timestamp_s: int | None = None,
+        metadata: dict[str, Any] | None = None,
+    ) -> None:
+        _require_nonempty_str("update_id", update_id)
+        _require_nonempty_str("chat_id", chat_id)
+        _require_nonempty_str("user_id", user_id)
+        _require_nonempty_str("text", text)
+
+        _set = object.__setattr__
+        _set(self, "update_id", update_id)
+        _set(self, "chat_id", _intern_id(chat_id))
+        _set(self, "user_id", _intern_id(user_id))
+        _set(self, "text", text)
+        _set(self, "message_id", message_id)
+        _set(self, "timestamp_s", timestamp_s)
+        _set(self, "metadata", metadata if metadata is not None else {})
+
+
+class OutboundMessage(_FrozenSlots):
     """Provider-agnostic outbound message contract."""
 
+    __slots__ = ("chat_id", "text", "reply_to_message_id", "metadata")
+
     chat_id: str
     text: str
-    reply_to_message_id: str | None = None
-    metadata: dict[str, Any] = field(default_factory=dict)
-
-    def __post_init__(self) -> None:
-        if not str(self.chat_id).strip():
-            raise ContractValidationError("chat_id must be a non-empty string")
-        if not str(self.text).strip():
-            raise ContractValidationError("text must be a non-empty string")
+    reply_to_message_id: str | None
+    metadata: dict[str, Any]
+
+    def __init__(
+        self,
+        chat_id: str,
+        text: str,
+        reply_to_message_id: str | None = None,
+        metadata: dict[str, Any] | None = None,
+    ) -> None:
+        _require_nonempty_str("chat_id", chat_id)
+        _require_nonempty_str("text", text)
+
+        _set = object.__setattr__
+        _set(self, "chat_id", _intern_id(chat_id))
+        _set(self, "text", text)
+        _set(self, "reply_to_message_id", reply_to_message_id)
+        _set(self, "metadata", metadata if metadata is not None else {})
 
 
 class OrchestratorPort(Protocol):
@@ -61,15 +154,56 @@ class OrchestratorPort(Protocol):
     def handle_message(self, inbound: InboundMessage, *, session_id: str) -> OutboundMessage | None:
         """Return zero or one outbound message for one inbound."""
 
+    def handle_messages(
+        self,
+        batch: Sequence[tuple[InboundMessage, str]],
+    ) -> list[OutboundMessage | None | Exception]:
+        """Handle ``(inbound, session_id)`` pairs; implementations may fan out across sessions.
+
+        Results line up with ``batch``; a per-message failure is returned in its slot.
+        The service only routes a fetch here when the orchestrator's optional
+        ``batch_parallelism`` attribute is above 1 and the fetch spans several sessions.
+        """
+        results: list[OutboundMessage | None | Exception] = []
+        for inbound, session_id in batch:
+            try:
+                results.append(self.handle_message(inbound, session_id=session_id))
+            except Exception as exc:
+                results.append(exc)
+        return results
+
 
 class ChannelAdapterPort(Protocol):
     """Transport adapter port that core service uses."""
 
     def fetch_updates(self) -> list[InboundMessage]:
-        """Return the next batch of normalized inbound messages."""
+        """Return the next batch of normalized inbound messages.
+
+        The service only reads the batch, so adapters may hand over a list they keep.
+        """
 
     def send_message(self, outbound: OutboundMessage) -> None:
         """Deliver one outbound message."""
 
+    def send_messages(self, outbounds: list[OutboundMessage]) -> list[Exception | None]:
+        """Deliver a batch; per-message failures come back in their slot.
+
+        A raised exception fails every message in the batch; the service does not
+        re-send, since part of the batch may already have been delivered.
+        """
+        results: list[Exception | None] = []
+        for outbound in outbounds:
+            try:
+                self.send_message(outbound)
+                results.append(None)
+            except Exception as exc:
+                results.append(exc)
+        return results
+
     def ack_update(self, update_id: str) -> None:
         """Acknowledge update processing completion."""
+
+    def ack_updates(self, update_ids: list[str]) -> None:
+        """Acknowledge a batch of updates; adapters may override with one round-trip."""
+        for update_id in update_ids:
+            self.ack_update(update_id)
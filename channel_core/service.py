@@ -1,7 +1,11 @@
 from __future__ import annotations
 
-from dataclasses import asdict, dataclass, field
-from typing import Callable
+import queue
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass, field
+from itertools import chain
+from operator import attrgetter
+from typing import Callable, Iterator
 
 from .contracts import (
     ChannelAdapterPort,
@@ -10,13 +14,25 @@ from .contracts import (
     InboundMessage,
     OrchestratorPort,
     OutboundMessage,
+    sanitize_exception,
 )
 from .session_map import session_id_for_inbound
 
+# Bound on orchestrated updates waiting for delivery; keeps the orchestrate
+# stage from running arbitrarily far ahead of a slow adapter.
+_DELIVERY_QUEUE_DEPTH = 8
+# How often a blocked handoff re-checks that the delivery worker is still running.
+_HANDOFF_POLL_S = 0.1
+_PIPELINE_DONE = object()
+
 
 @dataclass(frozen=True)
 class ProcessOnceResult:
-    """Machine-readable outcome of one service cycle."""
+    """Machine-readable outcome of one service cycle.
+
+    Documents the schema of the mapping ``process_once`` returns; the hot path
+    builds that mapping directly via ``_result_dict``.
+    """
 
     status: str
     reason: str
@@ -48,72 +64,301 @@ def process_once(
     try:
         updates = adapter.fetch_updates()
     except Exception as exc:
-        message = _sanitize_exception(exc)
-        return asdict(
-            ProcessOnceResult(
-                status="failed",
-                reason="adapter-fetch-exception",
-                error_count=1,
-                errors=[message],
-            )
-        )
+        message = sanitize_exception(exc)
+        return _result_dict("failed", "adapter-fetch-exception", errors=[message])
 
     if not updates:
-        return asdict(ProcessOnceResult(status="ok", reason="no-updates"))
+        return _result_dict("ok", "no-updates")
+
+    ack_always = normalized_ack_policy == "always"
+    outcomes = [_UpdateOutcome(update_id=inbound.update_id) for inbound in updates]
+    handoff: queue.Queue = queue.Queue(maxsize=_DELIVERY_QUEUE_DEPTH)
+
+    # Two-stage pipeline: this thread orchestrates while a single delivery
+    # worker sends in fetch order, so adapter round-trips overlap with the
+    # next orchestrator call. Orchestrators that fan out across sessions get
+    # the whole batch at once instead, and it is handed over (and, for
+    # adapters with send_messages, sent) as one chunk. Acks are flushed once
+    # the batch is delivered.
+    # Adapter lookups happen here so a missing or broken attribute cannot kill the worker.
+    send = _resolve_send(adapter)
+    send_batch = _resolve_send_batch(adapter)
+    with ThreadPoolExecutor(max_workers=1, thread_name_prefix="channel-deliver") as executor:
+        pending_acks: list[_UpdateOutcome] = []
+        delivery = executor.submit(_deliver_stage, send, send_batch, handoff, ack_always, pending_acks)
+        handle_batch = getattr(orchestrator, "handle_messages", None)
+        if callable(handle_batch) and _fans_out(orchestrator, updates, session_resolver):
+            orchestrated = _orchestrate_batch(handle_batch, updates, outcomes, session_resolver)
+        else:
+            orchestrated = _orchestrate_serial(orchestrator, updates, outcomes, session_resolver)
+        try:
+            for chunk in orchestrated:
+                if not _hand_off(handoff, delivery, chunk):
+                    break
+        finally:
+            _hand_off(handoff, delivery, _PIPELINE_DONE)
+        delivery.result()
+
+    _flush_acks(adapter, pending_acks)
+
+    # Aggregate with C-level map/sum/chain rather than a Python-level loop.
+    sent_count = sum(map(_OUTCOME_SENT, outcomes))
+    acked_count = sum(map(_OUTCOME_ACKED, outcomes))
+    ack_skipped_count = sum(map(_OUTCOME_ACK_SKIPPED, outcomes))
+    errors: list[str] = list(chain.from_iterable(map(_OUTCOME_ERRORS, outcomes)))
+
+    reason = "processed" if not errors else "completed-with-errors"
+    return _result_dict(
+        "ok",
+        reason,
+        fetched_count=len(updates),
+        sent_count=sent_count,
+        acked_count=acked_count,
+        ack_skipped_count=ack_skipped_count,
+        errors=errors,
+    )
+
+
+def _result_dict(
+    status: str,
+    reason: str,
+    *,
+    fetched_count: int = 0,
+    sent_count: int = 0,
+    acked_count: int = 0,
+    ack_skipped_count: int = 0,
+    errors: list[str] | None = None,
+) -> dict[str, object]:
+    """Build the ``ProcessOnceResult`` mapping directly, without ``asdict``'s deep copy."""
+    error_list = errors if errors is not None else []
+    return {
+        "status": status,
+        "reason": reason,
+        "fetched_count": fetched_count,
+        "sent_count": sent_count,
+        "acked_count": acked_count,
+        "ack_skipped_count": ack_skipped_count,
+        "error_count": len(error_list),
+        "errors": error_list,
+    }
+
+
+@dataclass
+class _UpdateOutcome:
+    """Per-update slot filled by the orchestrate stage, then the delivery stage."""
 
-    sent_count = 0
-    acked_count = 0
-    ack_skipped_count = 0
-    errors: list[str] = []
+    update_id: str
+    outbound: OutboundMessage | None = None
+    sent: bool = False
+    acked: bool = False
+    ack_skipped: bool = False
+    errors: list[str] = field(default_factory=list)
+
+
+_OUTCOME_SENT = attrgetter("sent")
+_OUTCOME_ACKED = attrgetter("acked")
+_OUTCOME_ACK_SKIPPED = attrgetter("ack_skipped")
+_OUTCOME_ERRORS = attrgetter("errors")
 
+
+def _fans_out(
+    orchestrator: OrchestratorPort,
+    updates: list[InboundMessage],
+    session_resolver: Callable[[InboundMessage], str],
+) -> bool:
+    """Whether batching pays off: a batch only yields once fully orchestrated, losing the send overlap."""
+    if len(updates) < 2 or int(getattr(orchestrator, "batch_parallelism", 1) or 1) < 2:
+        return False
+    first: str | None = None
     for inbound in updates:
-        processed_ok = True
         try:
             session_id = session_resolver(inbound)
-            outbound = orchestrator.handle_message(inbound, session_id=session_id)
-            if outbound is None:
-                pass
-            elif isinstance(outbound, OutboundMessage):
-                adapter.send_message(outbound)
-                sent_count += 1
-            else:
-                raise ChannelRuntimeError(
-                    f"orchestrator returned unsupported output type: {type(outbound).__name__}"
-                )
+        except Exception:
+            continue
+        if first is None:
+            first = session_id
+        elif session_id != first:
+            return True
+    return False
+
+
+def _orchestrate_serial(
+    orchestrator: OrchestratorPort,
+    updates: list[InboundMessage],
+    outcomes: list[_UpdateOutcome],
+    session_resolver: Callable[[InboundMessage], str],
+) -> Iterator[list[_UpdateOutcome]]:
+    # Bound once: these lookups would otherwise repeat for every update.
+    handle = orchestrator.handle_message
+    resolve = session_resolver
+    accept = _accept_orchestrator_output
+    for inbound, outcome in zip(updates, outcomes):
+        try:
+            accept(outcome, handle(inbound, session_id=resolve(inbound)))
         except Exception as exc:
-            processed_ok = False
-            errors.append(f"update {inbound.update_id}: {_sanitize_exception(exc)}")
+            outcome.errors.append(f"update {inbound.update_id}: {sanitize_exception(exc)}")
+        yield [outcome]
 
-        should_ack = normalized_ack_policy == "always" or processed_ok
-        if not should_ack:
-            ack_skipped_count += 1
-            continue
 
+def _orchestrate_batch(
+    handle_batch: Callable[[list[tuple[InboundMessage, str]]], list[object]],
+    updates: list[InboundMessage],
+    outcomes: list[_UpdateOutcome],
+    session_resolver: Callable[[InboundMessage], str],
+) -> Iterator[list[_UpdateOutcome]]:
+    """Orchestrate the whole batch in one call so the orchestrator can fan out across sessions."""
+    batch: list[tuple[InboundMessage, str]] = []
+    batched: list[_UpdateOutcome] = []
+    for inbound, outcome in zip(updates, outcomes):
         try:
-            adapter.ack_update(inbound.update_id)
-            acked_count += 1
+            batch.append((inbound, session_resolver(inbound)))
+            batched.append(outcome)
         except Exception as exc:
-            errors.append(f"update {inbound.update_id}: ack failed: {_sanitize_exception(exc)}")
+            outcome.errors.append(f"update {inbound.update_id}: {sanitize_exception(exc)}")
 
-    reason = "processed" if not errors else "completed-with-errors"
-    return asdict(
-        ProcessOnceResult(
-            status="ok",
-            reason=reason,
-            fetched_count=len(updates),
-            sent_count=sent_count,
-            acked_count=acked_count,
-            ack_skipped_count=ack_skipped_count,
-            error_count=len(errors),
-            errors=errors,
-        )
-    )
+    try:
+        results = list(handle_batch(batch)) if batch else []
+        if len(results) != len(batch):
+            raise ChannelRuntimeError(
+                f"orchestrator returned {len(results)} results for a batch of {len(batch)}"
+            )
+    except Exception as exc:
+        results = [exc] * len(batch)
+
+    for outcome, result in zip(batched, results):
+        try:
+            if isinstance(result, Exception):
+                raise result
+            _accept_orchestrator_output(outcome, result)
+        except Exception as exc:
+            outcome.errors.append(f"update {outcome.update_id}: {sanitize_exception(exc)}")
+    yield outcomes
+
+
+def _accept_orchestrator_output(outcome: _UpdateOutcome, outbound: object) -> None:
+    if outbound is not None and not isinstance(outbound, OutboundMessage):
+        raise ChannelRuntimeError(f"orchestrator returned unsupported output type: {type(outbound).__name__}")
+    outcome.outbound = outbound
+
+
+def _resolve_send(adapter: ChannelAdapterPort) -> Callable[[OutboundMessage], None]:
+    try:
+        return adapter.send_message
+    except Exception:
+        # Defer the failing lookup into the per-send try so each update reports it.
+        return lambda outbound: adapter.send_message(outbound)
+
+
+def _resolve_send_batch(
+    adapter: ChannelAdapterPort,
+) -> Callable[[list[OutboundMessage]], list[Exception | None]] | None:
+    try:
+        send_batch = getattr(adapter, "send_messages", None)
+    except Exception:
+        return None
+    return send_batch if callable(send_batch) else None
+
+
+def _hand_off(handoff: queue.Queue, delivery: Future, item: object) -> bool:
+    """Queue ``item`` for delivery; False if the delivery worker has already exited."""
+    while not delivery.done():
+        try:
+            handoff.put(item, timeout=_HANDOFF_POLL_S)
+            return True
+        except queue.Full:
+            continue
+    return False
+
+
+def _deliver_stage(
+    send: Callable[[OutboundMessage], None],
+    send_batch: Callable[[list[OutboundMessage]], list[Exception | None]] | None,
+    handoff: queue.Queue,
+    ack_always: bool,
+    pending_acks: list[_UpdateOutcome],
+) -> None:
+    get = handoff.get
+    while True:
+        chunk = get()
+        if chunk is _PIPELINE_DONE:
+            return
+
+        sendable = [outcome for outcome in chunk if outcome.outbound is not None]
+        if send_batch is not None and len(sendable) > 1:
+            _send_bulk(send_batch, sendable)
+        else:
+            for outcome in sendable:
+                _send_one(send, outcome)
 
+        for outcome in chunk:
+            if ack_always or not outcome.errors:
+                pending_acks.append(outcome)
+            else:
+                outcome.ack_skipped = True
+
+
+def _send_one(send: Callable[[OutboundMessage], None], outcome: _UpdateOutcome) -> None:
+    try:
+        send(outcome.outbound)
+        outcome.sent = True
+    except Exception as exc:
+        outcome.errors.append(f"update {outcome.update_id}: {sanitize_exception(exc)}")
+
+
+def _send_bulk(
+    send_batch: Callable[[list[OutboundMessage]], list[Exception | None]],
+    sendable: list[_UpdateOutcome],
+) -> None:
+    """Send a chunk in one adapter call; failures of the call itself fail every message."""
+    # Delivery state is unknown after a raise or a short result list; report every
+    # message rather than re-send and risk duplicate replies.
+    try:
+        results = list(send_batch([outcome.outbound for outcome in sendable]))
+    except Exception as exc:
+        error = sanitize_exception(exc)
+        for outcome in sendable:
+            outcome.errors.append(f"update {outcome.update_id}: {error}")
+        return
 
-def _sanitize_exception(exc: Exception) -> str:
-    raw = f"{type(exc).__name__}: {exc}".strip()
-    compact = " ".join(raw.split())
-    return compact[:500]
+    if len(results) != len(sendable):
+        message = f"adapter returned {len(results)} send results for a batch of {len(sendable)}"
+        for outcome in sendable:
+            outcome.errors.append(f"update {outcome.update_id}: ChannelRuntimeError: {message}")
+        return
+
+    for outcome, result in zip(sendable, results):
+        if isinstance(result, Exception):
+            outcome.errors.append(f"update {outcome.update_id}: {sanitize_exception(result)}")
+        else:
+            outcome.sent = True
+
+
+def _flush_acks(adapter: ChannelAdapterPort, pending: list[_UpdateOutcome]) -> None:
+    """Ack the cycle in one batch; a failed batch fails every pending ack."""
+    if not pending:
+        return
+
+    ack_updates = getattr(adapter, "ack_updates", None)
+    if callable(ack_updates):
+        # The adapter may have committed part of the batch before raising; re-acking
+        # per update would re-apply those ids and mask the failure.
+        try:
+            ack_updates([outcome.update_id for outcome in pending])
+        except Exception as exc:
+            error = sanitize_exception(exc)
+            for outcome in pending:
+                outcome.errors.append(f"update {outcome.update_id}: ack failed: {error}")
+        else:
+            for outcome in pending:
+                outcome.acked = True
+        return
+
+    for outcome in pending:
+        try:
+            adapter.ack_update(outcome.update_id)
+            outcome.acked = True
+        except Exception as exc:
+            outcome.errors.append(f"update {outcome.update_id}: ack failed: {sanitize_exception(exc)}")
 
 
 def _normalize_ack_policy(raw_policy: str) -> str:
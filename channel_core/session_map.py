@@ -1,11 +1,17 @@
 from __future__ import annotations
 
+from functools import lru_cache
+
 from .contracts import ContractValidationError, InboundMessage
 
 
+@lru_cache(maxsize=4096, typed=True)
 def telegram_session_id(chat_id: str | int) -> str:
-    """Default stable session mapping for Telegram-style chat IDs."""
-    value = str(chat_id).strip()
+    """Default stable session mapping for Telegram-style chat IDs.
+
+    Memoized per distinct chat id; use ``telegram_session_id.cache_clear()`` to reset.
+    """
+    value = chat_id.strip() if isinstance(chat_id, str) else str(chat_id).strip()
     if not value:
         raise ContractValidationError("chat_id must be a non-empty string")
     return f"telegram:{value}"
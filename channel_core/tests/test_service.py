@@ -1,15 +1,19 @@
 from __future__ import annotations
 
+import copy
+import pickle
 import sys
+import threading
 import unittest
-from dataclasses import dataclass, field
+from dataclasses import dataclass, field, fields
 from pathlib import Path
 from typing import Any
 
 sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
 
-from channel_core.contracts import ContractValidationError, InboundMessage, OutboundMessage
-from channel_core.service import process_once
+from channel_core.contracts import ContractValidationError, InboundMessage, OutboundMessage, sanitize_exception
+from channel_core.service import ProcessOnceResult, process_once
+from channel_core.session_map import telegram_session_id
 
 
 @dataclass
@@ -20,11 +24,12 @@ class _AdapterStub:
     ack_exc_ids: set[str] = field(default_factory=set)
     sent: list[OutboundMessage] = field(default_factory=list)
     acked: list[str] = field(default_factory=list)
+    ack_batches: list[list[str]] = field(default_factory=list)
 
     def fetch_updates(self) -> list[InboundMessage]:
         if self.fetch_exc is not None:
             raise self.fetch_exc
-        return list(self.updates)
+        return self.updates
 
     def send_message(self, outbound: OutboundMessage) -> None:
         if self.send_exc is not None:
@@ -36,6 +41,12 @@ class _AdapterStub:
             raise RuntimeError("ack failed")
         self.acked.append(update_id)
 
+    def ack_updates(self, update_ids: list[str]) -> None:
+        self.ack_batches.append(list(update_ids))
+        if self.ack_exc_ids.intersection(update_ids):
+            raise RuntimeError("batch ack failed")
+        self.acked.extend(update_ids)
+
 
 @dataclass
 class _OrchestratorStub:
@@ -65,6 +76,76 @@ class TestContractsAndService(unittest.TestCase):
         with self.assertRaisesRegex(ContractValidationError, "text must be a non-empty string"):
             OutboundMessage(chat_id="1", text=" ")
 
+        with self.assertRaisesRegex(ContractValidationError, "user_id must be a non-empty string"):
+            InboundMessage(update_id="1", chat_id="1", user_id="\t\n", text="x")
+
+        self.assertEqual(OutboundMessage(chat_id=1001, text="x").chat_id, 1001)  # type: ignore[arg-type]
+
+    def test_sanitize_exception_collapses_whitespace_and_truncates(self) -> None:
+        samples = [
+            "plain message",
+            "",
+            "two  spaces",
+            "line\nbreak\ttab",
+            "trailing space ",
+            "nbsp\u00a0inside",
+            "x" * 600,
+        ]
+        for text in samples:
+            raw = f"RuntimeError: {text}".strip()
+            expected = " ".join(raw.split())[:500]
+            self.assertEqual(sanitize_exception(RuntimeError(text)), expected, text)
+
+    def test_telegram_session_id_is_memoized_per_chat(self) -> None:
+        telegram_session_id.cache_clear()
+
+        self.assertEqual(telegram_session_id(" 1001 "), "telegram:1001")
+        self.assertIs(telegram_session_id(" 1001 "), telegram_session_id(" 1001 "))
+        self.assertEqual(telegram_session_id(1001), "telegram:1001")
+        self.assertEqual(telegram_session_id(1001.0), "telegram:1001.0")
+        with self.assertRaisesRegex(ContractValidationError, "chat_id must be a non-empty string"):
+            telegram_session_id("  ")
+        self.assertEqual(telegram_session_id.cache_info().currsize, 3)
+
+    def test_contracts_are_frozen_slotted_values(self) -> None:
+        inbound = _inbound("1")
+        outbound = OutboundMessage(chat_id="1", text="x")
+
+        self.assertFalse(hasattr(inbound, "__dict__"))
+        self.assertFalse(hasattr(outbound, "__dict__"))
+        with self.assertRaises(AttributeError):
+            inbound.text = "changed"  # type: ignore[misc]
+        self.assertEqual(inbound, _inbound("1"))
+        self.assertNotEqual(inbound, _inbound("2"))
+        self.assertEqual(outbound.metadata, {})
+        self.assertIsNot(outbound.metadata, OutboundMessage(chat_id="1", text="x").metadata)
+
+    def test_contracts_support_copy_and_pickle(self) -> None:
+        inbound = InboundMessage(
+            update_id="1", chat_id="42", user_id="u", text="hi", message_id="m", timestamp_s=5, metadata={"k": 1}
+        )
+        outbound = OutboundMessage(chat_id="42", text="x", reply_to_message_id="m", metadata={"k": 1})
+
+        for original in (inbound, outbound):
+            with self.subTest(type=type(original).__name__):
+                self.assertEqual(copy.copy(original), original)
+                self.assertEqual(copy.deepcopy(original), original)
+                restored = pickle.loads(pickle.dumps(original))
+                self.assertEqual(restored, original)
+                self.assertIs(type(restored), type(original))
+        self.assertEqual(pickle.loads(pickle.dumps(outbound)).metadata, {"k": 1})
+
+    def test_contract_ids_are_interned(self) -> None:
+        chat_id = "".join(["-100", "42"])
+        user_id = "".join(["u", "7"])
+        inbound = InboundMessage(update_id="1", chat_id=chat_id, user_id=user_id, text="x")
+        outbound = OutboundMessage(chat_id="".join(["-100", "42"]), text="y")
+
+        self.assertIs(inbound.chat_id, sys.intern("-10042"))
+        self.assertIs(inbound.user_id, sys.intern("u7"))
+        self.assertIs(outbound.chat_id, inbound.chat_id)
+        self.assertEqual(InboundMessage(update_id="2", chat_id=42, user_id=7, text="x").chat_id, 42)
+
     def test_process_once_empty_batch(self) -> None:
         adapter = _AdapterStub(updates=[])
         orchestrator = _OrchestratorStub(responses={})
@@ -78,6 +159,19 @@ class TestContractsAndService(unittest.TestCase):
         self.assertEqual(result["acked_count"], 0)
         self.assertEqual(result["ack_skipped_count"], 0)
         self.assertEqual(result["error_count"], 0)
+        self.assertEqual(list(result), [item.name for item in fields(ProcessOnceResult)])
+
+    def test_process_once_returns_fresh_result_dicts(self) -> None:
+        adapter = _AdapterStub(updates=[])
+        orchestrator = _OrchestratorStub(responses={})
+
+        first = process_once(adapter, orchestrator)
+        second = process_once(adapter, orchestrator)
+
+        # Callers such as channel_runtime.run_cycle mutate the result without copying it.
+        self.assertIs(type(first), dict)
+        self.assertIsNot(first, second)
+        self.assertIsNot(first["errors"], second["errors"])
 
     def test_process_once_one_inbound_one_outbound(self) -> None:
         inbound = _inbound("1", chat_id="1001")
@@ -97,6 +191,14 @@ class TestContractsAndService(unittest.TestCase):
         self.assertEqual(adapter.acked, ["1"])
         self.assertEqual(orchestrator.sessions, ["telegram:1001"])
 
+    def test_process_once_does_not_mutate_fetched_batch(self) -> None:
+        adapter = _AdapterStub(updates=[_inbound("1"), _inbound("2")])
+        snapshot = list(adapter.updates)
+
+        process_once(adapter, _OrchestratorStub(responses={"1": OutboundMessage(chat_id="c1", text="x")}))
+
+        self.assertEqual(adapter.updates, snapshot)
+
     def test_process_once_fetch_exception_returns_failed(self) -> None:
         adapter = _AdapterStub(fetch_exc=RuntimeError("network down"))
         orchestrator = _OrchestratorStub(responses={})
@@ -169,6 +271,170 @@ class TestContractsAndService(unittest.TestCase):
         self.assertEqual(result["ack_skipped_count"], 0)
         self.assertEqual(adapter.acked, ["1"])
 
+    def test_process_once_overlaps_delivery_with_next_orchestration(self) -> None:
+        first_sent = threading.Event()
+
+        class _SignallingAdapter(_AdapterStub):
+            def send_message(self, outbound: OutboundMessage) -> None:
+                super().send_message(outbound)
+                first_sent.set()
+
+        class _WaitingOrchestrator(_OrchestratorStub):
+            def handle_message(self, inbound: InboundMessage, *, session_id: str):
+                if inbound.update_id == "2":
+                    # Only completes if update 1 is delivered while update 2 is orchestrated.
+                    self.sessions.append(f"overlap={first_sent.wait(timeout=2.0)}")
+                return super().handle_message(inbound, session_id=session_id)
+
+        updates = [_inbound("1", chat_id="7"), _inbound("2", chat_id="7"), _inbound("3", chat_id="7")]
+        adapter = _SignallingAdapter(updates=updates, ack_exc_ids={"2"})
+        orchestrator = _WaitingOrchestrator(
+            responses={uid: OutboundMessage(chat_id="7", text=f"r{uid}") for uid in ("1", "2", "3")}
+        )
+
+        result = process_once(adapter, orchestrator)
+
+        self.assertIn("overlap=True", orchestrator.sessions)
+        self.assertEqual([item.text for item in adapter.sent], ["r1", "r2", "r3"])
+        self.assertEqual(adapter.acked, [])
+        self.assertEqual(adapter.ack_batches, [["1", "2", "3"]])
+        self.assertEqual(result["sent_count"], 3)
+        self.assertEqual(result["acked_count"], 0)
+        self.assertEqual(
+            result["errors"],
+            [f"update {uid}: ack failed: RuntimeError: batch ack failed" for uid in ("1", "2", "3")],
+        )
+
+    def test_process_once_reports_missing_send_message_per_update(self) -> None:
+        class _NoSendAdapter:
+            def __init__(self, updates: list[InboundMessage]) -> None:
+                self.updates = updates
+                self.acked: list[str] = []
+
+            def fetch_updates(self) -> list[InboundMessage]:
+                return self.updates
+
+            def ack_update(self, update_id: str) -> None:
+                self.acked.append(update_id)
+
+        # More updates than the delivery queue holds: a dead worker would block the handoff.
+        update_ids = [str(index) for index in range(1, 13)]
+        adapter = _NoSendAdapter([_inbound(uid) for uid in update_ids])
+        orchestrator = _OrchestratorStub(
+            responses={uid: OutboundMessage(chat_id="42", text=f"r{uid}") for uid in update_ids}
+        )
+
+        result = process_once(adapter, orchestrator)
+
+        self.assertEqual(result["reason"], "completed-with-errors")
+        self.assertEqual(result["sent_count"], 0)
+        self.assertEqual(result["error_count"], 12)
+        for uid, error in zip(update_ids, result["errors"]):
+            self.assertTrue(error.startswith(f"update {uid}: AttributeError:"), error)
+        self.assertEqual(adapter.acked, update_ids)
+
+    def test_process_once_flushes_acks_in_one_batch(self) -> None:
+        updates = [_inbound("1"), _inbound("2"), _inbound("3")]
+        adapter = _AdapterStub(updates=updates)
+        orchestrator = _OrchestratorStub(responses={"2": OutboundMessage(chat_id="42", text="r2")})
+
+        result = process_once(adapter, orchestrator)
+
+        self.assertEqual(adapter.ack_batches, [["1", "2", "3"]])
+        self.assertEqual(adapter.acked, ["1", "2", "3"])
+        self.assertEqual(result["acked_count"], 3)
+        self.assertEqual(result["error_count"], 0)
+
+    def test_process_once_routes_batches_to_handle_messages(self) -> None:
+        class _BatchOrchestrator(_OrchestratorStub):
+            batch_parallelism = 2
+
+            def handle_messages(self, batch):
+                self.sessions.append(f"batch={len(batch)}")
+                return [
+                    RuntimeError("boom") if inbound.update_id == "2" else self.responses.get(inbound.update_id)
+                    for inbound, _ in batch
+                ]
+
+        updates = [_inbound("1", chat_id="41"), _inbound("2"), _inbound("3")]
+        adapter = _AdapterStub(updates=updates)
+        orchestrator = _BatchOrchestrator(responses={"3": OutboundMessage(chat_id="42", text="r3")})
+
+        result = process_once(adapter, orchestrator, ack_policy="on-success")
+
+        self.assertEqual(orchestrator.sessions, ["batch=3"])
+        self.assertEqual([item.text for item in adapter.sent], ["r3"])
+        self.assertEqual(adapter.acked, ["1", "3"])
+        self.assertEqual(result["ack_skipped_count"], 1)
+        self.assertEqual(result["errors"], ["update 2: RuntimeError: boom"])
+
+    def test_process_once_keeps_serial_pipeline_unless_orchestrator_fans_out(self) -> None:
+        class _BatchOrchestrator(_OrchestratorStub):
+            batch_parallelism = 1
+
+            def handle_messages(self, batch):
+                self.sessions.append("batch")
+                return [self.responses.get(inbound.update_id) for inbound, _ in batch]
+
+        cases = (
+            (1, [_inbound("1", chat_id="41"), _inbound("2")]),
+            (4, [_inbound("1"), _inbound("2")]),
+        )
+        for parallelism, updates in cases:
+            with self.subTest(parallelism=parallelism):
+                orchestrator = _BatchOrchestrator(responses={})
+                orchestrator.batch_parallelism = parallelism
+
+                process_once(_AdapterStub(updates=updates), orchestrator)
+
+                self.assertNotIn("batch", orchestrator.sessions)
+                self.assertEqual(len(orchestrator.sessions), 2)
+
+    def test_process_once_sends_orchestrated_batches_in_one_bulk_call(self) -> None:
+        class _BatchOrchestrator(_OrchestratorStub):
+            batch_parallelism = 2
+
+            def handle_messages(self, batch):
+                return [self.responses.get(inbound.update_id) for inbound, _ in batch]
+
+        @dataclass
+        class _BulkAdapter(_AdapterStub):
+            bulk_fails: bool = False
+            bulk_batches: list[list[str]] = field(default_factory=list)
+
+            def send_messages(self, outbounds):
+                self.bulk_batches.append([outbound.text for outbound in outbounds])
+                if self.bulk_fails:
+                    raise RuntimeError("bulk endpoint down")
+                results = [RuntimeError("rejected") if outbound.text == "r2" else None for outbound in outbounds]
+                self.sent.extend(o for o, r in zip(outbounds, results) if r is None)
+                return results
+
+        responses = {key: OutboundMessage(chat_id="42", text=f"r{key}") for key in ("1", "2", "3")}
+        updates = [_inbound("1", chat_id="41"), _inbound("2"), _inbound("3")]
+
+        adapter = _BulkAdapter(updates=updates)
+        result = process_once(adapter, _BatchOrchestrator(responses=responses), ack_policy="on-success")
+
+        self.assertEqual(adapter.bulk_batches, [["r1", "r2", "r3"]])
+        self.assertEqual([item.text for item in adapter.sent], ["r1", "r3"])
+        self.assertEqual(result["sent_count"], 2)
+        self.assertEqual(adapter.acked, ["1", "3"])
+        self.assertEqual(result["errors"], ["update 2: RuntimeError: rejected"])
+
+        failing = _BulkAdapter(updates=updates)
+        failing.bulk_fails = True
+        result = process_once(failing, _BatchOrchestrator(responses=responses))
+
+        # A raising bulk call may have delivered part of the batch: no per-message re-send.
+        self.assertEqual(failing.bulk_batches, [["r1", "r2", "r3"]])
+        self.assertEqual(failing.sent, [])
+        self.assertEqual(result["sent_count"], 0)
+        self.assertEqual(
+            result["errors"],
+            [f"update {key}: RuntimeError: bulk endpoint down" for key in ("1", "2", "3")],
+        )
+
     def test_process_once_invalid_ack_policy_rejected(self) -> None:
         adapter = _AdapterStub(updates=[_inbound("1")])
         orchestrator = _OrchestratorStub(responses={"1": None})
@@ -2,36 +2,59 @@ from __future__ import annotations
 
 import json
 import sys
-from typing import Sequence
+from functools import partial
+from typing import Any, Callable, Mapping, Sequence, TextIO
 
 from channel_core.contracts import ConfigValidationError
 
 from .config import parse_runtime_config
 from .runner import run_loop
 
+_PAYLOAD_ENCODE = json.JSONEncoder(sort_keys=True).encode
+# Fields kept in the per-cycle continuous-mode summary line (full payloads need --verbose).
+_SUMMARY_KEYS = ("status", "reason", "fetched_count", "sent_count", "error_count", "dropped_count")
 
-def main(argv: Sequence[str] | None = None) -> int:
+
+def main(
+    argv: Sequence[str] | None = None,
+    *,
+    run_loop_fn: Callable[..., dict[str, Any]] | None = None,
+    stdout: TextIO | None = None,
+) -> int:
     args = list(sys.argv[1:] if argv is None else argv)
+    # Both are resolved per call so patched/redirected module state still applies when not injected.
+    loop = run_loop if run_loop_fn is None else run_loop_fn
+    stream = sys.stdout if stdout is None else stdout
     try:
         config = parse_runtime_config(args)
     except ConfigValidationError as exc:
-        _emit_payload({"status": "failed", "reason": "invalid-config", "error": str(exc)})
+        _emit_payload({"status": "failed", "reason": "invalid-config", "error": str(exc)}, stream=stream)
         return 2
 
     try:
         if config.once:
-            result = run_loop(config=config)
-            _emit_payload(result)
+            result = loop(config=config)
+            _emit_payload(result, stream=stream)
             return _exit_code_for_result(result)
 
-        run_loop(config=config, on_cycle=_emit_payload)
+        emit = _emit_payload if config.verbose else _emit_summary
+        loop(config=config, on_cycle=partial(emit, stream=stream))
         return 0
     except KeyboardInterrupt:
         return 130
+    finally:
+        stream.flush()
+
+
+def _emit_payload(payload: Mapping[str, object], *, stream: TextIO) -> None:
+    # One write per line.
+    encoded = _PAYLOAD_ENCODE(payload if isinstance(payload, dict) else dict(payload))
+    stream.write(encoded + "\n")
 
 
-def _emit_payload(payload: dict[str, object]) -> None:
-    print(json.dumps(dict(payload), sort_keys=True))
+def _emit_summary(payload: Mapping[str, object], *, stream: TextIO) -> None:
+    # Encodes a handful of scalars rather than walking telemetry/error details every cycle.
+    stream.write(_PAYLOAD_ENCODE({key: payload[key] for key in _SUMMARY_KEYS if key in payload}) + "\n")
 
 
 def _exit_code_for_result(result: dict[str, object]) -> int:
@@ -2,12 +2,16 @@ from __future__ import annotations
 
 import json
 import subprocess
+import threading
 import time
-from dataclasses import dataclass
+from collections import OrderedDict, deque
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Any, Callable
+from types import MappingProxyType
+from typing import Any, Callable, Mapping, NamedTuple, Sequence
 
-from channel_core.contracts import ContractValidationError, InboundMessage, OutboundMessage
+from channel_core.contracts import ContractValidationError, InboundMessage, OutboundMessage, sanitize_exception
 from channel_runtime.config import DURABLE_CONTEXT_MODE, LEGACY_CONTEXT_EMERGENCY_TOGGLE, LEGACY_CONTEXT_MODE
 from channel_runtime.context.assembler import ContextAssembler
 from channel_runtime.context.compaction import CompactionPolicy, CompactionService
@@ -17,6 +21,11 @@ from channel_runtime.context.store import ContextStore
 from channel_runtime.context.token_estimator import TokenEstimator
 
 ConversationTurn = dict[str, str | None]
+# (code, update_id, session_id, retryable, message, extra keys or None)
+DiagnosticRecord = tuple[str, str, str, bool, str, dict[str, Any] | None]
+# Undrained diagnostics kept per orchestrator; shared by every orchestrator in the
+# runtime so one bound governs the whole diagnostics stream.
+MAX_PENDING_DIAGNOSTICS = 1024
 _OVERFLOW_ERROR_SIGNATURES = (
     "context length exceeded",
     "maximum context length",
@@ -25,12 +34,20 @@ _OVERFLOW_ERROR_SIGNATURES = (
     "prompt is too long",
     "too many tokens",
 )
+# Resolved once at import; the codex working directory never changes per call.
+_CODEX_CWD = str(Path(__file__).resolve().parents[2])
+_CODEX_JSON_ENCODE = json.JSONEncoder(sort_keys=True, separators=(",", ":"), ensure_ascii=False).encode
+# The payload schema is fixed, so its keys are laid out once in sorted order
+# and only the values are JSON-encoded per call.
+_CODEX_PAYLOAD_TEMPLATE = (
+    '{{"chat_id":{},"conversation_history":{},"message_id":{},'
+    '"session_id":{},"text":{},"update_id":{},"user_id":{}}}'
+)
 _OPERATOR_INSPECT_COMMANDS = frozenset({"/ctx inspect", "/context inspect"})
 _OPERATOR_COMPACT_COMMANDS = frozenset({"/ctx compact", "/context compact"})
 
 
-@dataclass(frozen=True)
-class CodexInvocationRequest:
+class CodexInvocationRequest(NamedTuple):
     """Serializable payload for default Codex CLI invocation."""
 
     session_id: str
@@ -50,13 +67,13 @@ class CodexInvocationRequest:
         conversation_history: tuple[ConversationTurn, ...] = (),
     ) -> "CodexInvocationRequest":
         return cls(
-            session_id=session_id,
-            chat_id=inbound.chat_id,
-            user_id=inbound.user_id,
-            text=inbound.text,
-            update_id=inbound.update_id,
-            message_id=inbound.message_id,
-            conversation_history=conversation_history,
+            session_id,
+            inbound.chat_id,
+            inbound.user_id,
+            inbound.text,
+            inbound.update_id,
+            inbound.message_id,
+            conversation_history,
         )
 
 
@@ -77,7 +94,7 @@ class CodexSessionPolicy:
             raise ValueError("max_history_turns must be >= 1")
 
 
-@dataclass
+@dataclass(slots=True)
 class _CodexSessionRuntime:
     session_id: str
     created_at_s: float
@@ -86,11 +103,28 @@ class _CodexSessionRuntime:
     timeout_count: int = 0
     failure_count: int = 0
     conversation_history: list[ConversationTurn] | None = None
+    # Read-only describe() snapshot; every mutation goes through
+    # CodexSessionManager._touch, which drops it.
+    view: Mapping[str, Any] | None = field(default=None, repr=False, compare=False)
 
     def __post_init__(self) -> None:
         if self.conversation_history is None:
             self.conversation_history = []
 
+    def as_view(self) -> Mapping[str, Any]:
+        if self.view is None:
+            self.view = MappingProxyType(
+                {
+                    "session_id": self.session_id,
+                    "created_at_s": self.created_at_s,
+                    "last_activity_s": self.last_activity_s,
+                    "invoke_count": self.invoke_count,
+                    "timeout_count": self.timeout_count,
+                    "failure_count": self.failure_count,
+                }
+            )
+        return self.view
+
 
 @dataclass
 class _ContextTelemetryState:
@@ -166,55 +200,77 @@ class CodexSessionManager:
     ) -> None:
         self._policy = policy or CodexSessionPolicy()
         self._clock = clock or time.monotonic
-        self._sessions: dict[str, _CodexSessionRuntime] = {}
+        self._batch_depth = 0
+        self._batch_now: float | None = None
+        # Kept in least-recently-active order: every activity touch moves the
+        # session to the end, so capacity eviction pops from the front.
+        self._sessions: OrderedDict[str, _CodexSessionRuntime] = OrderedDict()
+        # Sessions with a codex call in flight (id -> call count); eviction skips them.
+        self._in_flight: dict[str, int] = {}
+
+    def mark_in_flight(self, session_id: str) -> None:
+        self._in_flight[session_id] = self._in_flight.get(session_id, 0) + 1
+
+    def clear_in_flight(self, session_id: str) -> None:
+        remaining = self._in_flight.get(session_id, 0) - 1
+        if remaining > 0:
+            self._in_flight[session_id] = remaining
+        else:
+            self._in_flight.pop(session_id, None)
+
+    def begin_batch(self) -> None:
+        """Start a batch: bookkeeping reuses one clock reading until ``end_batch`` or ``refresh_clock``."""
+        self._batch_depth += 1
+
+    def end_batch(self) -> None:
+        self._batch_depth = max(0, self._batch_depth - 1)
+        if not self._batch_depth:
+            self._batch_now = None
+
+    def refresh_clock(self) -> None:
+        """Drop the batch's cached reading, e.g. after a slow codex call; the next touch re-reads the clock."""
+        self._batch_now = None
 
     def begin(self, session_id: str) -> None:
-        now = float(self._clock())
+        now = self._now()
         self._evict_idle(now)
         runtime = self._sessions.get(session_id)
         if runtime is None:
             runtime = _CodexSessionRuntime(session_id=session_id, created_at_s=now, last_activity_s=now)
             self._sessions[session_id] = runtime
         else:
-            runtime.last_activity_s = now
+            self._touch(runtime, now)
         self._evict_over_capacity(prefer_keep_session_id=session_id)
 
     def record_success(self, session_id: str) -> None:
         runtime = self._require_session(session_id)
         runtime.invoke_count += 1
-        runtime.last_activity_s = float(self._clock())
+        self._touch(runtime, self._now())
 
     def record_timeout(self, session_id: str) -> None:
         runtime = self._require_session(session_id)
         runtime.timeout_count += 1
         runtime.failure_count += 1
-        runtime.last_activity_s = float(self._clock())
+        self._touch(runtime, self._now())
 
     def record_failure(self, session_id: str) -> None:
         runtime = self._require_session(session_id)
         runtime.failure_count += 1
-        runtime.last_activity_s = float(self._clock())
+        self._touch(runtime, self._now())
 
     def cleanup(self) -> tuple[str, ...]:
-        before = set(self._sessions.keys())
-        self._evict_idle(float(self._clock()))
-        return tuple(sorted(before - set(self._sessions.keys())))
+        return tuple(self._evict_idle(self._now()))
 
-    def describe(self, session_id: str) -> dict[str, Any] | None:
+    def describe(self, session_id: str) -> Mapping[str, Any] | None:
+        """Return a read-only snapshot, reused until the session next changes."""
         runtime = self._sessions.get(session_id)
         if runtime is None:
             return None
-        return {
-            "session_id": runtime.session_id,
-            "created_at_s": runtime.created_at_s,
-            "last_activity_s": runtime.last_activity_s,
-            "invoke_count": runtime.invoke_count,
-            "timeout_count": runtime.timeout_count,
-            "failure_count": runtime.failure_count,
-        }
+        return runtime.as_view()
 
     def list_session_ids(self) -> tuple[str, ...]:
-        return tuple(sorted(self._sessions.keys()))
+        """Return live session ids, least recently active first (not sorted)."""
+        return tuple(self._sessions)
 
     @property
     def max_history_turns(self) -> int:
@@ -243,41 +299,63 @@ class CodexSessionManager:
         if len(history) > max_turns:
             del history[: len(history) - max_turns]
         runtime.conversation_history = history
-        runtime.last_activity_s = float(self._clock())
+        self._touch(runtime, self._now())
+
+    def _now(self) -> float:
+        if not self._batch_depth:
+            return self._clock()
+        if self._batch_now is None:
+            self._batch_now = self._clock()
+        return self._batch_now
+
+    def _touch(self, runtime: _CodexSessionRuntime, now: float) -> None:
+        runtime.last_activity_s = now
+        runtime.view = None
+        self._sessions.move_to_end(runtime.session_id)
 
     def _require_session(self, session_id: str) -> _CodexSessionRuntime:
         runtime = self._sessions.get(session_id)
         if runtime is not None:
             return runtime
-        now = float(self._clock())
+        now = self._now()
         created = _CodexSessionRuntime(session_id=session_id, created_at_s=now, last_activity_s=now)
         self._sessions[session_id] = created
         self._evict_over_capacity(prefer_keep_session_id=session_id)
         return created
 
-    def _evict_idle(self, now: float) -> None:
-        stale_ids = [
-            session_id
-            for session_id, runtime in self._sessions.items()
-            if (now - runtime.last_activity_s) >= self._policy.idle_ttl_s
-        ]
-        for session_id in sorted(stale_ids):
-            self._sessions.pop(session_id, None)
+    def _evict_idle(self, now: float) -> list[str]:
+        # Sessions are ordered by last activity, so the stale ones form a prefix:
+        # stop at the first fresh session instead of scanning them all.
+        sessions = self._sessions
+        idle_ttl_s = self._policy.idle_ttl_s
+        in_flight = self._in_flight
+        stale_ids: list[str] = []
+        for session_id, runtime in sessions.items():
+            if (now - runtime.last_activity_s) < idle_ttl_s:
+                break
+            if session_id not in in_flight:
+                stale_ids.append(session_id)
+        for session_id in stale_ids:
+            del sessions[session_id]
+        return stale_ids
 
     def _evict_over_capacity(self, *, prefer_keep_session_id: str | None = None) -> None:
-        while len(self._sessions) > self._policy.max_sessions:
-            candidates = [
-                runtime
-                for runtime in self._sessions.values()
-                if runtime.session_id != prefer_keep_session_id
-            ]
-            if not candidates:
-                candidates = list(self._sessions.values())
-            victim = min(
-                candidates,
-                key=lambda runtime: (runtime.last_activity_s, runtime.created_at_s, runtime.session_id),
+        sessions = self._sessions
+        in_flight = self._in_flight
+        while len(sessions) > self._policy.max_sessions:
+            # Oldest first; in-flight sessions are never evicted, so capacity may be
+            # exceeded until their calls finish.
+            victim = next(
+                (
+                    session_id
+                    for session_id in sessions
+                    if session_id != prefer_keep_session_id and session_id not in in_flight
+                ),
+                None,
             )
-            self._sessions.pop(victim.session_id, None)
+            if victim is None:
+                return
+            del sessions[victim]
 
 
 class CodexOrchestrator:
@@ -296,8 +374,15 @@ class CodexOrchestrator:
         compaction_service: CompactionService | None = None,
         compaction_policy: CompactionPolicy | None = None,
         enable_context_operator_controls: bool = False,
+        max_parallel_sessions: int = 1,
     ) -> None:
         self._timeout_s = float(timeout_s)
+        # Opt-in: workspace-write codex runs share one working directory, so
+        # parallel sessions can touch the same files.
+        self._max_parallel_sessions = max(1, int(max_parallel_sessions))
+        # Guards session, context and diagnostics state; released only while
+        # a codex invocation is in flight so other sessions can make progress.
+        self._state_lock = threading.Lock()
         self._notify_on_error = bool(notify_on_error)
         self._invoke_fn = invoke_fn or (lambda req: _default_codex_invoke(req, timeout_s=self._timeout_s))
         self._session_manager = session_manager or CodexSessionManager()
@@ -329,10 +414,55 @@ class CodexOrchestrator:
             )
         self._token_estimator = TokenEstimator()
         self._context_telemetry = _ContextTelemetryState(mode=self._context_mode)
-        self._diagnostics: list[dict[str, Any]] = []
+        # Flat records, expanded to dicts on drain; bounded so a failure burst
+        # between drains cannot grow without limit.
+        self._diagnostics: deque[DiagnosticRecord] = deque(maxlen=MAX_PENDING_DIAGNOSTICS)
         self._enable_context_operator_controls = bool(enable_context_operator_controls)
 
+    @property
+    def batch_parallelism(self) -> int:
+        return self._max_parallel_sessions
+
     def handle_message(self, inbound: InboundMessage, *, session_id: str) -> OutboundMessage | None:
+        with self._state_lock:
+            return self._handle_message_locked(inbound, session_id=session_id)
+
+    def handle_messages(
+        self,
+        batch: Sequence[tuple[InboundMessage, str]],
+    ) -> list[OutboundMessage | None | Exception]:
+        """Handle a batch concurrently across sessions, in order within each session.
+
+        Results line up with ``batch``; an exception escaping ``handle_message``
+        is returned in its slot rather than raised.
+        """
+        results: list[OutboundMessage | None | Exception] = [None] * len(batch)
+        session_groups: dict[str, list[int]] = {}
+        for index, (_, session_id) in enumerate(batch):
+            session_groups.setdefault(session_id, []).append(index)
+
+        def _run_session(indexes: list[int]) -> None:
+            for index in indexes:
+                inbound, session_id = batch[index]
+                try:
+                    results[index] = self.handle_message(inbound, session_id=session_id)
+                except Exception as exc:
+                    results[index] = exc
+
+        workers = min(len(session_groups), self._max_parallel_sessions)
+        self._session_manager.begin_batch()
+        try:
+            if workers <= 1:
+                for indexes in session_groups.values():
+                    _run_session(indexes)
+            else:
+                with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="codex-session") as executor:
+                    list(executor.map(_run_session, session_groups.values()))
+        finally:
+            self._session_manager.end_batch()
+        return results
+
+    def _handle_message_locked(self, inbound: InboundMessage, *, session_id: str) -> OutboundMessage | None:
         if self._enable_context_operator_controls:
             operator_response = self._handle_operator_context_command(inbound=inbound, session_id=session_id)
             if operator_response is not None:
@@ -392,36 +522,58 @@ class CodexOrchestrator:
                 self._session_manager.record_failure(session_id)
             diagnostic_code = code
             diagnostic_retryable = retryable
-            diagnostic: dict[str, Any] = {
-                "code": diagnostic_code,
-                "update_id": inbound.update_id,
-                "session_id": session_id,
-                "retryable": diagnostic_retryable,
-                "message": _sanitize_exception(exc),
-            }
+            extras: dict[str, Any] = {}
             context_diagnostic = _classify_context_diagnostic(exc)
             if context_diagnostic is not None:
                 diagnostic_code = context_diagnostic["code"]
                 diagnostic_retryable = context_diagnostic["retryable"]
-                diagnostic["code"] = diagnostic_code
-                diagnostic["retryable"] = diagnostic_retryable
-                diagnostic["layer"] = "context"
-                diagnostic["operation"] = context_diagnostic["operation"]
+                extras["layer"] = "context"
+                extras["operation"] = context_diagnostic["operation"]
             overflow_recovery = getattr(exc, "_overflow_recovery", None)
             if isinstance(overflow_recovery, dict):
-                diagnostic["overflow_recovery"] = dict(overflow_recovery)
-                diagnostic["layer"] = "context"
-                diagnostic["operation"] = "compact"
-            self._diagnostics.append(diagnostic)
+                extras["overflow_recovery"] = dict(overflow_recovery)
+                extras["layer"] = "context"
+                extras["operation"] = "compact"
+            self._record_diagnostic(
+                diagnostic_code,
+                update_id=inbound.update_id,
+                session_id=session_id,
+                retryable=diagnostic_retryable,
+                message=sanitize_exception(exc),
+                extras=extras,
+            )
             if not self._notify_on_error:
                 return None
             return _build_error_fallback_message(inbound=inbound, session_id=session_id, code=code)
 
     def drain_diagnostics(self) -> list[dict[str, Any]]:
-        diagnostics = list(self._diagnostics)
+        diagnostics: list[dict[str, Any]] = []
+        for code, update_id, session_id, retryable, message, extras in self._diagnostics:
+            diagnostic: dict[str, Any] = {
+                "code": code,
+                "update_id": update_id,
+                "session_id": session_id,
+                "retryable": retryable,
+                "message": message,
+            }
+            if extras:
+                diagnostic.update(extras)
+            diagnostics.append(diagnostic)
         self._diagnostics.clear()
         return diagnostics
 
+    def _record_diagnostic(
+        self,
+        code: str,
+        *,
+        update_id: str,
+        session_id: str,
+        retryable: bool,
+        message: str,
+        extras: dict[str, Any] | None = None,
+    ) -> None:
+        self._diagnostics.append((code, update_id, session_id, retryable, message, extras or None))
+
     def drain_context_telemetry(self) -> dict[str, Any]:
         snapshot = self._context_telemetry.as_dict()
         self._context_telemetry.reset(mode=self._context_mode)
@@ -511,7 +663,7 @@ class CodexOrchestrator:
         session_id: str,
     ) -> str | None:
         try:
-            return self._invoke_fn(request)
+            return self._invoke_unlocked(request)
         except Exception as exc:
             if not _is_overflow_like_codex_error(exc):
                 raise
@@ -532,7 +684,7 @@ class CodexOrchestrator:
                 )
             except Exception as compaction_exc:
                 self._record_compaction_failure()
-                recovery_meta["compaction_error"] = _sanitize_exception(compaction_exc)
+                recovery_meta["compaction_error"] = sanitize_exception(compaction_exc)
                 setattr(compaction_exc, "_overflow_recovery", recovery_meta)
                 raise
 
@@ -552,17 +704,17 @@ class CodexOrchestrator:
                     setattr(compaction_failed_exc, "_overflow_recovery", recovery_meta)
                     raise compaction_failed_exc from exc
                 retry_history = result.conversation_history
-                self._diagnostics.append(
-                    {
-                        "code": "context-compaction-fallback",
-                        "update_id": inbound.update_id,
-                        "session_id": session_id,
-                        "retryable": True,
+                self._record_diagnostic(
+                    "context-compaction-fallback",
+                    update_id=inbound.update_id,
+                    session_id=session_id,
+                    retryable=True,
+                    message=f"compaction failed, fallback context used: {result.reason}",
+                    extras={
                         "layer": "context",
                         "operation": "compact",
-                        "message": f"compaction failed, fallback context used: {result.reason}",
                         "overflow_recovery": dict(recovery_meta),
-                    }
+                    },
                 )
             elif result.status != "compacted":
                 self._record_compaction_failure()
@@ -581,12 +733,25 @@ class CodexOrchestrator:
                 conversation_history=retry_history,
             )
             try:
-                return self._invoke_fn(retry_request)
+                return self._invoke_unlocked(retry_request)
             except Exception as retry_exc:
-                recovery_meta["retry_error"] = _sanitize_exception(retry_exc)
+                recovery_meta["retry_error"] = sanitize_exception(retry_exc)
                 setattr(retry_exc, "_overflow_recovery", recovery_meta)
                 raise
 
+    def _invoke_unlocked(self, request: CodexInvocationRequest) -> str | None:
+        # Other workers run eviction while the lock is released; keep this session alive.
+        manager = self._session_manager
+        manager.mark_in_flight(request.session_id)
+        self._state_lock.release()
+        try:
+            return self._invoke_fn(request)
+        finally:
+            self._state_lock.acquire()
+            manager.clear_in_flight(request.session_id)
+            # The call may have run for up to codex_timeout_s; stamp completion, not batch start.
+            manager.refresh_clock()
+
     def _record_history_tokens(self, history: tuple[ConversationTurn, ...]) -> None:
         try:
             estimate = int(self._token_estimator.estimate_assembled_window(conversation_history=history))
@@ -680,16 +845,13 @@ class CodexOrchestrator:
                 },
             )
         except Exception as exc:
-            self._diagnostics.append(
-                {
-                    "code": "context-operator-command-error",
-                    "update_id": inbound.update_id,
-                    "session_id": session_id,
-                    "retryable": False,
-                    "layer": "context",
-                    "operation": command,
-                    "message": _sanitize_exception(exc),
-                }
+            self._record_diagnostic(
+                "context-operator-command-error",
+                update_id=inbound.update_id,
+                session_id=session_id,
+                retryable=False,
+                message=sanitize_exception(exc),
+                extras={"layer": "context", "operation": command},
             )
             return OutboundMessage(
                 chat_id=inbound.chat_id,
@@ -800,19 +962,7 @@ class CodexOrchestrator:
 
 
 def _default_codex_invoke(request: CodexInvocationRequest, *, timeout_s: float) -> str | None:
-    codex_cwd = str(Path(__file__).resolve().parents[2])
-    payload = json.dumps(
-        {
-            "session_id": request.session_id,
-            "chat_id": request.chat_id,
-            "user_id": request.user_id,
-            "text": request.text,
-            "update_id": request.update_id,
-            "message_id": request.message_id,
-            "conversation_history": list(request.conversation_history),
-        },
-        sort_keys=True,
-    )
+    payload = _encode_codex_payload(request)
     try:
         completed = subprocess.run(
             [
@@ -822,7 +972,7 @@ def _default_codex_invoke(request: CodexInvocationRequest, *, timeout_s: float)
                 "workspace-write",
                 "--skip-git-repo-check",
                 "--cd",
-                codex_cwd,
+                _CODEX_CWD,
                 payload,
             ],
             capture_output=True,
@@ -841,22 +991,35 @@ def _default_codex_invoke(request: CodexInvocationRequest, *, timeout_s: float)
     return output or None
 
 
+_CODEX_EXEC_FAILED = ("codex-exec-failed", True, False)
+_CODEX_EXCEPTION_CLASSES: dict[type, tuple[str, bool, bool]] = {
+    TimeoutError: ("codex-timeout", True, True),
+    ContractValidationError: ("codex-contract-violation", False, False),
+    CodexInvalidResponseError: ("codex-invalid-response", False, False),
+}
+
+
+def _encode_codex_payload(request: CodexInvocationRequest) -> str:
+    encode = _CODEX_JSON_ENCODE
+    return _CODEX_PAYLOAD_TEMPLATE.format(
+        encode(request.chat_id),
+        encode(list(request.conversation_history)),
+        encode(request.message_id),
+        encode(request.session_id),
+        encode(request.text),
+        encode(request.update_id),
+        encode(request.user_id),
+    )
+
+
 def _classify_codex_exception(exc: Exception) -> tuple[str, bool, bool]:
-    if isinstance(exc, TimeoutError):
-        return ("codex-timeout", True, True)
-    if isinstance(exc, ContractValidationError):
-        return ("codex-contract-violation", False, False)
-    if isinstance(exc, CodexInvalidResponseError):
-        return ("codex-invalid-response", False, False)
-    if isinstance(exc, (CodexExecError, OSError, subprocess.SubprocessError, RuntimeError)):
-        return ("codex-exec-failed", True, False)
-    return ("codex-exec-failed", True, False)
-
-
-def _sanitize_exception(exc: Exception) -> str:
-    raw = f"{type(exc).__name__}: {exc}".strip()
-    compact = " ".join(raw.split())
-    return compact[:500]
+    # Nearest classified base wins; anything else (CodexExecError, OSError,
+    # SubprocessError, RuntimeError, ...) is a retryable exec failure.
+    for exc_type in type(exc).__mro__:
+        classification = _CODEX_EXCEPTION_CLASSES.get(exc_type)
+        if classification is not None:
+            return classification
+    return _CODEX_EXEC_FAILED
 
 
 def _is_overflow_like_codex_error(exc: Exception) -> bool:
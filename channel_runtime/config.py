@@ -1,8 +1,10 @@
 from __future__ import annotations
 
 import os
-from dataclasses import dataclass
-from typing import Mapping, Sequence
+from dataclasses import FrozenInstanceError
+from functools import lru_cache, partial
+from types import MappingProxyType
+from typing import Any, Callable, Mapping, Sequence
 
 from channel_core.contracts import ConfigValidationError
 
@@ -11,35 +13,316 @@ DURABLE_CONTEXT_MODE = "durable"
 LEGACY_CONTEXT_EMERGENCY_TOGGLE = "CHANNEL_CONTEXT_MODE=legacy"
 LEGACY_CONTEXT_RETENTION_RELEASES = 1
 
+# CLI flag -> parse_runtime_config values key; one lookup both validates and routes a flag.
+_FLAG_TO_KEY: Mapping[str, str] = MappingProxyType(
+    {
+        "--token": "token",
+        "--mode": "mode",
+        "--ack-policy": "ack_policy",
+        "--orchestrator-mode": "orchestrator_mode",
+        "--codex-timeout-s": "codex_timeout_s",
+        "--notify-on-orchestrator-error": "notify_on_orchestrator_error",
+        "--codex-session-max": "codex_session_max",
+        "--codex-session-idle-ttl-s": "codex_session_idle_ttl_s",
+        "--poll-interval-s": "poll_interval_s",
+        "--allowed-chat-ids": "allowed_chat_ids",
+        "--cursor-state-path": "cursor_state_path",
+        "--strict-cursor-state-io": "strict_cursor_state_io",
+        "--live-mode": "live_mode",
+        "--once": "once",
+        "--context-mode": "context_mode",
+        "--context-canary-chat-ids": "context_canary_chat_ids",
+        "--context-canary-allowlist-chat-ids": "context_canary_chat_ids",
+        "--context-window-tokens": "context_window_tokens",
+        "--context-reserve-tokens": "context_reserve_tokens",
+        "--context-keep-recent-tokens": "context_keep_recent_tokens",
+        "--context-summary-max-tokens": "context_summary_max_tokens",
+        "--context-min-gain-tokens": "context_min_gain_tokens",
+        "--context-compaction-cooldown-s": "context_compaction_cooldown_s",
+        "--context-strict-io": "context_strict_io",
+        "--context-manual-compact": "context_manual_compact",
+        "--concurrency": "concurrency",
+        "--adaptive-poll": "adaptive_poll",
+        "--max-poll-interval-s": "max_poll_interval_s",
+        "--verbose": "verbose",
+        "--memory-lookup-concurrency": "memory_lookup_concurrency",
+    }
+)
+_VALUELESS_FLAGS = frozenset({"--once", "--verbose"})
+# Spellings accepted for CHANNEL_* booleans (compared lower-cased and stripped).
+BOOL_TRUE_VALUES: frozenset[str] = frozenset({"1", "true", "yes", "on"})
+BOOL_FALSE_VALUES: frozenset[str] = frozenset({"0", "false", "no", "off", ""})
+# RuntimeConfig field order; drives __slots__, equality, hashing and repr.
+_CONFIG_FIELDS = (
+    "token",
+    "mode",
+    "ack_policy",
+    "orchestrator_mode",
+    "codex_timeout_s",
+    "notify_on_orchestrator_error",
+    "codex_session_max",
+    "codex_session_idle_ttl_s",
+    "poll_interval_s",
+    "allowed_chat_ids",
+    "cursor_state_path",
+    "strict_cursor_state_io",
+    "live_mode",
+    "once",
+    "context_mode",
+    "context_canary_chat_ids",
+    "context_window_tokens",
+    "context_reserve_tokens",
+    "context_keep_recent_tokens",
+    "context_summary_max_tokens",
+    "context_min_gain_tokens",
+    "context_compaction_cooldown_s",
+    "context_strict_io",
+    "context_manual_compact",
+    "concurrency",
+    "adaptive_poll",
+    "max_poll_interval_s",
+    "verbose",
+    "memory_lookup_concurrency",
+)
+_ERR_POSITIVE_NUMBER = "{} must be a positive number"
+_ERR_POSITIVE_INT = "{} must be an integer >= 1"
+_ERR_NONNEGATIVE_INT = "{} must be an integer >= 0"
+_ERR_NONNEGATIVE_NUMBER = "{} must be a number >= 0"
+_ERR_BOOL = "{} must be a boolean"
+_ERR_ALLOWLIST_TYPE = "{} must be a string or list of strings"
+_ERR_ALLOWLIST_EMPTY = "{} must not contain empty values"
+# (values key, env key, default) for every CHANNEL_* input. The legacy canary
+# key precedes its replacement so CHANNEL_CONTEXT_CANARY_ALLOWLIST_CHAT_IDS wins.
+_ENV_DEFAULTS: tuple[tuple[str, str, str], ...] = (
+    ("token", "CHANNEL_TOKEN", ""),
+    ("mode", "CHANNEL_MODE", "poll"),
+    ("ack_policy", "CHANNEL_ACK_POLICY", "always"),
+    ("orchestrator_mode", "CHANNEL_ORCHESTRATOR_MODE", "default"),
+    ("codex_timeout_s", "CHANNEL_CODEX_TIMEOUT_S", "20.0"),
+    ("notify_on_orchestrator_error", "CHANNEL_NOTIFY_ON_ORCHESTRATOR_ERROR", "false"),
+    ("codex_session_max", "CHANNEL_CODEX_SESSION_MAX", "128"),
+    ("codex_session_idle_ttl_s", "CHANNEL_CODEX_SESSION_IDLE_TTL_S", "900.0"),
+    ("poll_interval_s", "CHANNEL_POLL_INTERVAL_S", "2.0"),
+    ("allowed_chat_ids", "CHANNEL_ALLOWED_CHAT_IDS", ""),
+    ("cursor_state_path", "CHANNEL_CURSOR_STATE_PATH", ".channel_runtime/telegram_cursor_state.json"),
+    ("strict_cursor_state_io", "CHANNEL_STRICT_CURSOR_STATE_IO", "false"),
+    ("live_mode", "CHANNEL_LIVE_MODE", "false"),
+    ("once", "CHANNEL_ONCE", "false"),
+    ("context_mode", "CHANNEL_CONTEXT_MODE", LEGACY_CONTEXT_MODE),
+    ("context_canary_chat_ids", "CHANNEL_CONTEXT_CANARY_CHAT_IDS", ""),
+    ("context_canary_chat_ids", "CHANNEL_CONTEXT_CANARY_ALLOWLIST_CHAT_IDS", ""),
+    ("context_window_tokens", "CHANNEL_CONTEXT_WINDOW_TOKENS", "128000"),
+    ("context_reserve_tokens", "CHANNEL_CONTEXT_RESERVE_TOKENS", "16000"),
+    ("context_keep_recent_tokens", "CHANNEL_CONTEXT_KEEP_RECENT_TOKENS", "24000"),
+    ("context_summary_max_tokens", "CHANNEL_CONTEXT_SUMMARY_MAX_TOKENS", "1200"),
+    ("context_min_gain_tokens", "CHANNEL_CONTEXT_MIN_GAIN_TOKENS", "800"),
+    ("context_compaction_cooldown_s", "CHANNEL_CONTEXT_COMPACTION_COOLDOWN_S", "300"),
+    ("context_strict_io", "CHANNEL_CONTEXT_STRICT_IO", "false"),
+    ("context_manual_compact", "CHANNEL_CONTEXT_MANUAL_COMPACT", "false"),
+    ("concurrency", "CHANNEL_CONCURRENCY", "1"),
+    ("adaptive_poll", "CHANNEL_ADAPTIVE_POLL", "false"),
+    ("max_poll_interval_s", "CHANNEL_MAX_POLL_INTERVAL_S", "30.0"),
+    ("verbose", "CHANNEL_VERBOSE", "false"),
+    ("memory_lookup_concurrency", "CHANNEL_MEMORY_LOOKUP_CONCURRENCY", "1"),
+)
+_CHANNEL_ENV_KEYS = tuple(env_key for _, env_key, _ in _ENV_DEFAULTS)
+_VALUE_DEFAULTS: Mapping[str, str] = MappingProxyType({key: default for key, _, default in _ENV_DEFAULTS})
+
 
-@dataclass(frozen=True)
 class RuntimeConfig:
+    """Immutable runtime configuration.
+
+    Hand-written ``__slots__`` class rather than ``@dataclass(frozen=True)`` so
+    importing this module skips dataclass code generation on CLI startup.
+    """
+
+    __slots__ = _CONFIG_FIELDS + ("allowed_chat_ids_set",)
+
     token: str
-    mode: str = "poll"
-    ack_policy: str = "always"
-    orchestrator_mode: str = "default"
-    codex_timeout_s: float = 20.0
-    notify_on_orchestrator_error: bool = False
-    codex_session_max: int = 128
-    codex_session_idle_ttl_s: float = 900.0
-    poll_interval_s: float = 2.0
-    allowed_chat_ids: tuple[str, ...] = ()
-    cursor_state_path: str = ".channel_runtime/telegram_cursor_state.json"
-    strict_cursor_state_io: bool = False
-    live_mode: bool = False
-    once: bool = False
-    context_mode: str = LEGACY_CONTEXT_MODE
-    context_canary_chat_ids: tuple[str, ...] = ()
-    context_window_tokens: int = 128000
-    context_reserve_tokens: int = 16000
-    context_keep_recent_tokens: int = 24000
-    context_summary_max_tokens: int = 1200
-    context_min_gain_tokens: int = 800
-    context_compaction_cooldown_s: float = 300.0
-    context_strict_io: bool = False
-    context_manual_compact: bool = False
-
-    def __post_init__(self) -> None:
+    mode: str
+    ack_policy: str
+    orchestrator_mode: str
+    codex_timeout_s: float
+    notify_on_orchestrator_error: bool
+    codex_session_max: int
+    codex_session_idle_ttl_s: float
+    poll_interval_s: float
+    allowed_chat_ids: tuple[str, ...]
+    cursor_state_path: str
+    strict_cursor_state_io: bool
+    live_mode: bool
+    once: bool
+    context_mode: str
+    context_canary_chat_ids: tuple[str, ...]
+    context_window_tokens: int
+    context_reserve_tokens: int
+    context_keep_recent_tokens: int
+    context_summary_max_tokens: int
+    context_min_gain_tokens: int
+    context_compaction_cooldown_s: float
+    context_strict_io: bool
+    context_manual_compact: bool
+    # Sessions a codex orchestrator handles in parallel within one cycle's batch.
+    concurrency: int
+    # Back off the poll interval over consecutive idle cycles, capped at max_poll_interval_s.
+    adaptive_poll: bool
+    max_poll_interval_s: float
+    # Emit the full cycle payload per continuous-mode cycle instead of a one-line summary.
+    verbose: bool
+    # Memory-hook lookups a default-mode orchestrator overlaps within one cycle's batch.
+    memory_lookup_concurrency: int
+    # Canonical (normalized) allowed_chat_ids for O(1) membership checks on the poll path.
+    allowed_chat_ids_set: frozenset[str]
+
+    def __init__(
+        self,
+        token: str,
+        mode: str = "poll",
+        ack_policy: str = "always",
+        orchestrator_mode: str = "default",
+        codex_timeout_s: float = 20.0,
+        notify_on_orchestrator_error: bool = False,
+        codex_session_max: int = 128,
+        codex_session_idle_ttl_s: float = 900.0,
+        poll_interval_s: float = 2.0,
+        allowed_chat_ids: tuple[str, ...] = (),
+        cursor_state_path: str = ".channel_runtime/telegram_cursor_state.json",
+        strict_cursor_state_io: bool = False,
+        live_mode: bool = False,
+        once: bool = False,
+        context_mode: str = LEGACY_CONTEXT_MODE,
+        context_canary_chat_ids: tuple[str, ...] = (),
+        context_window_tokens: int = 128000,
+        context_reserve_tokens: int = 16000,
+        context_keep_recent_tokens: int = 24000,
+        context_summary_max_tokens: int = 1200,
+        context_min_gain_tokens: int = 800,
+        context_compaction_cooldown_s: float = 300.0,
+        context_strict_io: bool = False,
+        context_manual_compact: bool = False,
+        concurrency: int = 1,
+        adaptive_poll: bool = False,
+        max_poll_interval_s: float = 30.0,
+        verbose: bool = False,
+        memory_lookup_concurrency: int = 1,
+        *,
+        _check_field_ranges: bool = True,
+    ) -> None:
+        _set = object.__setattr__
+        _set(self, "token", token)
+        _set(self, "mode", mode)
+        _set(self, "ack_policy", ack_policy)
+        _set(self, "orchestrator_mode", orchestrator_mode)
+        _set(self, "codex_timeout_s", codex_timeout_s)
+        _set(self, "notify_on_orchestrator_error", notify_on_orchestrator_error)
+        _set(self, "codex_session_max", codex_session_max)
+        _set(self, "codex_session_idle_ttl_s", codex_session_idle_ttl_s)
+        _set(self, "poll_interval_s", poll_interval_s)
+        _set(self, "allowed_chat_ids", allowed_chat_ids)
+        _set(self, "cursor_state_path", cursor_state_path)
+        _set(self, "strict_cursor_state_io", strict_cursor_state_io)
+        _set(self, "live_mode", live_mode)
+        _set(self, "once", once)
+        _set(self, "context_mode", context_mode)
+        _set(self, "context_canary_chat_ids", context_canary_chat_ids)
+        _set(self, "context_window_tokens", context_window_tokens)
+        _set(self, "context_reserve_tokens", context_reserve_tokens)
+        _set(self, "context_keep_recent_tokens", context_keep_recent_tokens)
+        _set(self, "context_summary_max_tokens", context_summary_max_tokens)
+        _set(self, "context_min_gain_tokens", context_min_gain_tokens)
+        _set(self, "context_compaction_cooldown_s", context_compaction_cooldown_s)
+        _set(self, "context_strict_io", context_strict_io)
+        _set(self, "context_manual_compact", context_manual_compact)
+        _set(self, "concurrency", concurrency)
+        _set(self, "adaptive_poll", adaptive_poll)
+        _set(self, "max_poll_interval_s", max_poll_interval_s)
+        _set(self, "verbose", verbose)
+        _set(self, "memory_lookup_concurrency", memory_lookup_concurrency)
+        self._normalize_and_validate(check_field_ranges=_check_field_ranges)
+
+    @classmethod
+    def _unchecked(cls, **values: Any) -> RuntimeConfig:
+        """Build from values ``parse_runtime_config`` has already range-checked.
+
+        Skips the per-field range checks; normalization, enum and cross-field
+        invariants still run.
+        """
+        return cls(**values, _check_field_ranges=False)
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        raise FrozenInstanceError(f"cannot assign to field {name!r}")
+
+    def __delattr__(self, name: str) -> None:
+        raise FrozenInstanceError(f"cannot delete field {name!r}")
+
+    def _astuple(self) -> tuple[Any, ...]:
+        return tuple(getattr(self, name) for name in _CONFIG_FIELDS)
+
+    def _asdict(self) -> dict[str, Any]:
+        return dict(zip(_CONFIG_FIELDS, self._astuple()))
+
+    def replace(self, **changes: Any) -> RuntimeConfig:
+        """Return a validated copy with ``changes`` applied (the ``dataclasses.replace`` equivalent)."""
+        values = self._asdict()
+        unknown = changes.keys() - values.keys()
+        if unknown:
+            raise TypeError(f"RuntimeConfig.replace() got unexpected field(s): {', '.join(sorted(unknown))}")
+        values.update(changes)
+        return type(self)(**values)
+
+    __replace__ = replace
+
+    def __reduce__(self) -> tuple[Any, ...]:
+        # copy/pickle rebuild through __init__; the default protocol would trip over __setattr__.
+        return (_config_from_fields, (self._asdict(),))
+
+    def __eq__(self, other: object) -> bool:
+        if other.__class__ is not self.__class__:
+            return NotImplemented
+        return self._astuple() == other._astuple()
+
+    def __hash__(self) -> int:
+        return hash(self._astuple())
+
+    def __repr__(self) -> str:
+        fields = ", ".join(f"{name}={getattr(self, name)!r}" for name in _CONFIG_FIELDS)
+        return f"{type(self).__name__}({fields})"
+
+    def _check_field_ranges(self) -> None:
+        if self.codex_timeout_s <= 0:
+            raise ConfigValidationError(_ERR_POSITIVE_NUMBER.format("codex_timeout_s"))
+        if int(self.codex_session_max) < 1:
+            raise ConfigValidationError(_ERR_POSITIVE_INT.format("codex_session_max"))
+        if self.codex_session_idle_ttl_s <= 0:
+            raise ConfigValidationError(_ERR_POSITIVE_NUMBER.format("codex_session_idle_ttl_s"))
+        if self.poll_interval_s <= 0:
+            raise ConfigValidationError(_ERR_POSITIVE_NUMBER.format("poll_interval_s"))
+        if self.max_poll_interval_s <= 0:
+            raise ConfigValidationError(_ERR_POSITIVE_NUMBER.format("max_poll_interval_s"))
+        if int(self.concurrency) < 1:
+            raise ConfigValidationError(_ERR_POSITIVE_INT.format("concurrency"))
+        if int(self.memory_lookup_concurrency) < 1:
+            raise ConfigValidationError(_ERR_POSITIVE_INT.format("memory_lookup_concurrency"))
+        if int(self.context_window_tokens) < 1:
+            raise ConfigValidationError(_ERR_POSITIVE_INT.format("context_window_tokens"))
+        if int(self.context_reserve_tokens) < 0:
+            raise ConfigValidationError(_ERR_NONNEGATIVE_INT.format("context_reserve_tokens"))
+        if int(self.context_keep_recent_tokens) < 1:
+            raise ConfigValidationError(_ERR_POSITIVE_INT.format("context_keep_recent_tokens"))
+        if int(self.context_summary_max_tokens) < 1:
+            raise ConfigValidationError(_ERR_POSITIVE_INT.format("context_summary_max_tokens"))
+        if int(self.context_min_gain_tokens) < 0:
+            raise ConfigValidationError(_ERR_NONNEGATIVE_INT.format("context_min_gain_tokens"))
+        if float(self.context_compaction_cooldown_s) < 0:
+            raise ConfigValidationError(_ERR_NONNEGATIVE_NUMBER.format("context_compaction_cooldown_s"))
+        for chat_id in self.allowed_chat_ids:
+            if not str(chat_id).strip():
+                raise ConfigValidationError(_ERR_ALLOWLIST_EMPTY.format("allowed_chat_ids"))
+        for chat_id in self.context_canary_chat_ids:
+            if not str(chat_id).strip():
+                raise ConfigValidationError(_ERR_ALLOWLIST_EMPTY.format("context_canary_chat_ids"))
+
+    def _normalize_and_validate(self, *, check_field_ranges: bool) -> None:
         token = str(self.token).strip()
         mode = str(self.mode).strip()
         ack_policy = str(self.ack_policy).strip().lower()
@@ -59,34 +342,10 @@ class RuntimeConfig:
                 "context_mode must be 'legacy' or 'durable' "
                 "(set CHANNEL_CONTEXT_MODE=legacy for emergency rollback)"
             )
-        if self.codex_timeout_s <= 0:
-            raise ConfigValidationError("codex_timeout_s must be a positive number")
-        if int(self.codex_session_max) < 1:
-            raise ConfigValidationError("codex_session_max must be an integer >= 1")
-        if self.codex_session_idle_ttl_s <= 0:
-            raise ConfigValidationError("codex_session_idle_ttl_s must be a positive number")
-        if self.poll_interval_s <= 0:
-            raise ConfigValidationError("poll_interval_s must be a positive number")
-        if int(self.context_window_tokens) < 1:
-            raise ConfigValidationError("context_window_tokens must be an integer >= 1")
-        if int(self.context_reserve_tokens) < 0:
-            raise ConfigValidationError("context_reserve_tokens must be an integer >= 0")
-        if int(self.context_keep_recent_tokens) < 1:
-            raise ConfigValidationError("context_keep_recent_tokens must be an integer >= 1")
-        if int(self.context_summary_max_tokens) < 1:
-            raise ConfigValidationError("context_summary_max_tokens must be an integer >= 1")
-        if int(self.context_min_gain_tokens) < 0:
-            raise ConfigValidationError("context_min_gain_tokens must be an integer >= 0")
-        if float(self.context_compaction_cooldown_s) < 0:
-            raise ConfigValidationError("context_compaction_cooldown_s must be a number >= 0")
+        if check_field_ranges:
+            self._check_field_ranges()
         if int(self.context_window_tokens) <= int(self.context_reserve_tokens):
             raise ConfigValidationError("context_window_tokens must be greater than context_reserve_tokens")
-        for chat_id in self.allowed_chat_ids:
-            if not str(chat_id).strip():
-                raise ConfigValidationError("allowed_chat_ids must not contain empty values")
-        for chat_id in self.context_canary_chat_ids:
-            if not str(chat_id).strip():
-                raise ConfigValidationError("context_canary_chat_ids must not contain empty values")
         if self.live_mode and not self.allowed_chat_ids:
             raise ConfigValidationError("allowed_chat_ids must be non-empty when live_mode is enabled")
 
@@ -95,286 +354,180 @@ class RuntimeConfig:
         object.__setattr__(self, "ack_policy", ack_policy)
         object.__setattr__(self, "orchestrator_mode", orchestrator_mode)
         object.__setattr__(self, "context_mode", context_mode)
+        object.__setattr__(self, "allowed_chat_ids_set", _normalized_chat_id_set(self.allowed_chat_ids))
 
 
-def parse_runtime_config(
-    argv: Sequence[str] | None = None,
-    *,
-    env: Mapping[str, str] | None = None,
-) -> RuntimeConfig:
-    """Parse config from env plus minimal CLI overrides with deterministic errors."""
-    args = list(argv or ())
-    source_env = dict(env or os.environ)
-
-    values: dict[str, object] = {
-        "token": source_env.get("CHANNEL_TOKEN", ""),
-        "mode": source_env.get("CHANNEL_MODE", "poll"),
-        "ack_policy": source_env.get("CHANNEL_ACK_POLICY", "always"),
-        "orchestrator_mode": source_env.get("CHANNEL_ORCHESTRATOR_MODE", "default"),
-        "codex_timeout_s": source_env.get("CHANNEL_CODEX_TIMEOUT_S", "20.0"),
-        "notify_on_orchestrator_error": source_env.get("CHANNEL_NOTIFY_ON_ORCHESTRATOR_ERROR", "false"),
-        "codex_session_max": source_env.get("CHANNEL_CODEX_SESSION_MAX", "128"),
-        "codex_session_idle_ttl_s": source_env.get("CHANNEL_CODEX_SESSION_IDLE_TTL_S", "900.0"),
-        "poll_interval_s": source_env.get("CHANNEL_POLL_INTERVAL_S", "2.0"),
-        "allowed_chat_ids": source_env.get("CHANNEL_ALLOWED_CHAT_IDS", ""),
-        "cursor_state_path": source_env.get("CHANNEL_CURSOR_STATE_PATH", ".channel_runtime/telegram_cursor_state.json"),
-        "strict_cursor_state_io": source_env.get("CHANNEL_STRICT_CURSOR_STATE_IO", "false"),
-        "live_mode": source_env.get("CHANNEL_LIVE_MODE", "false"),
-        "once": source_env.get("CHANNEL_ONCE", "false"),
-        "context_mode": source_env.get("CHANNEL_CONTEXT_MODE", LEGACY_CONTEXT_MODE),
-        "context_canary_chat_ids": source_env.get(
-            "CHANNEL_CONTEXT_CANARY_ALLOWLIST_CHAT_IDS",
-            source_env.get("CHANNEL_CONTEXT_CANARY_CHAT_IDS", ""),
-        ),
-        "context_window_tokens": source_env.get("CHANNEL_CONTEXT_WINDOW_TOKENS", "128000"),
-        "context_reserve_tokens": source_env.get("CHANNEL_CONTEXT_RESERVE_TOKENS", "16000"),
-        "context_keep_recent_tokens": source_env.get("CHANNEL_CONTEXT_KEEP_RECENT_TOKENS", "24000"),
-        "context_summary_max_tokens": source_env.get("CHANNEL_CONTEXT_SUMMARY_MAX_TOKENS", "1200"),
-        "context_min_gain_tokens": source_env.get("CHANNEL_CONTEXT_MIN_GAIN_TOKENS", "800"),
-        "context_compaction_cooldown_s": source_env.get("CHANNEL_CONTEXT_COMPACTION_COOLDOWN_S", "300"),
-        "context_strict_io": source_env.get("CHANNEL_CONTEXT_STRICT_IO", "false"),
-        "context_manual_compact": source_env.get("CHANNEL_CONTEXT_MANUAL_COMPACT", "false"),
-    }
+def _config_from_fields(values: dict[str, Any]) -> RuntimeConfig:
+    return RuntimeConfig(**values)
 
-    _apply_cli_overrides(values, args)
 
-    codex_timeout_s = _parse_positive_float(values["codex_timeout_s"], field_name="codex_timeout_s")
-    notify_on_orchestrator_error = _parse_bool(
-        values["notify_on_orchestrator_error"],
-        field_name="notify_on_orchestrator_error",
-    )
-    codex_session_max = _parse_positive_int(values["codex_session_max"], field_name="codex_session_max")
-    codex_session_idle_ttl_s = _parse_positive_float(
-        values["codex_session_idle_ttl_s"],
-        field_name="codex_session_idle_ttl_s",
-    )
-    poll_interval_s = _parse_positive_float(values["poll_interval_s"], field_name="poll_interval_s")
-    allowed_chat_ids = _parse_allowlist(values["allowed_chat_ids"], field_name="allowed_chat_ids")
-    cursor_state_path = str(values["cursor_state_path"]).strip()
-    strict_cursor_state_io = _parse_bool(values["strict_cursor_state_io"], field_name="strict_cursor_state_io")
-    live_mode = _parse_bool(values["live_mode"], field_name="live_mode")
-    once = _parse_bool(values["once"], field_name="once")
-    context_canary_chat_ids = _parse_allowlist(
-        values["context_canary_chat_ids"],
-        field_name="context_canary_chat_ids",
-    )
-    context_window_tokens = _parse_positive_int(
-        values["context_window_tokens"],
-        field_name="context_window_tokens",
-    )
-    context_reserve_tokens = _parse_nonnegative_int(
-        values["context_reserve_tokens"],
-        field_name="context_reserve_tokens",
-    )
-    context_keep_recent_tokens = _parse_positive_int(
-        values["context_keep_recent_tokens"],
-        field_name="context_keep_recent_tokens",
-    )
-    context_summary_max_tokens = _parse_positive_int(
-        values["context_summary_max_tokens"],
-        field_name="context_summary_max_tokens",
-    )
-    context_min_gain_tokens = _parse_nonnegative_int(
-        values["context_min_gain_tokens"],
-        field_name="context_min_gain_tokens",
-    )
-    context_compaction_cooldown_s = _parse_nonnegative_float(
-        values["context_compaction_cooldown_s"],
-        field_name="context_compaction_cooldown_s",
-    )
-    context_strict_io = _parse_bool(values["context_strict_io"], field_name="context_strict_io")
-    context_manual_compact = _parse_bool(values["context_manual_compact"], field_name="context_manual_compact")
-
-    return RuntimeConfig(
-        token=str(values["token"]),
-        mode=str(values["mode"]),
-        ack_policy=str(values["ack_policy"]),
-        orchestrator_mode=str(values["orchestrator_mode"]),
-        codex_timeout_s=codex_timeout_s,
-        notify_on_orchestrator_error=notify_on_orchestrator_error,
-        codex_session_max=codex_session_max,
-        codex_session_idle_ttl_s=codex_session_idle_ttl_s,
-        poll_interval_s=poll_interval_s,
-        allowed_chat_ids=allowed_chat_ids,
-        cursor_state_path=cursor_state_path,
-        strict_cursor_state_io=strict_cursor_state_io,
-        live_mode=live_mode,
-        once=once,
-        context_mode=str(values["context_mode"]),
-        context_canary_chat_ids=context_canary_chat_ids,
-        context_window_tokens=context_window_tokens,
-        context_reserve_tokens=context_reserve_tokens,
-        context_keep_recent_tokens=context_keep_recent_tokens,
-        context_summary_max_tokens=context_summary_max_tokens,
-        context_min_gain_tokens=context_min_gain_tokens,
-        context_compaction_cooldown_s=context_compaction_cooldown_s,
-        context_strict_io=context_strict_io,
-        context_manual_compact=context_manual_compact,
+def _normalized_chat_id_set(chat_ids: Sequence[str]) -> frozenset[str]:
+    return frozenset(
+        normalized for normalized in map(_normalize_chat_id_text, chat_ids) if normalized is not None
     )
 
 
-def _apply_cli_overrides(values: dict[str, object], args: list[str]) -> None:
-    i = 0
-    while i < len(args):
-        arg = args[i]
-        if arg == "--once":
-            values["once"] = True
-            i += 1
-            continue
-
-        if arg in {
-            "--token",
-            "--mode",
-            "--ack-policy",
-            "--orchestrator-mode",
-            "--codex-timeout-s",
-            "--notify-on-orchestrator-error",
-            "--codex-session-max",
-            "--codex-session-idle-ttl-s",
-            "--poll-interval-s",
-            "--allowed-chat-ids",
-            "--cursor-state-path",
-            "--strict-cursor-state-io",
-            "--live-mode",
-            "--context-mode",
-            "--context-canary-chat-ids",
-            "--context-canary-allowlist-chat-ids",
-            "--context-window-tokens",
-            "--context-reserve-tokens",
-            "--context-keep-recent-tokens",
-            "--context-summary-max-tokens",
-            "--context-min-gain-tokens",
-            "--context-compaction-cooldown-s",
-            "--context-strict-io",
-            "--context-manual-compact",
-        }:
-            if i + 1 >= len(args):
-                raise ConfigValidationError(f"missing value for {arg}")
-            value = args[i + 1]
-            if arg == "--token":
-                values["token"] = value
-            elif arg == "--mode":
-                values["mode"] = value
-            elif arg == "--ack-policy":
-                values["ack_policy"] = value
-            elif arg == "--orchestrator-mode":
-                values["orchestrator_mode"] = value
-            elif arg == "--codex-timeout-s":
-                values["codex_timeout_s"] = value
-            elif arg == "--notify-on-orchestrator-error":
-                values["notify_on_orchestrator_error"] = value
-            elif arg == "--codex-session-max":
-                values["codex_session_max"] = value
-            elif arg == "--codex-session-idle-ttl-s":
-                values["codex_session_idle_ttl_s"] = value
-            elif arg == "--poll-interval-s":
-                values["poll_interval_s"] = value
-            elif arg == "--allowed-chat-ids":
-                values["allowed_chat_ids"] = value
-            elif arg == "--cursor-state-path":
-                values["cursor_state_path"] = value
-            elif arg == "--strict-cursor-state-io":
-                values["strict_cursor_state_io"] = value
-            elif arg == "--live-mode":
-                values["live_mode"] = value
-            elif arg == "--context-mode":
-                values["context_mode"] = value
-            elif arg == "--context-canary-chat-ids":
-                values["context_canary_chat_ids"] = value
-            elif arg == "--context-canary-allowlist-chat-ids":
-                values["context_canary_chat_ids"] = value
-            elif arg == "--context-window-tokens":
-                values["context_window_tokens"] = value
-            elif arg == "--context-reserve-tokens":
-                values["context_reserve_tokens"] = value
-            elif arg == "--context-keep-recent-tokens":
-                values["context_keep_recent_tokens"] = value
-            elif arg == "--context-summary-max-tokens":
-                values["context_summary_max_tokens"] = value
-            elif arg == "--context-min-gain-tokens":
-                values["context_min_gain_tokens"] = value
-            elif arg == "--context-compaction-cooldown-s":
-                values["context_compaction_cooldown_s"] = value
-            elif arg == "--context-strict-io":
-                values["context_strict_io"] = value
-            elif arg == "--context-manual-compact":
-                values["context_manual_compact"] = value
-            i += 2
-            continue
-
-        raise ConfigValidationError(f"unknown argument: {arg}")
+def _normalize_chat_id_text(value: object) -> str | None:
+    text = str(value).strip()
+    if not text:
+        return None
+    negative = text[0] == "-"
+    digits = text[1:] if negative else text
+    if digits.isascii() and digits.isdigit():
+        # Canonical form of a plain ASCII integer without the int() round-trip.
+        digits = digits.lstrip("0") or "0"
+        return "-" + digits if negative and digits != "0" else digits
+    if text.isascii() and "+" not in text and "_" not in text:
+        # No other ASCII spelling parses as an int; skip the raising int() call.
+        return text
+    try:
+        return str(int(text))
+    except ValueError:
+        return text
 
 
-def _parse_positive_float(raw: object, *, field_name: str) -> float:
-    try:
-        value = float(raw)
-    except (TypeError, ValueError) as exc:
-        raise ConfigValidationError(f"{field_name} must be a positive number") from exc
-    if value <= 0:
-        raise ConfigValidationError(f"{field_name} must be a positive number")
-    return value
+def parse_runtime_config(
+    argv: Sequence[str] | None = None,
+    *,
+    env: Mapping[str, str] | None = None,
+) -> RuntimeConfig:
+    """Parse config from env plus minimal CLI overrides with deterministic errors.
+
+    Only the known ``CHANNEL_*`` keys are read from the environment (no full
+    copy), and results are memoized on argv plus those values.
+    """
+    source_env = env if env is not None else os.environ
+    get = source_env.get
+    channel_env = tuple(get(key) for key in _CHANNEL_ENV_KEYS)
+    args = argv if isinstance(argv, tuple) else tuple(argv or ())
+    return _parse_runtime_config_cached(args, channel_env)
+
+
+@lru_cache(maxsize=32)
+def _parse_runtime_config_cached(
+    argv: tuple[str, ...],
+    channel_env: tuple[str | None, ...],
+) -> RuntimeConfig:
+    values = dict(_VALUE_DEFAULTS)
+    for (key, _, _), raw in zip(_ENV_DEFAULTS, channel_env):
+        if raw is not None:
+            values[key] = raw
+
+    _apply_cli_overrides(values, argv)
+
+    parsed = {name: parse(values[name], field_name=name) for name, parse in _FIELD_SPEC}
+    return RuntimeConfig._unchecked(
+        token=values["token"],
+        mode=values["mode"],
+        ack_policy=values["ack_policy"],
+        orchestrator_mode=values["orchestrator_mode"],
+        cursor_state_path=values["cursor_state_path"].strip(),
+        context_mode=values["context_mode"],
+        **parsed,
+    )
 
 
-def _parse_positive_int(raw: object, *, field_name: str) -> int:
-    try:
-        value = int(raw)
-    except (TypeError, ValueError) as exc:
-        raise ConfigValidationError(f"{field_name} must be an integer >= 1") from exc
-    if value < 1:
-        raise ConfigValidationError(f"{field_name} must be an integer >= 1")
-    return value
+def _apply_cli_overrides(values: dict[str, str], args: Sequence[str]) -> None:
+    it = iter(args)
+    for arg in it:
+        key = _FLAG_TO_KEY.get(arg)
+        if key is None:
+            raise ConfigValidationError(f"unknown argument: {arg}")
+        if arg in _VALUELESS_FLAGS:
+            values[key] = "true"
+            continue
+        value = next(it, None)
+        if value is None:
+            raise ConfigValidationError(f"missing value for {arg}")
+        values[key] = value
 
 
-def _parse_nonnegative_int(raw: object, *, field_name: str) -> int:
+def _parse_number(
+    raw: object,
+    *,
+    field_name: str,
+    convert: Callable[[Any], Any],
+    minimum: int,
+    strict: bool,
+    error: str,
+) -> Any:
     try:
-        value = int(raw)
+        value = convert(raw)
     except (TypeError, ValueError) as exc:
-        raise ConfigValidationError(f"{field_name} must be an integer >= 0") from exc
-    if value < 0:
-        raise ConfigValidationError(f"{field_name} must be an integer >= 0")
+        raise ConfigValidationError(error.format(field_name)) from exc
+    if value < minimum or (strict and value == minimum):
+        raise ConfigValidationError(error.format(field_name))
     return value
 
 
-def _parse_nonnegative_float(raw: object, *, field_name: str) -> float:
-    try:
-        value = float(raw)
-    except (TypeError, ValueError) as exc:
-        raise ConfigValidationError(f"{field_name} must be a number >= 0") from exc
-    if value < 0:
-        raise ConfigValidationError(f"{field_name} must be a number >= 0")
-    return value
+_parse_positive_float = partial(_parse_number, convert=float, minimum=0, strict=True, error=_ERR_POSITIVE_NUMBER)
+_parse_positive_int = partial(_parse_number, convert=int, minimum=1, strict=False, error=_ERR_POSITIVE_INT)
+_parse_nonnegative_int = partial(_parse_number, convert=int, minimum=0, strict=False, error=_ERR_NONNEGATIVE_INT)
+_parse_nonnegative_float = partial(
+    _parse_number, convert=float, minimum=0, strict=False, error=_ERR_NONNEGATIVE_NUMBER
+)
 
 
 def _parse_allowlist(raw: object, *, field_name: str) -> tuple[str, ...]:
-    if raw is None:
+    if not raw:
         return ()
 
     if isinstance(raw, str):
         text = raw.strip()
         if not text:
             return ()
-        values = [part.strip() for part in text.split(",")]
+        values = tuple(part.strip() for part in text.split(","))
     else:
         try:
-            values = [str(part).strip() for part in raw]  # type: ignore[arg-type]
+            values = tuple(str(part).strip() for part in raw)  # type: ignore[attr-defined]
         except TypeError as exc:
-            raise ConfigValidationError(f"{field_name} must be a string or list of strings") from exc
+            raise ConfigValidationError(_ERR_ALLOWLIST_TYPE.format(field_name)) from exc
 
-    if any(not value for value in values):
-        raise ConfigValidationError(f"{field_name} must not contain empty values")
-    return tuple(values)
+    if "" in values:
+        raise ConfigValidationError(_ERR_ALLOWLIST_EMPTY.format(field_name))
+    return values
 
 
 def _parse_bool(raw: object, *, field_name: str) -> bool:
-    if isinstance(raw, bool):
+    if raw is True or raw is False:
         return raw
+    if raw is None:
+        return False
 
-    text = str(raw).strip().lower()
-    if text in {"1", "true", "yes", "on"}:
+    text = (raw if isinstance(raw, str) else str(raw)).strip().lower()
+    if text in BOOL_TRUE_VALUES:
         return True
-    if text in {"0", "false", "no", "off", ""}:
+    if text in BOOL_FALSE_VALUES:
         return False
-    raise ConfigValidationError(f"{field_name} must be a boolean")
+    raise ConfigValidationError(_ERR_BOOL.format(field_name))
+
+
+# values key -> parser for every typed RuntimeConfig field; drives _parse_runtime_config_cached.
+_FIELD_SPEC: tuple[tuple[str, Callable[..., object]], ...] = (
+    ("codex_timeout_s", _parse_positive_float),
+    ("notify_on_orchestrator_error", _parse_bool),
+    ("codex_session_max", _parse_positive_int),
+    ("codex_session_idle_ttl_s", _parse_positive_float),
+    ("poll_interval_s", _parse_positive_float),
+    ("allowed_chat_ids", _parse_allowlist),
+    ("strict_cursor_state_io", _parse_bool),
+    ("live_mode", _parse_bool),
+    ("once", _parse_bool),
+    ("context_canary_chat_ids", _parse_allowlist),
+    ("context_window_tokens", _parse_positive_int),
+    ("context_reserve_tokens", _parse_nonnegative_int),
+    ("context_keep_recent_tokens", _parse_positive_int),
+    ("context_summary_max_tokens", _parse_positive_int),
+    ("context_min_gain_tokens", _parse_nonnegative_int),
+    ("context_compaction_cooldown_s", _parse_nonnegative_float),
+    ("context_strict_io", _parse_bool),
+    ("context_manual_compact", _parse_bool),
+    ("concurrency", _parse_positive_int),
+    ("adaptive_poll", _parse_bool),
+    ("max_poll_interval_s", _parse_positive_float),
+    ("verbose", _parse_bool),
+    ("memory_lookup_concurrency", _parse_positive_int),
+)
 
 
 def legacy_context_retention_plan() -> dict[str, object]:
@@ -4,27 +4,41 @@ import hashlib
 import os
 import re
 import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
+from functools import lru_cache, partial
+from itertools import chain
 from pathlib import Path
-from typing import Any, Callable, Mapping
+from types import MappingProxyType
+from typing import Any, Callable, ClassVar, Iterable, Iterator, Mapping, Sequence
 
-from channel_core.contracts import InboundMessage, OrchestratorPort, OutboundMessage
+from channel_core.contracts import InboundMessage, OrchestratorPort, OutboundMessage, sanitize_exception
 from channel_core.service import process_once
 from telegram_channel.adapter import TelegramChannelAdapter
 from telegram_channel.api import TelegramApiClient
 from telegram_channel.cursor_state import DurableCursorStateStore
 
-from .codex_orchestrator import CodexInvocationRequest, CodexOrchestrator, CodexSessionManager, CodexSessionPolicy
-from .config import RuntimeConfig
+from .codex_orchestrator import (
+    MAX_PENDING_DIAGNOSTICS,
+    CodexInvocationRequest,
+    CodexOrchestrator,
+    CodexSessionManager,
+    CodexSessionPolicy,
+)
+from .config import BOOL_TRUE_VALUES, RuntimeConfig, _normalize_chat_id_text
 from .context.compaction import CompactionPolicy, CompactionService
 from .context.store import ContextStore
 
 
 PublishSystemEventFn = Callable[..., dict[str, Any]]
+PublishSystemEventsFn = Callable[..., Any]
 MemoryLookupFn = Callable[[str], str | None]
 CodexInvokeFn = Callable[[CodexInvocationRequest], str | None]
 DiagnosticEntry = tuple[str, dict[str, Any]]
+FailureEntry = tuple[str, Mapping[str, Any] | None]
 TelemetryDigest = dict[str, Any]
+BatchResult = OutboundMessage | None | Exception
 
 _TELEMETRY_CONTRACT = "tg-live.runtime.telemetry"
 _TELEMETRY_VERSION = "2.0"
@@ -33,6 +47,37 @@ _TELEMETRY_PLACEHOLDERS = {
     "queue_depth": "pending-runtime-queue-introspection",
     "worker_restart_total": "pending-supervisor-integration",
 }
+# Static keys of a wrapper-level failed cycle result; per-failure values are filled in by _failed_cycle_result.
+_FAILED_RESULT_TEMPLATE: Mapping[str, Any] = MappingProxyType(
+    {
+        "status": "failed",
+        "reason": "",
+        "fetched_count": 0,
+        "sent_count": 0,
+        "acked_count": 0,
+        "ack_skipped_count": 0,
+        "error_count": 1,
+        "errors": None,
+        "error_details": None,
+        "heartbeat_emit_failures": 0,
+        "dropped_count": 0,
+        "dropped_updates": None,
+    }
+)
+# Error messages kept on a cycle result (newest win); error_count still reports the full total.
+_MAX_RESULT_ERRORS = 32
+_DROP_DIAGNOSTIC_CODES = frozenset({"allowlist-drop", "stale-drop"})
+_ECHO_PREFIX = "echo: "
+_MEMORY_SEPARATOR = "\n\nmemory: "
+_ACK_FAILED_RE = re.compile(r"^update\s+([^:]+):\s+ack failed:\s+(.+)$")
+_UPDATE_ERROR_RE = re.compile(r"^update\s+([^:]+):\s+(.+)$")
+_SERVICE_OPERATION_TOKENS = (
+    ("ack failed", "ack_update"),
+    ("ack_update", "ack_update"),
+    ("send_message", "send_message"),
+    ("send failed", "send_message"),
+)
+_RETRYABLE_ERROR_RE = re.compile("timeout|temporar|connection|network|unavailable|too many requests|rate limit")
 
 
 @dataclass(frozen=True)
@@ -42,6 +87,16 @@ class HeartbeatEventEmitter:
     publish_event: PublishSystemEventFn | None = None
     enabled: bool = True
     source: str = "channel-runtime"
+    # Optional batch publisher: one call carrying every failure of a cycle.
+    publish_events: PublishSystemEventsFn | None = None
+    # Shared disabled instance; assigned after the no-op emit helpers are defined.
+    DISABLED: ClassVar[HeartbeatEventEmitter]
+
+    def __post_init__(self) -> None:
+        if not self.enabled:
+            # Fixed per instance: a disabled emitter never publishes, so skip the per-call check.
+            object.__setattr__(self, "emit_failure", _emit_nothing)
+            object.__setattr__(self, "emit_failures", _emit_nothing_batch)
 
     def emit_failure(
         self,
@@ -50,21 +105,38 @@ class HeartbeatEventEmitter:
         text: str,
         context: Mapping[str, Any] | None = None,
     ) -> bool:
-        if not self.enabled:
-            return False
-
         publisher = self.publish_event or _default_publish_system_event
         try:
             publisher(
                 session_key=session_key,
                 text=text,
                 source=self.source,
-                context=dict(context or {}),
+                context=_event_context(context),
             )
             return True
         except Exception:
             return False
 
+    def emit_failures(
+        self,
+        *,
+        session_key: str,
+        entries: Sequence[FailureEntry],
+    ) -> list[bool]:
+        """Emit several failures; one ``publish_events`` call when configured, else one per entry."""
+        if self.publish_events is None:
+            return [self.emit_failure(session_key=session_key, text=text, context=context) for text, context in entries]
+
+        try:
+            self.publish_events(
+                session_key=session_key,
+                source=self.source,
+                events=[{"text": text, "context": _event_context(context)} for text, context in entries],
+            )
+            return [True] * len(entries)
+        except Exception:
+            return [False] * len(entries)
+
 
 class DefaultOrchestrator:
     """Minimal TG-P2 orchestrator: echo text with optional memory note."""
@@ -74,19 +146,26 @@ class DefaultOrchestrator:
         *,
         enable_memory_hook: bool = False,
         memory_lookup: MemoryLookupFn | None = None,
+        max_parallel_lookups: int = 1,
     ) -> None:
-        self._enable_memory_hook = bool(enable_memory_hook)
-        self._memory_lookup = memory_lookup
-        self._diagnostics: list[dict[str, Any]] = []
+        # Resolved once; None when the memory hook is disabled.
+        self._memory_lookup: MemoryLookupFn | None = (
+            (memory_lookup or _default_memory_lookup) if enable_memory_hook else None
+        )
+        self._max_parallel_lookups = max(1, int(max_parallel_lookups))
+        self._diagnostics: deque[dict[str, Any]] = deque(maxlen=MAX_PENDING_DIAGNOSTICS)
+
+    @property
+    def batch_parallelism(self) -> int:
+        return self._max_parallel_lookups if self._memory_lookup is not None else 1
 
     def handle_message(self, inbound: InboundMessage, *, session_id: str) -> OutboundMessage | None:
         try:
-            text = f"echo: {inbound.text}"
-            if self._enable_memory_hook:
-                lookup = self._memory_lookup or _default_memory_lookup
-                memory_text = lookup(inbound.text)
-                if memory_text:
-                    text = f"{text}\n\nmemory: {memory_text}"
+            memory_text = self._memory_lookup(inbound.text) if self._memory_lookup is not None else None
+            if memory_text:
+                text = "".join((_ECHO_PREFIX, inbound.text, _MEMORY_SEPARATOR, memory_text))
+            else:
+                text = _ECHO_PREFIX + inbound.text
 
             return OutboundMessage(
                 chat_id=inbound.chat_id,
@@ -99,11 +178,21 @@ class DefaultOrchestrator:
                 {
                     "code": "orchestrator-error",
                     "update_id": inbound.update_id,
-                    "message": _sanitize_exception(exc),
+                    "message": sanitize_exception(exc),
                 }
             )
             return None
 
+    def handle_messages(self, batch: Sequence[tuple[InboundMessage, str]]) -> list[BatchResult]:
+        """Handle a batch; memory lookups are I/O-bound, so they overlap when parallelism is allowed."""
+        workers = min(len(batch), self._max_parallel_lookups) if self._memory_lookup is not None else 1
+        if workers <= 1:
+            return [self.handle_message(inbound, session_id=session_id) for inbound, session_id in batch]
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="memory-lookup") as executor:
+            return list(
+                executor.map(lambda item: self.handle_message(item[0], session_id=item[1]), batch)
+            )
+
     def drain_diagnostics(self) -> list[dict[str, Any]]:
         diagnostics = list(self._diagnostics)
         self._diagnostics.clear()
@@ -113,18 +202,41 @@ class DefaultOrchestrator:
 class AllowlistGateOrchestrator:
     """Wrapper that drops disallowed chat IDs before delegate orchestration."""
 
-    def __init__(self, delegate: OrchestratorPort, *, allowed_chat_ids: tuple[str, ...]) -> None:
+    def __init__(self, delegate: OrchestratorPort, *, allowed_chat_ids: Iterable[str]) -> None:
         self._delegate = delegate
-        self._allowed_chat_ids = {
-            normalized
-            for normalized in (_normalize_chat_id_value(value) for value in allowed_chat_ids)
-            if normalized is not None
-        }
-        self._diagnostics: list[dict[str, Any]] = []
+        self._allowed_chat_ids = _build_chat_id_allowlist(
+            allowed_chat_ids if isinstance(allowed_chat_ids, (tuple, frozenset)) else tuple(allowed_chat_ids)
+        )
+        self._diagnostics: deque[dict[str, Any]] = deque(maxlen=MAX_PENDING_DIAGNOSTICS)
+        # The delegate is fixed for the gate's lifetime; resolve its optional drains once.
+        self._delegate_drain_diagnostics = _optional_callable(delegate, "drain_diagnostics")
+        self._delegate_drain_context_telemetry = _optional_callable(delegate, "drain_context_telemetry")
+        if not self._allowed_chat_ids:
+            # No allowlist configured: forward straight to the delegate without per-message checks.
+            self.handle_message = delegate.handle_message  # type: ignore[method-assign]
+            self.handle_messages = partial(_handle_batch, delegate)  # type: ignore[method-assign]
+
+    @property
+    def batch_parallelism(self) -> int:
+        return _batch_parallelism(self._delegate)
 
     def handle_message(self, inbound: InboundMessage, *, session_id: str) -> OutboundMessage | None:
-        chat_id = _normalize_chat_id_value(inbound.chat_id)
-        if self._allowed_chat_ids and chat_id not in self._allowed_chat_ids:
+        if not self._admit(inbound):
+            return None
+        return self._delegate.handle_message(inbound, session_id=session_id)
+
+    def handle_messages(self, batch: Sequence[tuple[InboundMessage, str]]) -> list[BatchResult]:
+        results: list[BatchResult] = [None] * len(batch)
+        admitted = [index for index, (inbound, _) in enumerate(batch) if self._admit(inbound)]
+        delegated = _handle_batch(self._delegate, [batch[index] for index in admitted])
+        for index, result in zip(admitted, delegated):
+            results[index] = result
+        return results
+
+    def _admit(self, inbound: InboundMessage) -> bool:
+        if not self._allowed_chat_ids:
+            return True
+        if _normalize_chat_id_value(inbound.chat_id) not in self._allowed_chat_ids:
             self._diagnostics.append(
                 {
                     "code": "allowlist-drop",
@@ -133,23 +245,21 @@ class AllowlistGateOrchestrator:
                     "message": f"dropped update {inbound.update_id}: chat_id not allowlisted ({inbound.chat_id})",
                 }
             )
-            return None
-        return self._delegate.handle_message(inbound, session_id=session_id)
+            return False
+        return True
 
     def drain_diagnostics(self) -> list[dict[str, Any]]:
         diagnostics = list(self._diagnostics)
         self._diagnostics.clear()
 
-        delegate_drain = getattr(self._delegate, "drain_diagnostics", None)
-        if callable(delegate_drain):
-            diagnostics.extend(list(delegate_drain()))
+        if self._delegate_drain_diagnostics is not None:
+            diagnostics.extend(self._delegate_drain_diagnostics())
         return diagnostics
 
     def drain_context_telemetry(self) -> dict[str, Any]:
-        delegate_drain = getattr(self._delegate, "drain_context_telemetry", None)
-        if not callable(delegate_drain):
+        if self._delegate_drain_context_telemetry is None:
             return {}
-        drained = delegate_drain()
+        drained = self._delegate_drain_context_telemetry()
         if not isinstance(drained, Mapping):
             return {}
         return dict(drained)
@@ -168,19 +278,35 @@ class DurableContextCanaryOrchestrator:
     ) -> None:
         self._durable_delegate = durable_delegate
         self._baseline_delegate = baseline_delegate
-        self._canary_chat_ids = {
-            normalized
-            for normalized in (_normalize_chat_id_value(value) for value in canary_chat_ids)
-            if normalized is not None
-        }
+        self._canary_chat_ids = _build_chat_id_allowlist(tuple(canary_chat_ids))
         self._configured_mode = str(configured_mode).strip().lower()
 
+    @property
+    def batch_parallelism(self) -> int:
+        return max(_batch_parallelism(self._durable_delegate), _batch_parallelism(self._baseline_delegate))
+
     def handle_message(self, inbound: InboundMessage, *, session_id: str) -> OutboundMessage | None:
-        delegate = self._baseline_delegate
+        return self._route(inbound).handle_message(inbound, session_id=session_id)
+
+    def handle_messages(self, batch: Sequence[tuple[InboundMessage, str]]) -> list[BatchResult]:
+        results: list[BatchResult] = [None] * len(batch)
+        routed: dict[int, list[int]] = {}
+        delegates: dict[int, OrchestratorPort] = {}
+        for index, (inbound, _) in enumerate(batch):
+            delegate = self._route(inbound)
+            delegates[id(delegate)] = delegate
+            routed.setdefault(id(delegate), []).append(index)
+        for key, indexes in routed.items():
+            delegated = _handle_batch(delegates[key], [batch[index] for index in indexes])
+            for index, result in zip(indexes, delegated):
+                results[index] = result
+        return results
+
+    def _route(self, inbound: InboundMessage) -> OrchestratorPort:
         chat_id = _normalize_chat_id_value(inbound.chat_id)
         if chat_id in self._canary_chat_ids:
-            delegate = self._durable_delegate
-        return delegate.handle_message(inbound, session_id=session_id)
+            return self._durable_delegate
+        return self._baseline_delegate
 
     def drain_diagnostics(self) -> list[dict[str, Any]]:
         diagnostics: list[dict[str, Any]] = []
@@ -213,74 +339,103 @@ def run_cycle(
     memory_lookup: MemoryLookupFn | None = None,
     codex_invoke: CodexInvokeFn | None = None,
     failure_session_key: str = "telegram:runtime",
+    _allowlist_gate: AllowlistGateOrchestrator | None = None,
 ) -> dict[str, Any]:
     """Run one TG-P2 service cycle with default runtime wiring."""
-    cycle_started_at = time.perf_counter()
+    cycle_started_ns = time.perf_counter_ns()
     resolved_adapter = adapter or TelegramChannelAdapter(
         api_client or TelegramApiClient(config.token),
         cursor_state_store=_resolve_cursor_state_store(config.cursor_state_path),
         strict_state_io=config.strict_cursor_state_io,
     )
-    resolved_orchestrator = orchestrator or _resolve_default_orchestrator(
-        config=config,
-        enable_memory_hook=enable_memory_hook,
-        memory_lookup=memory_lookup,
-        codex_invoke=codex_invoke,
-    )
     emitter = heartbeat_emitter or HeartbeatEventEmitter()
     heartbeat_emit_attempts = 0
     heartbeat_emit_failures = 0
-    gated_orchestrator = AllowlistGateOrchestrator(
-        resolved_orchestrator,
-        allowed_chat_ids=config.allowed_chat_ids,
-    )
+    if _allowlist_gate is not None:
+        # run_loop's own gate, built from this config by _build_loop_dependencies.
+        gated_orchestrator = _allowlist_gate
+    else:
+        # Caller-supplied orchestrators (gates included) always get the configured allowlist.
+        gated_orchestrator = AllowlistGateOrchestrator(
+            orchestrator
+            or _resolve_default_orchestrator(
+                config=config,
+                enable_memory_hook=enable_memory_hook,
+                memory_lookup=memory_lookup,
+                codex_invoke=codex_invoke,
+            ),
+            allowed_chat_ids=config.allowed_chat_ids_set,
+        )
 
-    def _emit_failure(
+    def _prepare_failure_context(
         *,
-        text: str,
         base_context: Mapping[str, Any],
         fetch_total: int,
         send_total: int,
         drop_total: int,
-        context_telemetry: Mapping[str, Any],
-    ) -> bool:
+        context_metrics: _ContextMetrics,
+    ) -> dict[str, Any]:
         nonlocal heartbeat_emit_attempts
-        nonlocal heartbeat_emit_failures
-
-        if emitter.enabled:
-            heartbeat_emit_attempts += 1
 
+        heartbeat_emit_attempts += 1
         emit_state = _derive_heartbeat_emit_state(
-            enabled=emitter.enabled,
+            enabled=True,
             emit_attempted=heartbeat_emit_attempts,
             emit_failures=heartbeat_emit_failures,
         )
-        context = _build_failure_event_context(
+        return _build_failure_event_context(
             base_context=base_context,
             heartbeat_emit_state=emit_state,
             telemetry_digest=_build_telemetry_digest(
                 fetch_total=fetch_total,
                 send_total=send_total,
                 drop_total=drop_total,
-                cycle_total_ms=_elapsed_ms(cycle_started_at),
-                context_telemetry=context_telemetry,
+                cycle_total_ms=_elapsed_ms(cycle_started_ns),
+                context_metrics=context_metrics,
             ),
         )
+
+    def _emit_failure(
+        *,
+        text: str,
+        base_context: Mapping[str, Any],
+        fetch_total: int,
+        send_total: int,
+        drop_total: int,
+        context_metrics: _ContextMetrics,
+    ) -> bool:
+        nonlocal heartbeat_emit_failures
+
+        if not emitter.enabled:
+            # A disabled emitter publishes nothing; skip building the event context.
+            return False
+        context = _prepare_failure_context(
+            base_context=base_context,
+            fetch_total=fetch_total,
+            send_total=send_total,
+            drop_total=drop_total,
+            context_metrics=context_metrics,
+        )
         emitted = _emit_best_effort_failure(
             emitter,
             session_key=failure_session_key,
             text=text,
             context=context,
         )
-        if emitter.enabled and not emitted:
+        if not emitted:
             heartbeat_emit_failures += 1
         return emitted
 
     try:
-        result = dict(process_once(resolved_adapter, gated_orchestrator, ack_policy=config.ack_policy))
+        result = process_once(resolved_adapter, gated_orchestrator, ack_policy=config.ack_policy)
+        # process_once hands back a fresh dict the caller owns; only copy other mappings.
+        if not isinstance(result, dict):
+            result = dict(result)
     except Exception as exc:
-        message = _sanitize_exception(exc)
-        context_telemetry = _drain_context_telemetry(gated_orchestrator, context_mode=config.context_mode)
+        message = sanitize_exception(exc)
+        context_metrics = _extract_context_metrics(
+            _drain_context_telemetry(gated_orchestrator, context_mode=config.context_mode)
+        )
         _emit_failure(
             text=f"channel-runtime process_once exception: {message}",
             base_context={
@@ -292,9 +447,9 @@ def run_cycle(
             fetch_total=0,
             send_total=0,
             drop_total=0,
-            context_telemetry=context_telemetry,
+            context_metrics=context_metrics,
         )
-        detail = _build_error_detail(
+        detail = _build_error_detail_plain(
             code="runtime-process-once-exception",
             message=message,
             retryable=True,
@@ -303,117 +458,152 @@ def run_cycle(
             layer="runtime-wrapper",
             operation="run_cycle",
         )
-        failed_result = {
-            "status": "failed",
-            "reason": "runtime-process-once-exception",
-            "fetched_count": 0,
-            "sent_count": 0,
-            "acked_count": 0,
-            "ack_skipped_count": 0,
-            "error_count": 1,
-            "errors": [message],
-            "error_details": [detail],
-            "heartbeat_emit_failures": heartbeat_emit_failures,
-            "dropped_count": 0,
-            "dropped_updates": [],
-        }
+        failed_result = _failed_cycle_result(
+            reason="runtime-process-once-exception",
+            message=message,
+            detail=detail,
+            heartbeat_emit_failures=heartbeat_emit_failures,
+        )
         failed_result["runtime_digest"] = _build_runtime_digest(
             context_mode=config.context_mode,
-            context_telemetry=context_telemetry,
+            context_metrics=context_metrics,
         )
         failed_result["telemetry"] = _build_runtime_telemetry(
             fetch_total=0,
             send_total=0,
             drop_total=0,
             heartbeat_emit_failures=heartbeat_emit_failures,
-            cycle_total_ms=_elapsed_ms(cycle_started_at),
+            cycle_total_ms=_elapsed_ms(cycle_started_ns),
             heartbeat_emit_state=_derive_heartbeat_emit_state(
                 enabled=emitter.enabled,
                 emit_attempted=heartbeat_emit_attempts,
                 emit_failures=heartbeat_emit_failures,
             ),
             context_mode=config.context_mode,
-            context_telemetry=context_telemetry,
+            context_metrics=context_metrics,
         )
         return failed_result
 
-    diagnostics: list[DiagnosticEntry] = []
-    diagnostics.extend(_drain_diagnostics("orchestrator", gated_orchestrator))
-    diagnostics.extend(_drain_diagnostics("adapter", resolved_adapter))
-    context_telemetry = _drain_context_telemetry(gated_orchestrator, context_mode=config.context_mode)
+    diagnostics = chain(
+        _drain_diagnostics("orchestrator", gated_orchestrator),
+        _drain_diagnostics("adapter", resolved_adapter),
+    )
+    context_metrics = _extract_context_metrics(
+        _drain_context_telemetry(gated_orchestrator, context_mode=config.context_mode)
+    )
 
     dropped_updates: list[dict[str, str]] = []
-    diagnostic_errors: list[str] = []
-    service_error_details = _map_process_once_errors(result)
+    diagnostic_errors: deque[str] = deque(maxlen=_MAX_RESULT_ERRORS)
+    diagnostic_error_total = 0
+    pending_failures: list[FailureEntry] = []
+    service_reason = str(result.get("reason", "")).strip()
     diagnostic_error_details: list[dict[str, Any]] = []
+    # Result counters are read once; the diagnostic walk below reuses them per item.
+    fetch_total = int(result.get("fetched_count", 0))
+    send_total = int(result.get("sent_count", 0))
+    error_count = int(result.get("error_count", 0))
+    status_ok = result.get("status") == "ok"
 
-    if result.get("status") != "ok" or int(result.get("error_count", 0)) > 0:
+    if not status_ok or error_count > 0:
         _emit_failure(
             text=f"channel-runtime cycle failure: {result.get('reason', 'unknown')}",
             base_context={
                 "code": "service-cycle-error",
                 "status": result.get("status"),
                 "reason": result.get("reason"),
-                "error_count": int(result.get("error_count", 0)),
+                "error_count": error_count,
             },
-            fetch_total=int(result.get("fetched_count", 0)),
-            send_total=int(result.get("sent_count", 0)),
+            fetch_total=fetch_total,
+            send_total=send_total,
             drop_total=0,
-            context_telemetry=context_telemetry,
+            context_metrics=context_metrics,
         )
 
+    # _drain_diagnostics yields plain dicts, so unbound dict.get is safe; aliases skip per-item lookups.
+    item_get = dict.get
+    emit_enabled = emitter.enabled
+    append_detail = diagnostic_error_details.append
+    append_drop = dropped_updates.append
+    append_error = diagnostic_errors.append
     for source, item in diagnostics:
-        code = str(item.get("code", "")).strip()
-        mapped_detail = _map_runtime_diagnostic(source=source, item=item)
+        code = str(item_get(item, "code", "")).strip()
+        mapped_detail = _map_runtime_diagnostic(source=source, item=item, code=code)
         if mapped_detail is not None:
-            diagnostic_error_details.append(mapped_detail)
-        if code in {"allowlist-drop", "stale-drop"}:
-            dropped_updates.append(
+            append_detail(mapped_detail)
+        if code in _DROP_DIAGNOSTIC_CODES:
+            append_drop(
                 {
-                    "update_id": str(item.get("update_id", "")),
-                    "chat_id": str(item.get("chat_id", "")),
-                    "reason": str(item.get("message", f"{code or 'diagnostic'} drop")),
+                    "update_id": str(item_get(item, "update_id", "")),
+                    "chat_id": str(item_get(item, "chat_id", "")),
+                    "reason": str(item_get(item, "message", f"{code or 'diagnostic'} drop")),
                 }
             )
             continue
-        diagnostic_errors.append(str(item.get("message", "unknown")))
-        _emit_failure(
-            text=f"{source} failure: {item.get('message', 'unknown')}",
-            base_context=dict(item),
-            fetch_total=int(result.get("fetched_count", 0)),
-            send_total=int(result.get("sent_count", 0)),
-            drop_total=len(dropped_updates),
-            context_telemetry=context_telemetry,
-        )
+        message = str(item_get(item, "message", "unknown"))
+        append_error(message)
+        diagnostic_error_total += 1
+        if emit_enabled:
+            pending_failures.append(
+                (
+                    f"{source} failure: {message}",
+                    _prepare_failure_context(
+                        base_context=item,
+                        fetch_total=fetch_total,
+                        send_total=send_total,
+                        drop_total=len(dropped_updates),
+                        context_metrics=context_metrics,
+                    ),
+                )
+            )
+
+    if pending_failures:
+        emitted_flags = _emit_best_effort_failures(emitter, session_key=failure_session_key, entries=pending_failures)
+        heartbeat_emit_failures += sum(1 for emitted in emitted_flags if not emitted)
 
+    # process_once returns its own list[str]; extend it in place and only coerce foreign shapes.
+    errors = result.get("errors")
+    if not isinstance(errors, list):
+        errors = [str(err) for err in (errors or ())]
+        result["errors"] = errors
     if diagnostic_errors:
-        prior_errors = [str(err) for err in result.get("errors", [])]
-        result["errors"] = prior_errors + diagnostic_errors
-        result["error_count"] = int(result.get("error_count", 0)) + len(diagnostic_errors)
-        if result.get("status") == "ok":
+        errors.extend(diagnostic_errors)
+        result["error_count"] = error_count + diagnostic_error_total
+        if status_ok:
             result["reason"] = "completed-with-errors"
+    # The one place errors are bounded (newest win); error_count keeps the full total and
+    # only the service messages that survive are mapped into error_details.
+    if len(errors) > _MAX_RESULT_ERRORS:
+        del errors[:-_MAX_RESULT_ERRORS]
+    service_error_details = _map_process_once_errors(
+        errors[: len(errors) - len(diagnostic_errors)],
+        reason=service_reason,
+    )
 
     result["dropped_count"] = len(dropped_updates)
     result["dropped_updates"] = dropped_updates
     result["heartbeat_emit_failures"] = heartbeat_emit_failures
-    result["error_details"] = _dedupe_error_details(service_error_details + diagnostic_error_details)
+    if service_error_details or diagnostic_error_details:
+        result["error_details"] = _dedupe_error_details(service_error_details + diagnostic_error_details)
+    else:
+        # Idle and clean cycles (the steady state) have nothing to merge or dedupe.
+        result["error_details"] = []
     result["runtime_digest"] = _build_runtime_digest(
         context_mode=config.context_mode,
-        context_telemetry=context_telemetry,
+        context_metrics=context_metrics,
     )
     result["telemetry"] = _build_runtime_telemetry(
-        fetch_total=int(result.get("fetched_count", 0)),
-        send_total=int(result.get("sent_count", 0)),
-        drop_total=int(result.get("dropped_count", 0)),
+        fetch_total=fetch_total,
+        send_total=send_total,
+        drop_total=len(dropped_updates),
         heartbeat_emit_failures=heartbeat_emit_failures,
-        cycle_total_ms=_elapsed_ms(cycle_started_at),
+        cycle_total_ms=_elapsed_ms(cycle_started_ns),
         heartbeat_emit_state=_derive_heartbeat_emit_state(
             enabled=emitter.enabled,
             emit_attempted=heartbeat_emit_attempts,
             emit_failures=heartbeat_emit_failures,
         ),
         context_mode=config.context_mode,
-        context_telemetry=context_telemetry,
+        context_metrics=context_metrics,
     )
     return result
 
@@ -425,50 +615,51 @@ def run_loop(
     sleep_fn: Callable[[float], None] = time.sleep,
     on_cycle: Callable[[dict[str, Any]], None] | None = None,
     max_cycles: int | None = None,
+    monotonic_fn: Callable[[], float] = time.monotonic,
 ) -> dict[str, Any]:
     """Run either one cycle (--once) or a continuous polling loop."""
     cycles = 0
-    last_result: dict[str, Any] = {
-        "status": "ok",
-        "reason": "not-started",
-        "fetched_count": 0,
-        "sent_count": 0,
-        "acked_count": 0,
-        "ack_skipped_count": 0,
-        "error_count": 0,
-        "errors": [],
-    }
+    # Cycle starts are paced against fixed deadlines so cycle runtime does not stretch the poll period.
+    next_deadline = monotonic_fn()
+    # Every iteration assigns a result (or a failed one) before it is read.
+    last_result: dict[str, Any]
+    idle_streak = 0
+
+    # Default wiring is built once and reused so adapter cursor state and orchestrator
+    # sessions survive across cycles; custom run_cycle_fn callables keep the config-only call.
+    reuse_wiring = run_cycle_fn is run_cycle
+    cycle_kwargs: dict[str, Any] | None = None
 
     while True:
         cycles += 1
+        # Memoized memory snippets only dedupe lookups within a cycle; each cycle sees fresh memory.
+        invalidate_memory_cache()
         try:
-            last_result = dict(run_cycle_fn(config=config))
+            if reuse_wiring:
+                if cycle_kwargs is None:
+                    cycle_kwargs = _build_loop_dependencies(config)
+                # run_cycle always hands back a fresh dict; no defensive copy needed.
+                last_result = run_cycle_fn(config=config, **cycle_kwargs)
+            else:
+                last_result = dict(run_cycle_fn(config=config))
         except Exception as exc:
-            message = _sanitize_exception(exc)
-            last_result = {
-                "status": "failed",
-                "reason": "runtime-loop-cycle-exception",
-                "fetched_count": 0,
-                "sent_count": 0,
-                "acked_count": 0,
-                "ack_skipped_count": 0,
-                "error_count": 1,
-                "errors": [message],
-                "error_details": [
-                    _build_error_detail(
-                        code="runtime-loop-cycle-exception",
-                        message=message,
-                        retryable=True,
-                        source="runtime-wrapper",
-                        category="error",
-                        layer="runtime-wrapper",
-                        operation="run_loop",
-                    )
-                ],
-                "heartbeat_emit_failures": 0,
-                "dropped_count": 0,
-                "dropped_updates": [],
-            }
+            # Rebuild the wiring after an unexpected failure rather than reuse a broken instance.
+            cycle_kwargs = None
+            message = sanitize_exception(exc)
+            last_result = _failed_cycle_result(
+                reason="runtime-loop-cycle-exception",
+                message=message,
+                detail=_build_error_detail_plain(
+                    code="runtime-loop-cycle-exception",
+                    message=message,
+                    retryable=True,
+                    source="runtime-wrapper",
+                    category="error",
+                    layer="runtime-wrapper",
+                    operation="run_loop",
+                ),
+                heartbeat_emit_failures=0,
+            )
 
         if on_cycle is not None:
             on_cycle(last_result)
@@ -479,7 +670,71 @@ def run_loop(
         if max_cycles is not None and cycles >= max_cycles:
             return last_result
 
-        sleep_fn(config.poll_interval_s)
+        interval = config.poll_interval_s
+        if config.adaptive_poll:
+            if _fetched_count(last_result) > 0:
+                idle_streak = 0
+            else:
+                idle_streak += 1
+                interval = _backoff_poll_interval(config, idle_streak)
+        next_deadline += interval
+        now = monotonic_fn()
+        if next_deadline > now:
+            sleep_fn(next_deadline - now)
+        else:
+            # Overran the interval: start the next cycle now instead of bursting to catch up.
+            next_deadline = now
+
+
+def _fetched_count(result: Mapping[str, Any]) -> int:
+    try:
+        return int(result.get("fetched_count") or 0)
+    except (TypeError, ValueError):
+        return 0
+
+
+def _backoff_poll_interval(config: RuntimeConfig, idle_streak: int) -> float:
+    """Poll interval after ``idle_streak`` consecutive idle or failed cycles (the first keeps the base)."""
+    cap = max(config.max_poll_interval_s, config.poll_interval_s)
+    # Exponent is clamped; the cap is reached long before 2**16.
+    return min(config.poll_interval_s * (2 ** min(idle_streak - 1, 16)), cap)
+
+
+def _build_loop_dependencies(config: RuntimeConfig) -> dict[str, Any]:
+    """Default run_cycle wiring shared by every cycle of one run_loop."""
+    return {
+        "adapter": TelegramChannelAdapter(
+            TelegramApiClient(config.token),
+            cursor_state_store=_resolve_cursor_state_store(config.cursor_state_path),
+            strict_state_io=config.strict_cursor_state_io,
+        ),
+        "_allowlist_gate": AllowlistGateOrchestrator(
+            _resolve_default_orchestrator(
+                config=config,
+                enable_memory_hook=None,
+                memory_lookup=None,
+                codex_invoke=None,
+            ),
+            allowed_chat_ids=config.allowed_chat_ids_set,
+        ),
+        "heartbeat_emitter": HeartbeatEventEmitter(),
+    }
+
+
+def _failed_cycle_result(
+    *,
+    reason: str,
+    message: str,
+    detail: dict[str, Any],
+    heartbeat_emit_failures: int,
+) -> dict[str, Any]:
+    result = dict(_FAILED_RESULT_TEMPLATE)
+    result["reason"] = reason
+    result["errors"] = [message]
+    result["error_details"] = [detail]
+    result["heartbeat_emit_failures"] = heartbeat_emit_failures
+    result["dropped_updates"] = []
+    return result
 
 
 def _emit_best_effort_failure(
@@ -492,9 +747,40 @@ def _emit_best_effort_failure(
     return emitter.emit_failure(session_key=session_key, text=text, context=context)
 
 
-def _elapsed_ms(started_at: float) -> int:
-    elapsed = (time.perf_counter() - started_at) * 1000.0
-    return max(0, int(elapsed))
+def _emit_best_effort_failures(
+    emitter: HeartbeatEventEmitter,
+    *,
+    session_key: str,
+    entries: Sequence[FailureEntry],
+) -> list[bool]:
+    emit_failures = getattr(emitter, "emit_failures", None)
+    if callable(emit_failures):
+        return list(emit_failures(session_key=session_key, entries=entries))
+    return [emitter.emit_failure(session_key=session_key, text=text, context=context) for text, context in entries]
+
+
+def _emit_nothing(**_: Any) -> bool:
+    return False
+
+
+def _emit_nothing_batch(*, session_key: str, entries: Sequence[FailureEntry]) -> list[bool]:
+    return [False] * len(entries)
+
+
+# Disabled emitters are stateless no-ops, so callers can share one instance.
+HeartbeatEventEmitter.DISABLED = HeartbeatEventEmitter(enabled=False)
+
+
+def _event_context(context: Mapping[str, Any] | None) -> dict[str, Any]:
+    # run_cycle hands over freshly built dicts and publish_system_event copies its
+    # context, so only None and non-dict mappings need materializing here.
+    if context is None:
+        return {}
+    return context if type(context) is dict else dict(context)
+
+
+def _elapsed_ms(started_ns: int) -> int:
+    return max(0, (time.perf_counter_ns() - started_ns) // 1_000_000)
 
 
 def _derive_heartbeat_emit_state(*, enabled: bool, emit_attempted: int, emit_failures: int) -> str:
@@ -505,44 +791,76 @@ def _derive_heartbeat_emit_state(*, enabled: bool, emit_attempted: int, emit_fai
     return "emitted"
 
 
+@dataclass(frozen=True, slots=True)
+class _ContextMetrics:
+    """Context counters and gauges extracted once per cycle for the telemetry builders."""
+
+    mode: str
+    compaction_attempted_total: int
+    compaction_succeeded_total: int
+    compaction_failed_total: int
+    compaction_fallback_used_total: int
+    reason_threshold_total: int
+    reason_overflow_total: int
+    reason_manual_total: int
+    tokens_estimated_total: int
+    build_failures_total: int
+    current_tokens_estimate: int | None
+    summary_tokens_estimate: int | None
+    recent_tokens_estimate: int | None
+
+
+def _extract_context_metrics(context_telemetry: Mapping[str, Any]) -> _ContextMetrics:
+    counters = context_telemetry.get("counters")
+    gauges = context_telemetry.get("gauges")
+    if not isinstance(counters, Mapping):
+        counters = {}
+    if not isinstance(gauges, Mapping):
+        gauges = {}
+    reason_counters = counters.get("compaction_reasons")
+    return _ContextMetrics(
+        mode=str(context_telemetry.get("mode", "")).strip().lower(),
+        compaction_attempted_total=int(counters.get("compaction_attempted_total", 0)),
+        compaction_succeeded_total=int(counters.get("compaction_succeeded_total", 0)),
+        compaction_failed_total=int(counters.get("compaction_failed_total", 0)),
+        compaction_fallback_used_total=int(counters.get("compaction_fallback_used_total", 0)),
+        reason_threshold_total=_coerce_mapping_value(reason_counters, "threshold_total"),
+        reason_overflow_total=_coerce_mapping_value(reason_counters, "overflow_total"),
+        reason_manual_total=_coerce_mapping_value(reason_counters, "manual_total"),
+        tokens_estimated_total=int(counters.get("tokens_estimated_total", 0)),
+        build_failures_total=int(counters.get("build_failures_total", 0)),
+        current_tokens_estimate=_coerce_optional_int(gauges.get("current_tokens_estimate")),
+        summary_tokens_estimate=_coerce_optional_int(gauges.get("summary_tokens_estimate")),
+        recent_tokens_estimate=_coerce_optional_int(gauges.get("recent_tokens_estimate")),
+    )
+
+
 def _build_telemetry_digest(
     *,
     fetch_total: int,
     send_total: int,
     drop_total: int,
     cycle_total_ms: int,
-    context_telemetry: Mapping[str, Any],
+    context_metrics: _ContextMetrics,
 ) -> TelemetryDigest:
-    counters = context_telemetry.get("counters")
-    gauges = context_telemetry.get("gauges")
-    if not isinstance(counters, Mapping):
-        counters = {}
-    if not isinstance(gauges, Mapping):
-        gauges = {}
     return {
         "fetch_total": int(fetch_total),
         "send_total": int(send_total),
         "drop_total": int(drop_total),
         "cycle_total_ms": int(cycle_total_ms),
-        "context_mode": str(context_telemetry.get("mode", "")).strip().lower(),
-        "context_compaction_attempted_total": int(counters.get("compaction_attempted_total", 0)),
-        "context_compaction_succeeded_total": int(counters.get("compaction_succeeded_total", 0)),
-        "context_compaction_failed_total": int(counters.get("compaction_failed_total", 0)),
-        "context_compaction_fallback_used_total": int(counters.get("compaction_fallback_used_total", 0)),
-        "context_compaction_reason_threshold_total": int(
-            _coerce_mapping_value(counters.get("compaction_reasons"), "threshold_total")
-        ),
-        "context_compaction_reason_overflow_total": int(
-            _coerce_mapping_value(counters.get("compaction_reasons"), "overflow_total")
-        ),
-        "context_compaction_reason_manual_total": int(
-            _coerce_mapping_value(counters.get("compaction_reasons"), "manual_total")
-        ),
-        "context_tokens_estimated_total": int(counters.get("tokens_estimated_total", 0)),
-        "context_tokens_build_failures_total": int(counters.get("build_failures_total", 0)),
-        "context_current_tokens_estimate": _coerce_optional_int(gauges.get("current_tokens_estimate")),
-        "context_summary_tokens_estimate": _coerce_optional_int(gauges.get("summary_tokens_estimate")),
-        "context_recent_tokens_estimate": _coerce_optional_int(gauges.get("recent_tokens_estimate")),
+        "context_mode": context_metrics.mode,
+        "context_compaction_attempted_total": context_metrics.compaction_attempted_total,
+        "context_compaction_succeeded_total": context_metrics.compaction_succeeded_total,
+        "context_compaction_failed_total": context_metrics.compaction_failed_total,
+        "context_compaction_fallback_used_total": context_metrics.compaction_fallback_used_total,
+        "context_compaction_reason_threshold_total": context_metrics.reason_threshold_total,
+        "context_compaction_reason_overflow_total": context_metrics.reason_overflow_total,
+        "context_compaction_reason_manual_total": context_metrics.reason_manual_total,
+        "context_tokens_estimated_total": context_metrics.tokens_estimated_total,
+        "context_tokens_build_failures_total": context_metrics.build_failures_total,
+        "context_current_tokens_estimate": context_metrics.current_tokens_estimate,
+        "context_summary_tokens_estimate": context_metrics.summary_tokens_estimate,
+        "context_recent_tokens_estimate": context_metrics.recent_tokens_estimate,
     }
 
 
@@ -554,7 +872,7 @@ def _build_failure_event_context(
 ) -> dict[str, Any]:
     context = dict(base_context)
     context["heartbeat"] = {"emit_state": heartbeat_emit_state}
-    context["telemetry_digest"] = dict(telemetry_digest)
+    context["telemetry_digest"] = telemetry_digest
     return context
 
 
@@ -567,40 +885,25 @@ def _build_runtime_telemetry(
     cycle_total_ms: int,
     heartbeat_emit_state: str,
     context_mode: str,
-    context_telemetry: Mapping[str, Any],
+    context_metrics: _ContextMetrics,
 ) -> dict[str, Any]:
-    counters = context_telemetry.get("counters")
-    gauges = context_telemetry.get("gauges")
-    if not isinstance(counters, Mapping):
-        counters = {}
-    if not isinstance(gauges, Mapping):
-        gauges = {}
-    reason_counters = counters.get("compaction_reasons")
-    if not isinstance(reason_counters, Mapping):
-        reason_counters = {}
     return {
         "contract": _TELEMETRY_CONTRACT,
         "version": _TELEMETRY_VERSION,
         "context": {
             "mode": str(context_mode).strip().lower(),
             "compaction": {
-                "attempted_total": int(counters.get("compaction_attempted_total", 0)),
-                "succeeded_total": int(counters.get("compaction_succeeded_total", 0)),
-                "failed_total": int(counters.get("compaction_failed_total", 0)),
-                "fallback_used_total": int(counters.get("compaction_fallback_used_total", 0)),
+                "attempted_total": context_metrics.compaction_attempted_total,
+                "succeeded_total": context_metrics.compaction_succeeded_total,
+                "failed_total": context_metrics.compaction_failed_total,
+                "fallback_used_total": context_metrics.compaction_fallback_used_total,
                 "reasons": {
-                    "threshold_total": int(reason_counters.get("threshold_total", 0)),
-                    "overflow_total": int(reason_counters.get("overflow_total", 0)),
-                    "manual_total": int(reason_counters.get("manual_total", 0)),
+                    "threshold_total": context_metrics.reason_threshold_total,
+                    "overflow_total": context_metrics.reason_overflow_total,
+                    "manual_total": context_metrics.reason_manual_total,
                 },
             },
-            "tokens": {
-                "estimated_total": int(counters.get("tokens_estimated_total", 0)),
-                "build_failures_total": int(counters.get("build_failures_total", 0)),
-                "current_estimate": _coerce_optional_int(gauges.get("current_tokens_estimate")),
-                "summary_estimate": _coerce_optional_int(gauges.get("summary_tokens_estimate")),
-                "recent_estimate": _coerce_optional_int(gauges.get("recent_tokens_estimate")),
-            },
+            "tokens": _context_tokens_section(context_metrics),
         },
         "counters": {
             "fetch_total": int(fetch_total),
@@ -624,37 +927,47 @@ def _build_runtime_telemetry(
 def _build_runtime_digest(
     *,
     context_mode: str,
-    context_telemetry: Mapping[str, Any],
+    context_metrics: _ContextMetrics,
 ) -> dict[str, Any]:
-    counters = context_telemetry.get("counters")
-    gauges = context_telemetry.get("gauges")
-    if not isinstance(counters, Mapping):
-        counters = {}
-    if not isinstance(gauges, Mapping):
-        gauges = {}
     return {
         "context_mode": str(context_mode).strip().lower(),
         "context_compaction": {
-            "attempted_total": int(counters.get("compaction_attempted_total", 0)),
-            "succeeded_total": int(counters.get("compaction_succeeded_total", 0)),
-            "failed_total": int(counters.get("compaction_failed_total", 0)),
-            "fallback_used_total": int(counters.get("compaction_fallback_used_total", 0)),
-        },
-        "context_tokens": {
-            "estimated_total": int(counters.get("tokens_estimated_total", 0)),
-            "build_failures_total": int(counters.get("build_failures_total", 0)),
-            "current_estimate": _coerce_optional_int(gauges.get("current_tokens_estimate")),
-            "summary_estimate": _coerce_optional_int(gauges.get("summary_tokens_estimate")),
-            "recent_estimate": _coerce_optional_int(gauges.get("recent_tokens_estimate")),
+            "attempted_total": context_metrics.compaction_attempted_total,
+            "succeeded_total": context_metrics.compaction_succeeded_total,
+            "failed_total": context_metrics.compaction_failed_total,
+            "fallback_used_total": context_metrics.compaction_fallback_used_total,
         },
+        "context_tokens": _context_tokens_section(context_metrics),
+    }
+
+
+def _context_tokens_section(context_metrics: _ContextMetrics) -> dict[str, int | None]:
+    # Built per output: telemetry and digest must not alias the same nested dict.
+    return {
+        "estimated_total": context_metrics.tokens_estimated_total,
+        "build_failures_total": context_metrics.build_failures_total,
+        "current_estimate": context_metrics.current_tokens_estimate,
+        "summary_estimate": context_metrics.summary_tokens_estimate,
+        "recent_estimate": context_metrics.recent_tokens_estimate,
     }
 
 
+_MEMORY_HOOK_FLAG: bool | None = None
+
+
 def _resolve_memory_hook_flag(explicit: bool | None) -> bool:
+    global _MEMORY_HOOK_FLAG
     if explicit is not None:
         return bool(explicit)
-    raw = os.environ.get("CHANNEL_ENABLE_MEMORY_HOOK", "false")
-    return str(raw).strip().lower() in {"1", "true", "yes", "on"}
+    if _MEMORY_HOOK_FLAG is None:
+        # The env flag is process-wide; parse it on first use instead of every cycle.
+        _MEMORY_HOOK_FLAG = os.environ.get("CHANNEL_ENABLE_MEMORY_HOOK", "").strip().lower() in BOOL_TRUE_VALUES
+    return _MEMORY_HOOK_FLAG
+
+
+def _reset_memory_hook_flag_cache() -> None:
+    global _MEMORY_HOOK_FLAG
+    _MEMORY_HOOK_FLAG = None
 
 
 def _resolve_default_orchestrator(
@@ -689,17 +1002,33 @@ def _resolve_default_orchestrator(
     return DefaultOrchestrator(
         enable_memory_hook=_resolve_memory_hook_flag(enable_memory_hook),
         memory_lookup=memory_lookup,
+        max_parallel_lookups=config.memory_lookup_concurrency,
     )
 
 
+# Bound on first use so the optional memory/heartbeat packages are imported once, lazily.
+_memory_search_fn: Callable[..., Mapping[str, Any]] | None = None
+_publish_system_event_fn: PublishSystemEventFn | None = None
+
+
 def _default_memory_lookup(query: str) -> str | None:
-    from memory_system.api import memory_search
+    return _cached_memory_lookup(query, str(Path.cwd()))
 
-    response = memory_search(
+
+@lru_cache(maxsize=1024)
+def _cached_memory_lookup(query: str, workspace: str) -> str | None:
+    # Only the extracted snippet string is cached; memory_search rows are mutable dicts.
+    global _memory_search_fn
+    if _memory_search_fn is None:
+        from memory_system.api import memory_search
+
+        _memory_search_fn = memory_search
+
+    response = _memory_search_fn(
         query=query,
         maxResults=1,
         minScore=0.0,
-        workspace=Path.cwd(),
+        workspace=Path(workspace),
     )
     rows = response.get("results")
     if not isinstance(rows, list) or not rows:
@@ -714,16 +1043,38 @@ def _default_memory_lookup(query: str) -> str | None:
     return text or None
 
 
+def invalidate_memory_cache() -> None:
+    """Drop memoized default memory lookups, e.g. after the memory index changes."""
+    _cached_memory_lookup.cache_clear()
+
+
 def _default_publish_system_event(*, session_key: str, text: str, source: str, context: Mapping[str, Any]) -> dict[str, Any]:
-    from heartbeat_system.api import publish_system_event
+    global _publish_system_event_fn
+    if _publish_system_event_fn is None:
+        from heartbeat_system.api import publish_system_event
+
+        _publish_system_event_fn = publish_system_event
 
-    return publish_system_event(session_key=session_key, text=text, source=source, context=context)
+    return _publish_system_event_fn(session_key=session_key, text=text, source=source, context=context)
 
 
-def _sanitize_exception(exc: Exception) -> str:
-    raw = f"{type(exc).__name__}: {exc}".strip()
-    compact = " ".join(raw.split())
-    return compact[:500]
+def _batch_parallelism(delegate: OrchestratorPort) -> int:
+    return int(getattr(delegate, "batch_parallelism", 1) or 1)
+
+
+def _handle_batch(delegate: OrchestratorPort, batch: list[tuple[InboundMessage, str]]) -> list[BatchResult]:
+    if not batch:
+        return []
+    delegate_batch = getattr(delegate, "handle_messages", None)
+    if callable(delegate_batch):
+        return list(delegate_batch(batch))
+    results: list[BatchResult] = []
+    for inbound, session_id in batch:
+        try:
+            results.append(delegate.handle_message(inbound, session_id=session_id))
+        except Exception as exc:
+            results.append(exc)
+    return results
 
 
 def _resolve_cursor_state_store(path: str) -> DurableCursorStateStore | None:
@@ -733,30 +1084,50 @@ def _resolve_cursor_state_store(path: str) -> DurableCursorStateStore | None:
     return DurableCursorStateStore(Path(normalized))
 
 
-def _drain_diagnostics(source: str, target: Any) -> list[DiagnosticEntry]:
+def _optional_callable(target: Any, name: str) -> Callable[[], Any] | None:
+    attr = getattr(target, name, None)
+    return attr if callable(attr) else None
+
+
+def _drain_diagnostics(source: str, target: Any) -> Iterator[DiagnosticEntry]:
+    """Drain ``target`` now and stream its Mapping items, copying only non-dict mappings."""
     drain_fn = getattr(target, "drain_diagnostics", None)
     if not callable(drain_fn):
-        return []
+        return iter(())
 
     drained = drain_fn()
     if not isinstance(drained, list):
-        return []
+        return iter(())
 
-    diagnostics: list[DiagnosticEntry] = []
-    for item in drained:
-        if isinstance(item, Mapping):
-            diagnostics.append((source, dict(item)))
-    return diagnostics
+    return (
+        (source, item if type(item) is dict else dict(item))
+        for item in drained
+        if isinstance(item, Mapping)
+    )
+
+
+@lru_cache(maxsize=8)
+def _build_chat_id_allowlist(chat_ids: tuple[str, ...] | frozenset[str]) -> frozenset[str]:
+    """Normalized allowlist, shared by the gates run_cycle rebuilds every cycle."""
+    return frozenset(
+        normalized
+        for normalized in (_normalize_chat_id_value(value) for value in chat_ids)
+        if normalized is not None
+    )
 
 
 def _normalize_chat_id_value(value: object) -> str | None:
-    text = str(value).strip()
-    if not text:
-        return None
     try:
-        return str(int(text))
-    except ValueError:
-        return text
+        return _normalize_chat_id_cached(value)
+    except TypeError:
+        # Unhashable input cannot be memoized; normalize it directly.
+        return _normalize_chat_id_text(value)
+
+
+# Polling sees the same few chat ids repeatedly; typed so 1 and True stay distinct.
+@lru_cache(maxsize=1024, typed=True)
+def _normalize_chat_id_cached(value: object) -> str | None:
+    return _normalize_chat_id_text(value)
 
 
 def _build_codex_orchestrator(
@@ -793,6 +1164,7 @@ def _build_codex_orchestrator(
         compaction_service=compaction_service,
         compaction_policy=compaction_policy,
         enable_context_operator_controls=config.context_manual_compact,
+        max_parallel_sessions=config.concurrency,
     )
 
 
@@ -877,17 +1249,15 @@ def _first_non_none(first: object, second: object) -> object:
     return second
 
 
-def _map_process_once_errors(result: Mapping[str, Any]) -> list[dict[str, Any]]:
-    errors = [str(value) for value in result.get("errors", [])]
+def _map_process_once_errors(errors: Sequence[Any], *, reason: str) -> list[dict[str, Any]]:
     if not errors:
         return []
 
-    reason = str(result.get("reason", "")).strip()
     details: list[dict[str, Any]] = []
     if reason == "adapter-fetch-exception":
-        for message in errors:
+        for message in map(str, errors):
             details.append(
-                _build_error_detail(
+                _build_error_detail_plain(
                     code="adapter-fetch-exception",
                     message=message,
                     retryable=True,
@@ -899,13 +1269,13 @@ def _map_process_once_errors(result: Mapping[str, Any]) -> list[dict[str, Any]]:
             )
         return details
 
-    for message in errors:
+    for message in map(str, errors):
         details.append(_map_process_once_error_message(message))
     return details
 
 
 def _map_process_once_error_message(message: str) -> dict[str, Any]:
-    ack_match = re.match(r"^update\s+([^:]+):\s+ack failed:\s+(.+)$", message)
+    ack_match = _ACK_FAILED_RE.match(message) if "ack failed:" in message else None
     if ack_match is not None:
         update_id = str(ack_match.group(1)).strip()
         return _build_error_detail(
@@ -919,12 +1289,11 @@ def _map_process_once_error_message(message: str) -> dict[str, Any]:
             update_id=update_id,
         )
 
-    update_match = re.match(r"^update\s+([^:]+):\s+(.+)$", message)
+    update_match = _UPDATE_ERROR_RE.match(message)
     if update_match is not None:
         update_id = str(update_match.group(1)).strip()
         detail_message = str(update_match.group(2)).strip()
-        operation = _infer_service_operation(detail_message)
-        retryable = _infer_retryable_service_error(detail_message, operation=operation)
+        operation, retryable = _classify_service_error(detail_message)
         return _build_error_detail(
             code="update-processing-exception",
             message=message,
@@ -936,7 +1305,7 @@ def _map_process_once_error_message(message: str) -> dict[str, Any]:
             update_id=update_id,
         )
 
-    return _build_error_detail(
+    return _build_error_detail_plain(
         code="service-cycle-error",
         message=message,
         retryable=False,
@@ -947,41 +1316,26 @@ def _map_process_once_error_message(message: str) -> dict[str, Any]:
     )
 
 
-def _infer_service_operation(message: str) -> str:
+def _classify_service_error(message: str) -> tuple[str, bool]:
+    """Return ``(operation, retryable)`` for a process_once update error message."""
     normalized = message.lower()
-    if "ack failed" in normalized or "ack_update" in normalized:
-        return "ack_update"
-    if "send_message" in normalized or "send failed" in normalized:
-        return "send_message"
-    return "handle_message"
+    for token, operation in _SERVICE_OPERATION_TOKENS:
+        if token in normalized:
+            # Provider send/ack failures are always worth retrying.
+            return operation, True
+    return "handle_message", _RETRYABLE_ERROR_RE.search(normalized) is not None
 
 
-def _infer_retryable_service_error(message: str, *, operation: str) -> bool:
-    if operation in {"send_message", "ack_update"}:
-        return True
-    normalized = message.lower()
-    retryable_tokens = (
-        "timeout",
-        "temporar",
-        "connection",
-        "network",
-        "unavailable",
-        "too many requests",
-        "rate limit",
-    )
-    return any(token in normalized for token in retryable_tokens)
-
-
-def _map_runtime_diagnostic(*, source: str, item: Mapping[str, Any]) -> dict[str, Any] | None:
-    code = str(item.get("code", "")).strip()
-    message = str(item.get("message", "unknown"))
-    update_id = str(item.get("update_id", ""))
-    chat_id = str(item.get("chat_id", ""))
-    session_id = str(item.get("session_id", ""))
+def _map_runtime_diagnostic(*, source: str, item: Mapping[str, Any], code: str) -> dict[str, Any] | None:
+    """Map one drained diagnostic; ``code`` is the item's already-stripped code."""
+    message = str(item.get("message", "unknown")).strip()
+    update_id = str(item.get("update_id", "")).strip()
+    chat_id = str(item.get("chat_id", "")).strip()
+    session_id = str(item.get("session_id", "")).strip()
 
     if source == "orchestrator":
         if code == "allowlist-drop":
-            return _build_error_detail(
+            return _build_error_detail_trusted(
                 code="allowlist-drop",
                 message=message,
                 retryable=False,
@@ -999,7 +1353,7 @@ def _map_runtime_diagnostic(*, source: str, item: Mapping[str, Any]) -> dict[str
         operation = str(item.get("operation", "")).strip()
         if not operation:
             operation = _infer_context_diagnostic_operation(code) if is_context_code else "handle_message"
-        return _build_error_detail(
+        return _build_error_detail_trusted(
             code=code or "orchestrator-error",
             message=message,
             retryable=bool(item.get("retryable", False)),
@@ -1014,7 +1368,7 @@ def _map_runtime_diagnostic(*, source: str, item: Mapping[str, Any]) -> dict[str
 
     if source == "adapter":
         if code == "stale-drop":
-            return _build_error_detail(
+            return _build_error_detail_trusted(
                 code="stale-drop",
                 message=message,
                 retryable=False,
@@ -1034,7 +1388,7 @@ def _map_runtime_diagnostic(*, source: str, item: Mapping[str, Any]) -> dict[str
         else:
             operation = "fetch_updates"
             retryable = bool(item.get("retryable", False))
-        return _build_error_detail(
+        return _build_error_detail_trusted(
             code=code or "adapter-diagnostic-error",
             message=message,
             retryable=retryable,
@@ -1063,28 +1417,83 @@ def _build_error_detail(
     chat_id: str = "",
     session_id: str = "",
 ) -> dict[str, Any]:
+    return _build_error_detail_trusted(
+        code=str(code or "").strip(),
+        message=str(message or "").strip(),
+        retryable=bool(retryable),
+        source=str(source or "").strip(),
+        category=str(category or "").strip(),
+        layer=str(layer or "").strip(),
+        operation=str(operation or "").strip(),
+        update_id=str(update_id or "").strip(),
+        chat_id=str(chat_id or "").strip(),
+        session_id=str(session_id or "").strip(),
+    )
+
+
+def _build_error_detail_plain(
+    *,
+    code: str,
+    message: str,
+    retryable: bool,
+    source: str,
+    category: str,
+    layer: str,
+    operation: str,
+) -> dict[str, Any]:
+    """Build a detail with empty update/chat/session context.
+
+    For internal call sites whose other fields are literals; only ``message``
+    still needs stripping.
+    """
+    return _build_error_detail_trusted(
+        code=code,
+        message=message.strip(),
+        retryable=retryable,
+        source=source,
+        category=category,
+        layer=layer,
+        operation=operation,
+    )
+
+
+def _build_error_detail_trusted(
+    *,
+    code: str,
+    message: str,
+    retryable: bool,
+    source: str,
+    category: str,
+    layer: str,
+    operation: str,
+    update_id: str = "",
+    chat_id: str = "",
+    session_id: str = "",
+) -> dict[str, Any]:
+    """Build a detail from values the caller has already stringified and stripped."""
     detail = {
-        "code": str(code or "").strip(),
-        "message": str(message or "").strip(),
-        "retryable": bool(retryable),
+        "code": code,
+        "message": message,
+        "retryable": retryable,
         "context": {
-            "update_id": str(update_id or "").strip(),
-            "chat_id": str(chat_id or "").strip(),
-            "session_id": str(session_id or "").strip(),
-            "layer": str(layer or "").strip(),
-            "operation": str(operation or "").strip(),
+            "update_id": update_id,
+            "chat_id": chat_id,
+            "session_id": session_id,
+            "layer": layer,
+            "operation": operation,
         },
-        "source": str(source or "").strip(),
-        "category": str(category or "").strip(),
+        "source": source,
+        "category": category,
     }
-    fingerprint = _detail_fingerprint(detail)
-    detail["diagnostic_id"] = hashlib.sha256(
-        "|".join(fingerprint).encode("utf-8")
-    ).hexdigest()[:16]
+    # Same field order as _detail_fingerprint, without re-reading the dict.
+    # Display id only; deduplication compares the fields themselves.
+    fingerprint = "|".join((code, message, update_id, chat_id, session_id, layer, operation, category)).encode("utf-8")
+    detail["diagnostic_id"] = hashlib.blake2b(fingerprint, digest_size=8).hexdigest()
     return detail
 
 
 def _detail_fingerprint(detail: Mapping[str, Any]) -> tuple[str, ...]:
+    """Identity fields of a detail; the dedup key."""
     context = detail.get("context")
     if not isinstance(context, Mapping):
         context = {}
@@ -1101,13 +1510,15 @@ def _detail_fingerprint(detail: Mapping[str, Any]) -> tuple[str, ...]:
 
 
 def _dedupe_error_details(details: list[dict[str, Any]]) -> list[dict[str, Any]]:
+    # Keyed on the field tuple, not diagnostic_id: the digest of a pipe-joined string is
+    # for display only and can collide when fields themselves contain "|".
     unique: list[dict[str, Any]] = []
     seen: set[tuple[str, ...]] = set()
     for detail in details:
-        fingerprint = _detail_fingerprint(detail)
-        if fingerprint in seen:
+        key = _detail_fingerprint(detail)
+        if key in seen:
             continue
-        seen.add(fingerprint)
+        seen.add(key)
         unique.append(detail)
     return unique
 
@@ -2,6 +2,7 @@ from __future__ import annotations
 
 import sys
 import tempfile
+import threading
 import unittest
 from pathlib import Path
 from unittest import mock
@@ -19,6 +20,7 @@ from channel_runtime.codex_orchestrator import (
     CodexOrchestrator,
     CodexSessionManager,
     CodexSessionPolicy,
+    MAX_PENDING_DIAGNOSTICS,
     _default_codex_invoke,
 )
 
@@ -620,6 +622,23 @@ class TestCodexOrchestrator(unittest.TestCase):
         self.assertTrue(diagnostics[0]["retryable"])
         self.assertIn("RuntimeError: codex unavailable", diagnostics[0]["message"])
 
+    def test_diagnostics_buffer_is_bounded_and_keeps_newest(self) -> None:
+        def _invoke(_: CodexInvocationRequest) -> str | None:
+            raise RuntimeError("codex unavailable")
+
+        orchestrator = CodexOrchestrator(invoke_fn=_invoke)
+        for index in range(MAX_PENDING_DIAGNOSTICS + 5):
+            orchestrator.handle_message(_inbound(str(index)), session_id="telegram:100")
+
+        diagnostics = orchestrator.drain_diagnostics()
+        self.assertEqual(len(diagnostics), MAX_PENDING_DIAGNOSTICS)
+        self.assertEqual(diagnostics[0]["update_id"], "5")
+        self.assertEqual(
+            set(diagnostics[-1]),
+            {"code", "update_id", "session_id", "retryable", "message"},
+        )
+        self.assertEqual(orchestrator.drain_diagnostics(), [])
+
     def test_context_subsystem_failure_records_context_layer_and_operation(self) -> None:
         def _invoke(_: CodexInvocationRequest) -> str | None:
             raise ContextStoreError(
@@ -709,6 +728,29 @@ class TestCodexOrchestrator(unittest.TestCase):
         self.assertEqual(session_two["invoke_count"], 1)
         self.assertEqual(set(manager.list_session_ids()), {"telegram:1", "telegram:2"})
 
+    def test_batch_stamps_activity_after_a_slow_invoke(self) -> None:
+        now = {"value": 100.0}
+
+        def _slow_invoke(_: CodexInvocationRequest) -> str:
+            now["value"] += 30.0
+            return "ok"
+
+        manager = CodexSessionManager(clock=lambda: now["value"])
+        orchestrator = CodexOrchestrator(invoke_fn=_slow_invoke, session_manager=manager)
+
+        orchestrator.handle_messages(
+            [(_inbound("1", chat_id="1"), "telegram:1"), (_inbound("2", chat_id="2"), "telegram:2")]
+        )
+
+        session_one = manager.describe("telegram:1")
+        session_two = manager.describe("telegram:2")
+        assert session_one is not None
+        assert session_two is not None
+        self.assertEqual(session_one["created_at_s"], 100.0)
+        self.assertEqual(session_one["last_activity_s"], 130.0)
+        self.assertEqual(session_two["created_at_s"], 130.0)
+        self.assertEqual(session_two["last_activity_s"], 160.0)
+
     def test_idle_cleanup_and_capacity_eviction_are_deterministic(self) -> None:
         now = {"value": 0.0}
 
@@ -735,6 +777,135 @@ class TestCodexOrchestrator(unittest.TestCase):
         self.assertEqual(set(manager.list_session_ids()), {"s-30", "s-40"})
         self.assertIsNone(manager.describe("s-20"))
 
+    def test_handle_messages_fans_out_across_sessions_in_order(self) -> None:
+        barrier = threading.Barrier(2, timeout=2.0)
+        calls: list[tuple[str, str]] = []
+
+        def _invoke(request: CodexInvocationRequest) -> str | None:
+            if request.update_id in {"1", "2"}:
+                # Both sessions must be in flight at once to get past the barrier.
+                barrier.wait()
+            calls.append((request.session_id, request.update_id))
+            return f"reply-{request.update_id}"
+
+        self.assertEqual(CodexOrchestrator(invoke_fn=_invoke).batch_parallelism, 1)
+        orchestrator = CodexOrchestrator(invoke_fn=_invoke, max_parallel_sessions=2)
+        batch = [
+            (_inbound("1", chat_id="1"), "telegram:1"),
+            (_inbound("2", chat_id="2"), "telegram:2"),
+            (_inbound("3", chat_id="1"), "telegram:1"),
+        ]
+
+        results = orchestrator.handle_messages(batch)
+
+        self.assertEqual([item.text for item in results], ["reply-1", "reply-2", "reply-3"])
+        session_one_calls = [update_id for session_id, update_id in calls if session_id == "telegram:1"]
+        self.assertEqual(session_one_calls, ["1", "3"])
+        history = orchestrator._session_manager.conversation_history("telegram:1")
+        self.assertEqual([turn["assistant_text"] for turn in history], ["reply-1", "reply-3"])
+
+    def test_in_flight_session_survives_eviction_by_parallel_worker(self) -> None:
+        other_started = threading.Event()
+
+        def _invoke(request: CodexInvocationRequest) -> str | None:
+            if request.update_id == "1":
+                # Hold session one's call open while session two begins and evicts.
+                other_started.wait(timeout=2.0)
+            elif request.update_id == "2":
+                other_started.set()
+            return f"reply-{request.update_id}"
+
+        manager = CodexSessionManager(policy=CodexSessionPolicy(max_sessions=1, idle_ttl_s=600.0))
+        orchestrator = CodexOrchestrator(invoke_fn=_invoke, session_manager=manager, max_parallel_sessions=2)
+        orchestrator.handle_message(_inbound("0", chat_id="1"), session_id="telegram:1")
+
+        orchestrator.handle_messages(
+            [
+                (_inbound("1", chat_id="1"), "telegram:1"),
+                (_inbound("2", chat_id="2"), "telegram:2"),
+            ]
+        )
+
+        history = manager.conversation_history("telegram:1")
+        self.assertEqual([turn["assistant_text"] for turn in history], ["reply-0", "reply-1"])
+
+    def test_handle_messages_rereads_session_clock_only_after_each_invoke(self) -> None:
+        reads: list[float] = []
+
+        def _clock() -> float:
+            reads.append(float(len(reads)))
+            return reads[-1]
+
+        manager = CodexSessionManager(clock=_clock)
+        orchestrator = CodexOrchestrator(invoke_fn=lambda _: "ok", session_manager=manager)
+
+        orchestrator.handle_messages(
+            [
+                (_inbound("1", chat_id="1"), "telegram:1"),
+                (_inbound("2", chat_id="2"), "telegram:2"),
+                (_inbound("3", chat_id="1"), "telegram:1"),
+            ]
+        )
+
+        # One reading at batch start, then one after each of the three invokes.
+        self.assertEqual(len(reads), 4)
+        self.assertEqual(manager.describe("telegram:1")["last_activity_s"], 2.0)
+        self.assertEqual(manager.describe("telegram:2")["created_at_s"], 2.0)
+        manager.begin("telegram:3")
+        self.assertEqual(len(reads), 5)
+
+    def test_describe_reuses_read_only_snapshot_until_session_changes(self) -> None:
+        now = {"value": 1.0}
+        manager = CodexSessionManager(clock=lambda: now["value"])
+        manager.begin("s-1")
+
+        first = manager.describe("s-1")
+        self.assertIs(manager.describe("s-1"), first)
+        with self.assertRaises(TypeError):
+            first["invoke_count"] = 5  # type: ignore[index]
+
+        now["value"] = 2.0
+        manager.record_success("s-1")
+        updated = manager.describe("s-1")
+        self.assertIsNot(updated, first)
+        self.assertEqual((first["invoke_count"], updated["invoke_count"]), (0, 1))
+        self.assertEqual(updated["last_activity_s"], 2.0)
+
+    def test_cleanup_returns_evicted_ids_least_recently_active_first(self) -> None:
+        now = {"value": 0.0}
+        manager = CodexSessionManager(
+            policy=CodexSessionPolicy(max_sessions=5, idle_ttl_s=5.0),
+            clock=lambda: now["value"],
+        )
+        for session_id in ("s-b", "s-a", "s-c"):
+            manager.begin(session_id)
+        now["value"] += 1
+        manager.begin("s-b")
+        now["value"] += 3
+        manager.begin("s-a")
+        now["value"] += 2.5
+
+        # s-b was touched after s-c, so it is evicted after s-c despite being created first.
+        self.assertEqual(manager.cleanup(), ("s-c", "s-b"))
+        self.assertEqual(manager.list_session_ids(), ("s-a",))
+        self.assertEqual(manager.cleanup(), ())
+
+    def test_capacity_eviction_drops_least_recently_active_session(self) -> None:
+        now = {"value": 0.0}
+        manager = CodexSessionManager(
+            policy=CodexSessionPolicy(max_sessions=2, idle_ttl_s=600.0),
+            clock=lambda: now["value"],
+        )
+        manager.begin("s-1")
+        now["value"] += 1
+        manager.begin("s-2")
+        now["value"] += 1
+        manager.record_success("s-1")
+        now["value"] += 1
+        manager.begin("s-3")
+
+        self.assertEqual(manager.list_session_ids(), ("s-1", "s-3"))
+
     def test_timeout_records_session_timeout_diagnostic_and_state(self) -> None:
         now = {"value": 50.0}
 
@@ -821,6 +992,28 @@ class TestDefaultCodexInvoke(unittest.TestCase):
 
         self.assertEqual(run_mock.call_args.kwargs["timeout"], 12.5)
 
+    def test_invoke_payload_is_compact_sorted_json(self) -> None:
+        request = CodexInvocationRequest(
+            session_id="telegram:100",
+            chat_id="100",
+            user_id="u-1",
+            text="héllo",
+            update_id="1",
+            message_id=None,
+            conversation_history=({"user_text": "hi", "assistant_text": None},),
+        )
+
+        with mock.patch("channel_runtime.codex_orchestrator.subprocess.run") as run_mock:
+            run_mock.return_value = mock.Mock(returncode=0, stdout="ok", stderr="")
+            _default_codex_invoke(request, timeout_s=1.0)
+
+        payload = run_mock.call_args.args[0][7]
+        self.assertEqual(
+            payload,
+            '{"chat_id":"100","conversation_history":[{"assistant_text":null,"user_text":"hi"}],'
+            '"message_id":null,"session_id":"telegram:100","text":"héllo","update_id":"1","user_id":"u-1"}',
+        )
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -1,11 +1,16 @@
 from __future__ import annotations
 
+import copy
+import io
+import json
+import pickle
 import sys
 import tempfile
+import threading
 import unittest
-from dataclasses import dataclass, field
+from dataclasses import FrozenInstanceError, dataclass, field
 from pathlib import Path
-from typing import Any, Callable
+from typing import Any, Callable, NamedTuple
 from unittest.mock import patch
 
 sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
@@ -23,7 +28,14 @@ from channel_runtime.config import (
 )
 from channel_runtime.context.contracts import ContextTurn
 from channel_runtime.context.store import ContextStore
-from channel_runtime.runner import DefaultOrchestrator, HeartbeatEventEmitter, run_cycle, run_loop
+from channel_runtime import runner as runtime_runner
+from channel_runtime.runner import (
+    AllowlistGateOrchestrator,
+    DefaultOrchestrator,
+    HeartbeatEventEmitter,
+    run_cycle,
+    run_loop,
+)
 from telegram_channel.adapter import TelegramChannelAdapter
 from telegram_channel.api import TelegramApiError
 
@@ -222,6 +234,74 @@ class TestRuntimeConfig(unittest.TestCase):
         with self.assertRaisesRegex(ConfigValidationError, "poll_interval_s must be a positive number"):
             parse_runtime_config([], env={"CHANNEL_TOKEN": "x", "CHANNEL_POLL_INTERVAL_S": "0"})
 
+    def test_parse_runtime_config_memoizes_on_channel_inputs(self) -> None:
+        env = {"CHANNEL_TOKEN": "x", "UNRELATED": "1"}
+        first = parse_runtime_config(["--poll-interval-s", "3"], env=env)
+
+        self.assertIs(parse_runtime_config(["--poll-interval-s", "3"], env={**env, "UNRELATED": "2"}), first)
+        changed = parse_runtime_config(["--poll-interval-s", "3"], env={**env, "CHANNEL_LIVE_MODE": "false"})
+        self.assertIsNot(changed, first)
+        self.assertEqual(parse_runtime_config(["--poll-interval-s", "4"], env=env).poll_interval_s, 4.0)
+
+    def test_parsed_config_matches_directly_constructed_config(self) -> None:
+        parsed = parse_runtime_config(
+            ["--ack-policy", " On-Success ", "--allowed-chat-ids", "1,2", "--live-mode", "true"],
+            env={"CHANNEL_TOKEN": " tok ", "CHANNEL_CONTEXT_MODE": "DURABLE"},
+        )
+        direct = RuntimeConfig(
+            token=" tok ",
+            ack_policy=" On-Success ",
+            allowed_chat_ids=("1", "2"),
+            live_mode=True,
+            context_mode="DURABLE",
+            context_compaction_cooldown_s=300.0,
+        )
+
+        self.assertEqual(parsed, direct)
+        self.assertEqual(parsed.allowed_chat_ids_set, frozenset({"1", "2"}))
+        self.assertEqual(direct.allowed_chat_ids_set, parsed.allowed_chat_ids_set)
+        self.assertEqual(
+            RuntimeConfig(token="x", allowed_chat_ids=("007", "-0100", "@ops")).allowed_chat_ids_set,
+            frozenset({"7", "-100", "@ops"}),
+        )
+        with self.assertRaisesRegex(ConfigValidationError, "ack_policy must be 'always' or 'on-success'"):
+            parse_runtime_config(["--ack-policy", "sometimes"], env={"CHANNEL_TOKEN": "x"})
+
+    def test_runtime_config_is_frozen_and_slotted(self) -> None:
+        config = RuntimeConfig(token="x", allowed_chat_ids=("1",))
+
+        with self.assertRaises(FrozenInstanceError):
+            config.token = "y"  # type: ignore[misc]
+        with self.assertRaises(FrozenInstanceError):
+            del config.allowed_chat_ids_set  # type: ignore[misc]
+        with self.assertRaises(AttributeError):
+            object.__setattr__(config, "ad_hoc", 1)
+        self.assertFalse(hasattr(config, "__dict__"))
+        self.assertEqual(hash(config), hash(RuntimeConfig(token="x", allowed_chat_ids=("1",))))
+        self.assertNotIn("allowed_chat_ids_set", repr(config))
+
+    def test_runtime_config_supports_copy_pickle_and_replace(self) -> None:
+        config = RuntimeConfig(token="x", allowed_chat_ids=("007",), concurrency=2)
+
+        for restored in (copy.copy(config), copy.deepcopy(config), pickle.loads(pickle.dumps(config))):
+            self.assertEqual(restored, config)
+            self.assertEqual(restored.allowed_chat_ids_set, frozenset({"7"}))
+
+        updated = config.replace(allowed_chat_ids=("42",), poll_interval_s=5.0)
+        self.assertEqual((updated.allowed_chat_ids_set, updated.poll_interval_s), (frozenset({"42"}), 5.0))
+        self.assertEqual((updated.concurrency, config.poll_interval_s), (2, 2.0))
+        with self.assertRaisesRegex(ConfigValidationError, "concurrency must be an integer >= 1"):
+            config.replace(concurrency=0)
+        with self.assertRaisesRegex(TypeError, "unexpected field"):
+            config.replace(allowed_chat_ids_set=frozenset())
+
+    def test_cli_rejects_unknown_and_incomplete_flags(self) -> None:
+        with self.assertRaisesRegex(ConfigValidationError, "unknown argument: --bogus"):
+            parse_runtime_config(["--bogus", "1"], env={"CHANNEL_TOKEN": "x"})
+
+        with self.assertRaisesRegex(ConfigValidationError, "missing value for --poll-interval-s"):
+            parse_runtime_config(["--once", "--poll-interval-s"], env={"CHANNEL_TOKEN": "x"})
+
     def test_invalid_allowlist_fails_fast(self) -> None:
         with self.assertRaisesRegex(ConfigValidationError, "allowed_chat_ids must not contain empty values"):
             parse_runtime_config([], env={"CHANNEL_TOKEN": "x", "CHANNEL_ALLOWED_CHAT_IDS": "1,,3"})
@@ -315,6 +395,36 @@ class TestRuntimeConfig(unittest.TestCase):
         with self.assertRaisesRegex(ConfigValidationError, "codex_session_idle_ttl_s must be a positive number"):
             parse_runtime_config([], env={"CHANNEL_TOKEN": "x", "CHANNEL_CODEX_SESSION_IDLE_TTL_S": "0"})
 
+    def test_concurrency_parsed_validated_and_wired_to_codex_orchestrator(self) -> None:
+        self.assertEqual(parse_runtime_config([], env={"CHANNEL_TOKEN": "x"}).concurrency, 1)
+        cfg = parse_runtime_config(
+            ["--concurrency", "2"],
+            env={"CHANNEL_TOKEN": "x", "CHANNEL_CONCURRENCY": "8", "CHANNEL_ORCHESTRATOR_MODE": "codex"},
+        )
+        self.assertEqual(cfg.concurrency, 2)
+        with self.assertRaisesRegex(ConfigValidationError, "concurrency must be an integer >= 1"):
+            parse_runtime_config([], env={"CHANNEL_TOKEN": "x", "CHANNEL_CONCURRENCY": "0"})
+
+        orchestrator = runtime_runner._build_codex_orchestrator(config=cfg, codex_invoke=None, context_mode="legacy")
+        self.assertEqual(orchestrator._max_parallel_sessions, 2)
+
+    def test_memory_lookup_concurrency_is_separate_from_codex_concurrency(self) -> None:
+        cfg = parse_runtime_config(["--concurrency", "4"], env={"CHANNEL_TOKEN": "x"})
+        self.assertEqual(cfg.memory_lookup_concurrency, 1)
+        default = runtime_runner._resolve_default_orchestrator(
+            config=cfg, enable_memory_hook=True, memory_lookup=lambda _: None, codex_invoke=None
+        )
+        self.assertEqual(default.batch_parallelism, 1)
+
+        cfg = parse_runtime_config([], env={"CHANNEL_TOKEN": "x", "CHANNEL_MEMORY_LOOKUP_CONCURRENCY": "3"})
+        self.assertEqual((cfg.concurrency, cfg.memory_lookup_concurrency), (1, 3))
+        tuned = runtime_runner._resolve_default_orchestrator(
+            config=cfg, enable_memory_hook=True, memory_lookup=lambda _: None, codex_invoke=None
+        )
+        self.assertEqual(tuned.batch_parallelism, 3)
+        with self.assertRaisesRegex(ConfigValidationError, "memory_lookup_concurrency must be an integer >= 1"):
+            parse_runtime_config([], env={"CHANNEL_TOKEN": "x", "CHANNEL_MEMORY_LOOKUP_CONCURRENCY": "0"})
+
     def test_invalid_context_policy_fields_rejected(self) -> None:
         with self.assertRaisesRegex(ConfigValidationError, "context_window_tokens must be an integer >= 1"):
             parse_runtime_config([], env={"CHANNEL_TOKEN": "x", "CHANNEL_CONTEXT_WINDOW_TOKENS": "0"})
@@ -369,11 +479,13 @@ class _AdapterStub:
     fail_ack_ids: set[str] = field(default_factory=set)
     send_call_count: int = 0
     fail_send_calls: set[int] = field(default_factory=set)
+    send_batch_sizes: list[int] = field(default_factory=list)
+    ack_batches: list[list[str]] = field(default_factory=list)
 
     def fetch_updates(self) -> list[InboundMessage]:
         if self.fetch_exc is not None:
             raise self.fetch_exc
-        return list(self.updates)
+        return self.updates
 
     def send_message(self, outbound: OutboundMessage) -> None:
         self.send_call_count += 1
@@ -381,11 +493,28 @@ class _AdapterStub:
             raise ChannelRuntimeError("send failed")
         self.sent.append(outbound)
 
+    def send_messages(self, outbounds: list[OutboundMessage]) -> list[Exception | None]:
+        self.send_batch_sizes.append(len(outbounds))
+        results: list[Exception | None] = []
+        for outbound in outbounds:
+            try:
+                self.send_message(outbound)
+                results.append(None)
+            except Exception as exc:
+                results.append(exc)
+        return results
+
     def ack_update(self, update_id: str) -> None:
         if update_id in self.fail_ack_ids:
             raise ChannelRuntimeError("ack failed")
         self.acked.append(update_id)
 
+    def ack_updates(self, update_ids: list[str]) -> None:
+        self.ack_batches.append(list(update_ids))
+        if self.fail_ack_ids.intersection(update_ids):
+            raise ChannelRuntimeError("batch ack failed")
+        self.acked.extend(update_ids)
+
 
 @dataclass
 class _DiagnosticAdapterStub:
@@ -409,10 +538,17 @@ class _DiagnosticAdapterStub:
         return drained
 
 
+class _HeartbeatCall(NamedTuple):
+    session_key: str
+    text: str
+    source: str
+    context: dict[str, Any]
+
+
 class _RecordingPublisher:
     def __init__(self, *, fail: bool = False) -> None:
         self.fail = fail
-        self.calls: list[dict[str, Any]] = []
+        self.calls: list[_HeartbeatCall] = []
 
     def __call__(
         self,
@@ -424,13 +560,7 @@ class _RecordingPublisher:
     ) -> dict[str, Any]:
         if self.fail:
             raise RuntimeError("heartbeat unavailable")
-        payload = {
-            "session_key": session_key,
-            "text": text,
-            "source": source,
-            "context": context,
-        }
-        self.calls.append(payload)
+        self.calls.append(_HeartbeatCall(session_key, text, source, context))
         return {"status": "accepted"}
 
 
@@ -523,9 +653,9 @@ class TestRuntimeRunnerP2(unittest.TestCase):
         adapter = TelegramChannelAdapter(api)
         config = RuntimeConfig(token="tkn", ack_policy="on-success", allowed_chat_ids=("100",))
 
-        first = run_cycle(config=config, adapter=adapter, heartbeat_emitter=HeartbeatEventEmitter(enabled=False))
-        second = run_cycle(config=config, adapter=adapter, heartbeat_emitter=HeartbeatEventEmitter(enabled=False))
-        third = run_cycle(config=config, adapter=adapter, heartbeat_emitter=HeartbeatEventEmitter(enabled=False))
+        first = run_cycle(config=config, adapter=adapter, heartbeat_emitter=HeartbeatEventEmitter.DISABLED)
+        second = run_cycle(config=config, adapter=adapter, heartbeat_emitter=HeartbeatEventEmitter.DISABLED)
+        third = run_cycle(config=config, adapter=adapter, heartbeat_emitter=HeartbeatEventEmitter.DISABLED)
 
         self.assertEqual(first["status"], "ok")
         self.assertEqual(first["sent_count"], 1)
@@ -548,13 +678,75 @@ class TestRuntimeRunnerP2(unittest.TestCase):
         self.assertEqual(api.offset_calls, [None, 3, 3])
         self.assertEqual([payload["text"] for payload in api.sent_payloads], ["echo: first", "echo: retry-me"])
 
+    def test_idle_cycle_still_reports_adapter_drops(self) -> None:
+        @dataclass
+        class _StaleDropAdapter(_AdapterStub):
+            diagnostics: list[dict[str, str]] = field(default_factory=list)
+
+            def drain_diagnostics(self) -> list[dict[str, str]]:
+                drained, self.diagnostics = self.diagnostics, []
+                return drained
+
+        adapter = _StaleDropAdapter(
+            diagnostics=[{"code": "stale-drop", "update_id": "7", "chat_id": "100", "message": "stale update 7"}]
+        )
+
+        config = RuntimeConfig(token="tkn")
+        emitter = HeartbeatEventEmitter.DISABLED
+
+        idle = run_cycle(config=config, adapter=adapter, heartbeat_emitter=emitter)
+        clean = run_cycle(config=config, adapter=adapter, heartbeat_emitter=emitter)
+
+        self.assertEqual((idle["reason"], idle["fetched_count"], idle["dropped_count"]), ("no-updates", 0, 1))
+        self.assertEqual([detail["code"] for detail in idle["error_details"]], ["stale-drop"])
+        self.assertEqual((clean["dropped_count"], clean["error_details"]), (0, []))
+        self.assertIn("telemetry", clean)
+
+    def test_cycle_result_errors_bounded_to_newest_with_full_count(self) -> None:
+        total = runtime_runner._MAX_RESULT_ERRORS + 8
+
+        @dataclass
+        class _NoisyAdapter(_AdapterStub):
+            def drain_diagnostics(self) -> list[dict[str, str]]:
+                return [{"code": "adapter-noise", "message": f"noise {idx}"} for idx in range(total)]
+
+        result = run_cycle(
+            config=RuntimeConfig(token="tkn"),
+            adapter=_NoisyAdapter(),
+            heartbeat_emitter=HeartbeatEventEmitter.DISABLED,
+        )
+
+        self.assertEqual(result["error_count"], total)
+        self.assertEqual(len(result["errors"]), runtime_runner._MAX_RESULT_ERRORS)
+        self.assertEqual(result["errors"][-1], f"noise {total - 1}")
+        self.assertEqual(result["reason"], "completed-with-errors")
+
+    def test_service_errors_and_details_bounded_together_without_diagnostics(self) -> None:
+        total = runtime_runner._MAX_RESULT_ERRORS + 8
+        adapter = _AdapterStub(
+            updates=[_inbound(str(index), chat_id="501") for index in range(total)],
+            fail_send_calls=set(range(1, total + 1)),
+        )
+
+        result = run_cycle(
+            config=RuntimeConfig(token="tkn"),
+            adapter=adapter,
+            orchestrator=DefaultOrchestrator(),
+            heartbeat_emitter=HeartbeatEventEmitter.DISABLED,
+        )
+
+        self.assertEqual(result["error_count"], total)
+        self.assertEqual(len(result["errors"]), runtime_runner._MAX_RESULT_ERRORS)
+        self.assertTrue(result["errors"][-1].startswith(f"update {total - 1}:"))
+        self.assertEqual([detail["message"] for detail in result["error_details"]], result["errors"])
+
     def test_default_orchestrator_echo_wires_outbound_send(self) -> None:
         adapter = _AdapterStub(updates=[_inbound("1", text="ping", chat_id="501")])
 
         result = run_cycle(
             config=RuntimeConfig(token="tkn"),
             adapter=adapter,
-            heartbeat_emitter=HeartbeatEventEmitter(enabled=False),
+            heartbeat_emitter=HeartbeatEventEmitter.DISABLED,
             enable_memory_hook=False,
         )
 
@@ -606,6 +798,79 @@ class TestRuntimeRunnerP2(unittest.TestCase):
             result["telemetry"]["placeholders"]["worker_restart_total"],
             "pending-supervisor-integration",
         )
+        # The result is a plain JSON contract for any caller, not just the CLI encoder.
+        self.assertEqual(json.loads(json.dumps(result))["telemetry"], result["telemetry"])
+        self.assertEqual(copy.deepcopy(result), result)
+
+    def test_memory_hook_appends_lookup_text_to_echo(self) -> None:
+        orchestrator = DefaultOrchestrator(enable_memory_hook=True, memory_lookup=lambda query: f"note for {query}")
+        disabled = DefaultOrchestrator(enable_memory_hook=False, memory_lookup=lambda query: "unused")
+
+        reply = orchestrator.handle_message(_inbound("1", text="ping"), session_id="s1")
+        plain = disabled.handle_message(_inbound("2", text="ping"), session_id="s1")
+
+        self.assertEqual(reply.text, "echo: ping\n\nmemory: note for ping")
+        self.assertEqual(plain.text, "echo: ping")
+
+    def test_default_memory_lookup_memoizes_repeat_queries(self) -> None:
+        calls: list[str] = []
+
+        def _search(**kwargs: Any) -> dict[str, Any]:
+            calls.append(kwargs["query"])
+            return {"results": [{"snippet": f"  hit {kwargs['query']}  "}]}
+
+        runtime_runner.invalidate_memory_cache()
+        self.addCleanup(runtime_runner.invalidate_memory_cache)
+        with patch.object(runtime_runner, "_memory_search_fn", _search):
+            first = runtime_runner._default_memory_lookup("ping")
+            second = runtime_runner._default_memory_lookup("ping")
+            runtime_runner.invalidate_memory_cache()
+            third = runtime_runner._default_memory_lookup("ping")
+
+        self.assertEqual((first, second, third), ("hit ping", "hit ping", "hit ping"))
+        self.assertEqual(calls, ["ping", "ping"])
+
+    def test_memory_hook_env_flag_is_read_once_until_reset(self) -> None:
+        runtime_runner._reset_memory_hook_flag_cache()
+        self.addCleanup(runtime_runner._reset_memory_hook_flag_cache)
+        with patch.dict("os.environ", {"CHANNEL_ENABLE_MEMORY_HOOK": "yes"}):
+            self.assertTrue(runtime_runner._resolve_memory_hook_flag(None))
+        with patch.dict("os.environ", {"CHANNEL_ENABLE_MEMORY_HOOK": "no"}):
+            self.assertTrue(runtime_runner._resolve_memory_hook_flag(None))
+            self.assertFalse(runtime_runner._resolve_memory_hook_flag(False))
+            runtime_runner._reset_memory_hook_flag_cache()
+            self.assertFalse(runtime_runner._resolve_memory_hook_flag(None))
+
+    def test_default_orchestrator_replies_carry_plain_session_metadata(self) -> None:
+        orchestrator = DefaultOrchestrator()
+
+        first = orchestrator.handle_message(_inbound("1"), session_id="telegram:100")
+        second = orchestrator.handle_message(_inbound("2"), session_id="telegram:100")
+
+        self.assertEqual(first.metadata, {"session_id": "telegram:100"})
+        self.assertIs(type(first.metadata), dict)
+        self.assertIsNot(first.metadata, second.metadata)
+        self.assertEqual(json.loads(json.dumps(first.metadata)), first.metadata)
+        self.assertEqual(copy.deepcopy(first), first)
+
+    def test_default_orchestrator_overlaps_memory_lookups_in_batches(self) -> None:
+        barrier = threading.Barrier(2, timeout=5)
+
+        def _lookup(query: str) -> str:
+            barrier.wait()
+            return f"note for {query}"
+
+        orchestrator = DefaultOrchestrator(enable_memory_hook=True, memory_lookup=_lookup, max_parallel_lookups=2)
+
+        replies = orchestrator.handle_messages(
+            [(_inbound("1", text="a"), "s1"), (_inbound("2", text="b"), "s2")]
+        )
+
+        self.assertEqual(
+            [reply.text for reply in replies],
+            ["echo: a\n\nmemory: note for a", "echo: b\n\nmemory: note for b"],
+        )
+        self.assertEqual(orchestrator.drain_diagnostics(), [])
 
     def test_memory_hook_failure_is_non_fatal_and_surfaces_error(self) -> None:
         adapter = _AdapterStub(updates=[_inbound("1", text="ping")])
@@ -618,7 +883,7 @@ class TestRuntimeRunnerP2(unittest.TestCase):
             adapter=adapter,
             enable_memory_hook=True,
             memory_lookup=_failing_lookup,
-            heartbeat_emitter=HeartbeatEventEmitter(enabled=False),
+            heartbeat_emitter=HeartbeatEventEmitter.DISABLED,
         )
 
         self.assertEqual(result["status"], "ok")
@@ -642,6 +907,22 @@ class TestRuntimeRunnerP2(unittest.TestCase):
         self.assertEqual(detail["context"]["session_id"], "")
         self.assertTrue(detail["diagnostic_id"])
 
+    def test_error_detail_dedupe_keeps_details_whose_display_ids_collide(self) -> None:
+        common = {
+            "code": "orchestrator-error",
+            "retryable": False,
+            "source": "orchestrator.diagnostics",
+            "category": "error",
+            "layer": "orchestrator",
+            "operation": "handle_message",
+        }
+        first = runtime_runner._build_error_detail(message="boom|1", update_id="", **common)
+        second = runtime_runner._build_error_detail(message="boom", update_id="1|", **common)
+        repeat = runtime_runner._build_error_detail(message="boom", update_id="1|", **common)
+
+        self.assertEqual(first["diagnostic_id"], second["diagnostic_id"])
+        self.assertEqual(runtime_runner._dedupe_error_details([first, second, repeat]), [first, second])
+
     def test_outbound_send_failure_isolated_per_update(self) -> None:
         adapter = _AdapterStub(
             updates=[_inbound("1", text="first"), _inbound("2", text="second")],
@@ -652,7 +933,7 @@ class TestRuntimeRunnerP2(unittest.TestCase):
             config=RuntimeConfig(token="tkn"),
             adapter=adapter,
             orchestrator=DefaultOrchestrator(enable_memory_hook=False),
-            heartbeat_emitter=HeartbeatEventEmitter(enabled=False),
+            heartbeat_emitter=HeartbeatEventEmitter.DISABLED,
         )
 
         self.assertEqual(result["status"], "ok")
@@ -663,6 +944,9 @@ class TestRuntimeRunnerP2(unittest.TestCase):
         self.assertEqual(result["ack_skipped_count"], 0)
         self.assertEqual(result["error_count"], 1)
         self.assertEqual(adapter.acked, ["1", "2"])
+        self.assertEqual(adapter.ack_batches, [["1", "2"]])
+        # Echo-only orchestration does not fan out, so replies stream per message.
+        self.assertEqual(adapter.send_batch_sizes, [])
         self.assertEqual(len(adapter.sent), 1)
         self.assertEqual(adapter.sent[0].text, "echo: second")
         self.assertIn("ChannelRuntimeError: send failed", result["errors"][0])
@@ -713,9 +997,9 @@ class TestRuntimeRunnerP2(unittest.TestCase):
         self.assertEqual(result["heartbeat_emit_failures"], 0)
         self.assertEqual(result["telemetry"]["heartbeat"]["emit_state"], "emitted")
         self.assertEqual(len(publisher.calls), 1)
-        self.assertEqual(publisher.calls[0]["session_key"], "telegram:runtime")
-        self.assertIn("cycle failure", publisher.calls[0]["text"])
-        context = publisher.calls[0]["context"]
+        self.assertEqual(publisher.calls[0].session_key, "telegram:runtime")
+        self.assertIn("cycle failure", publisher.calls[0].text)
+        context = publisher.calls[0].context
         self.assertIn("heartbeat", context)
         self.assertEqual(context["heartbeat"]["emit_state"], "emitted")
         self.assertIn("telemetry_digest", context)
@@ -737,7 +1021,7 @@ class TestRuntimeRunnerP2(unittest.TestCase):
         result = run_cycle(
             config=RuntimeConfig(token="tkn"),
             adapter=adapter,
-            heartbeat_emitter=HeartbeatEventEmitter(enabled=False),
+            heartbeat_emitter=HeartbeatEventEmitter.DISABLED,
         )
 
         self.assertEqual(result["status"], "failed")
@@ -817,7 +1101,7 @@ class TestRuntimeRunnerP2(unittest.TestCase):
         self.assertEqual(result["error_details"][0]["context"]["layer"], "context")
         self.assertEqual(result["error_details"][0]["context"]["operation"], "assemble")
         self.assertEqual(len(publisher.calls), 1)
-        digest = publisher.calls[0]["context"]["telemetry_digest"]
+        digest = publisher.calls[0].context["telemetry_digest"]
         self.assertEqual(digest["context_mode"], "durable")
         self.assertEqual(digest["context_compaction_attempted_total"], 2)
         self.assertEqual(digest["context_compaction_succeeded_total"], 1)
@@ -830,6 +1114,60 @@ class TestRuntimeRunnerP2(unittest.TestCase):
         self.assertEqual(digest["context_summary_tokens_estimate"], 25)
         self.assertEqual(digest["context_recent_tokens_estimate"], 185)
 
+    def test_disabled_emitter_never_calls_publishers(self) -> None:
+        calls: list[str] = []
+        emitter = HeartbeatEventEmitter(
+            enabled=False,
+            publish_event=lambda **kwargs: calls.append("event"),
+            publish_events=lambda **kwargs: calls.append("events"),
+        )
+
+        single = emitter.emit_failure(session_key="s", text="boom", context={"code": "x"})
+        batch = emitter.emit_failures(session_key="s", entries=[("a", None), ("b", {})])
+
+        self.assertFalse(single)
+        self.assertEqual(batch, [False, False])
+        self.assertEqual(calls, [])
+        self.assertEqual(HeartbeatEventEmitter(enabled=False), HeartbeatEventEmitter(enabled=False))
+        self.assertEqual(HeartbeatEventEmitter.DISABLED, HeartbeatEventEmitter(enabled=False))
+        self.assertFalse(HeartbeatEventEmitter.DISABLED.emit_failure(session_key="s", text="boom"))
+
+    def test_diagnostic_failures_use_one_batch_publish_when_available(self) -> None:
+        adapter = _AdapterStub(updates=[_inbound("1", text="ping", chat_id="501")])
+        single_publisher = _RecordingPublisher(fail=False)
+        batches: list[dict[str, Any]] = []
+
+        class _NoisyOrchestrator:
+            def handle_message(self, inbound: InboundMessage, *, session_id: str) -> OutboundMessage | None:
+                _ = (inbound, session_id)
+                return None
+
+            def drain_diagnostics(self) -> list[dict[str, Any]]:
+                return [
+                    {"code": "orchestrator-error", "message": "first", "update_id": "1"},
+                    {"code": "orchestrator-error", "message": "second", "update_id": "1"},
+                ]
+
+        result = run_cycle(
+            config=RuntimeConfig(token="tkn"),
+            adapter=adapter,
+            orchestrator=_NoisyOrchestrator(),
+            heartbeat_emitter=HeartbeatEventEmitter(
+                publish_event=single_publisher,
+                publish_events=lambda **kwargs: batches.append(kwargs),
+            ),
+        )
+
+        self.assertEqual(result["error_count"], 2)
+        self.assertEqual(result["heartbeat_emit_failures"], 0)
+        self.assertEqual(single_publisher.calls, [])
+        self.assertEqual(len(batches), 1)
+        self.assertEqual(
+            [event["text"] for event in batches[0]["events"]],
+            ["orchestrator failure: first", "orchestrator failure: second"],
+        )
+        self.assertEqual(batches[0]["source"], "channel-runtime")
+
     def test_context_diagnostic_without_explicit_operation_maps_deterministically(self) -> None:
         adapter = _AdapterStub(updates=[_inbound("1", text="ping", chat_id="501")])
 
@@ -858,7 +1196,7 @@ class TestRuntimeRunnerP2(unittest.TestCase):
             config=RuntimeConfig(token="tkn", context_mode="durable"),
             adapter=adapter,
             orchestrator=_ContextDiagnosticOrchestrator(),
-            heartbeat_emitter=HeartbeatEventEmitter(enabled=False),
+            heartbeat_emitter=HeartbeatEventEmitter.DISABLED,
         )
 
         self.assertEqual(result["status"], "ok")
@@ -881,7 +1219,7 @@ class TestRuntimeRunnerP2(unittest.TestCase):
             config=RuntimeConfig(token="tkn", allowed_chat_ids=("100", "200")),
             adapter=adapter,
             orchestrator=_ExplodingOrchestrator(),
-            heartbeat_emitter=HeartbeatEventEmitter(enabled=False),
+            heartbeat_emitter=HeartbeatEventEmitter.DISABLED,
         )
 
         self.assertEqual(result["status"], "ok")
@@ -909,7 +1247,7 @@ class TestRuntimeRunnerP2(unittest.TestCase):
         result = run_cycle(
             config=RuntimeConfig(token="tkn", allowed_chat_ids=("0042",)),
             adapter=adapter,
-            heartbeat_emitter=HeartbeatEventEmitter(enabled=False),
+            heartbeat_emitter=HeartbeatEventEmitter.DISABLED,
         )
 
         self.assertEqual(result["status"], "ok")
@@ -928,7 +1266,7 @@ class TestRuntimeRunnerP2(unittest.TestCase):
             config=RuntimeConfig(token="tkn", orchestrator_mode="codex"),
             adapter=adapter,
             codex_invoke=_invoke,
-            heartbeat_emitter=HeartbeatEventEmitter(enabled=False),
+            heartbeat_emitter=HeartbeatEventEmitter.DISABLED,
         )
 
         self.assertEqual(result["status"], "ok")
@@ -952,7 +1290,7 @@ class TestRuntimeRunnerP2(unittest.TestCase):
             config=RuntimeConfig(token="tkn", orchestrator_mode=" codex "),
             adapter=adapter,
             codex_invoke=_invoke,
-            heartbeat_emitter=HeartbeatEventEmitter(enabled=False),
+            heartbeat_emitter=HeartbeatEventEmitter.DISABLED,
         )
 
         self.assertEqual(result["status"], "ok")
@@ -971,7 +1309,7 @@ class TestRuntimeRunnerP2(unittest.TestCase):
             config=RuntimeConfig(token="tkn", orchestrator_mode="codex"),
             adapter=adapter,
             codex_invoke=_timeout,
-            heartbeat_emitter=HeartbeatEventEmitter(enabled=False),
+            heartbeat_emitter=HeartbeatEventEmitter.DISABLED,
         )
 
         self.assertEqual(result["status"], "ok")
@@ -1005,7 +1343,7 @@ class TestRuntimeRunnerP2(unittest.TestCase):
             ),
             adapter=adapter,
             codex_invoke=_timeout,
-            heartbeat_emitter=HeartbeatEventEmitter(enabled=False),
+            heartbeat_emitter=HeartbeatEventEmitter.DISABLED,
         )
 
         self.assertEqual(result["status"], "ok")
@@ -1044,13 +1382,13 @@ class TestRuntimeRunnerP2(unittest.TestCase):
                     config=config,
                     adapter=_AdapterStub(updates=[_inbound("1", text="first", chat_id="77")]),
                     codex_invoke=_invoke,
-                    heartbeat_emitter=HeartbeatEventEmitter(enabled=False),
+                    heartbeat_emitter=HeartbeatEventEmitter.DISABLED,
                 )
                 second = run_cycle(
                     config=config,
                     adapter=_AdapterStub(updates=[_inbound("2", text="second", chat_id="77")]),
                     codex_invoke=_invoke,
-                    heartbeat_emitter=HeartbeatEventEmitter(enabled=False),
+                    heartbeat_emitter=HeartbeatEventEmitter.DISABLED,
                 )
 
         self.assertEqual(first["status"], "ok")
@@ -1083,13 +1421,13 @@ class TestRuntimeRunnerP2(unittest.TestCase):
                     config=config,
                     adapter=_AdapterStub(updates=[_inbound("1", text="first", chat_id="88")]),
                     codex_invoke=_invoke,
-                    heartbeat_emitter=HeartbeatEventEmitter(enabled=False),
+                    heartbeat_emitter=HeartbeatEventEmitter.DISABLED,
                 )
                 second = run_cycle(
                     config=config,
                     adapter=_AdapterStub(updates=[_inbound("2", text="second", chat_id="88")]),
                     codex_invoke=_invoke,
-                    heartbeat_emitter=HeartbeatEventEmitter(enabled=False),
+                    heartbeat_emitter=HeartbeatEventEmitter.DISABLED,
                 )
 
         self.assertEqual(first["status"], "ok")
@@ -1120,13 +1458,13 @@ class TestRuntimeRunnerP2(unittest.TestCase):
                     config=config,
                     adapter=_AdapterStub(updates=[_inbound("1", text="first", chat_id="77")]),
                     codex_invoke=_invoke,
-                    heartbeat_emitter=HeartbeatEventEmitter(enabled=False),
+                    heartbeat_emitter=HeartbeatEventEmitter.DISABLED,
                 )
                 second = run_cycle(
                     config=config,
                     adapter=_AdapterStub(updates=[_inbound("2", text="second", chat_id="77")]),
                     codex_invoke=_invoke,
-                    heartbeat_emitter=HeartbeatEventEmitter(enabled=False),
+                    heartbeat_emitter=HeartbeatEventEmitter.DISABLED,
                 )
                 transcript = store.load_transcript(session_id="telegram:77")
 
@@ -1147,7 +1485,7 @@ class TestRuntimeRunnerP2(unittest.TestCase):
                 config=RuntimeConfig(token="tkn", orchestrator_mode="codex"),
                 adapter=adapter,
                 codex_invoke=lambda req: f"ok:{req.text}",
-                heartbeat_emitter=HeartbeatEventEmitter(enabled=False),
+                heartbeat_emitter=HeartbeatEventEmitter.DISABLED,
             )
 
         self.assertEqual(result["status"], "ok")
@@ -1167,7 +1505,7 @@ class TestRuntimeRunnerP2(unittest.TestCase):
                 ),
                 adapter=adapter,
                 codex_invoke=lambda req: f"ok:{req.text}",
-                heartbeat_emitter=HeartbeatEventEmitter(enabled=False),
+                heartbeat_emitter=HeartbeatEventEmitter.DISABLED,
             )
 
         self.assertEqual(result["status"], "ok")
@@ -1195,7 +1533,7 @@ class TestRuntimeRunnerP2(unittest.TestCase):
                     ),
                     adapter=adapter,
                     codex_invoke=lambda _: (_ for _ in ()).throw(AssertionError("codex invoke should not run for /ctx compact")),
-                    heartbeat_emitter=HeartbeatEventEmitter(enabled=False),
+                    heartbeat_emitter=HeartbeatEventEmitter.DISABLED,
                 )
 
         self.assertEqual(result["status"], "ok")
@@ -1221,7 +1559,7 @@ class TestRuntimeRunnerP2(unittest.TestCase):
                     ),
                     adapter=adapter,
                     codex_invoke=lambda _: (_ for _ in ()).throw(AssertionError("codex invoke should not run for /ctx inspect")),
-                    heartbeat_emitter=HeartbeatEventEmitter(enabled=False),
+                    heartbeat_emitter=HeartbeatEventEmitter.DISABLED,
                 )
 
         self.assertEqual(result["status"], "ok")
@@ -1239,7 +1577,7 @@ class TestRuntimeRunnerP2(unittest.TestCase):
             config=RuntimeConfig(token="tkn", ack_policy="on-success"),
             adapter=adapter,
             orchestrator=DefaultOrchestrator(enable_memory_hook=False),
-            heartbeat_emitter=HeartbeatEventEmitter(enabled=False),
+            heartbeat_emitter=HeartbeatEventEmitter.DISABLED,
         )
 
         self.assertEqual(result["status"], "ok")
@@ -1258,7 +1596,7 @@ class TestRuntimeRunnerP2(unittest.TestCase):
             config=RuntimeConfig(token="tkn"),
             adapter=adapter,
             orchestrator=DefaultOrchestrator(enable_memory_hook=False),
-            heartbeat_emitter=HeartbeatEventEmitter(enabled=False),
+            heartbeat_emitter=HeartbeatEventEmitter.DISABLED,
         )
 
         self.assertEqual(result["status"], "ok")
@@ -1304,8 +1642,8 @@ class TestRuntimeRunnerP2(unittest.TestCase):
         self.assertTrue(result["error_details"][1]["retryable"])
         self.assertEqual(result["heartbeat_emit_failures"], 0)
         self.assertEqual(len(publisher.calls), 2)
-        self.assertEqual(publisher.calls[0]["text"], "adapter failure: cursor_state_load failed: read failed")
-        self.assertEqual(publisher.calls[1]["text"], "adapter failure: cursor_state_save failed: write failed")
+        self.assertEqual(publisher.calls[0].text, "adapter failure: cursor_state_load failed: read failed")
+        self.assertEqual(publisher.calls[1].text, "adapter failure: cursor_state_save failed: write failed")
 
     def test_adapter_stale_drop_is_visible_in_dropped_updates(self) -> None:
         adapter = _DiagnosticAdapterStub(
@@ -1321,7 +1659,7 @@ class TestRuntimeRunnerP2(unittest.TestCase):
         result = run_cycle(
             config=RuntimeConfig(token="tkn"),
             adapter=adapter,
-            heartbeat_emitter=HeartbeatEventEmitter(enabled=False),
+            heartbeat_emitter=HeartbeatEventEmitter.DISABLED,
         )
 
         self.assertEqual(result["status"], "ok")
@@ -1345,12 +1683,12 @@ class TestRuntimeRunnerP2(unittest.TestCase):
         first = run_cycle(
             config=RuntimeConfig(token="tkn"),
             adapter=adapter,
-            heartbeat_emitter=HeartbeatEventEmitter(enabled=False),
+            heartbeat_emitter=HeartbeatEventEmitter.DISABLED,
         )
         second = run_cycle(
             config=RuntimeConfig(token="tkn"),
             adapter=adapter,
-            heartbeat_emitter=HeartbeatEventEmitter(enabled=False),
+            heartbeat_emitter=HeartbeatEventEmitter.DISABLED,
         )
 
         self.assertEqual(first["error_count"], 1)
@@ -1393,7 +1731,7 @@ class TestRuntimeRunnerP2(unittest.TestCase):
             config=RuntimeConfig(token="tkn"),
             adapter=adapter,
             orchestrator=_FailingOrchestrator(),
-            heartbeat_emitter=HeartbeatEventEmitter(enabled=False),
+            heartbeat_emitter=HeartbeatEventEmitter.DISABLED,
         )
 
         codes = [detail["code"] for detail in result["error_details"]]
@@ -1415,7 +1753,7 @@ class TestRuntimeRunnerP2(unittest.TestCase):
         with patch("channel_runtime.runner.process_once", side_effect=RuntimeError("hard crash")):
             result = run_cycle(
                 config=RuntimeConfig(token="tkn"),
-                heartbeat_emitter=HeartbeatEventEmitter(enabled=False),
+                heartbeat_emitter=HeartbeatEventEmitter.DISABLED,
             )
 
         self.assertEqual(result["status"], "failed")
@@ -1444,7 +1782,7 @@ class TestRuntimeRunnerP2(unittest.TestCase):
         result = run_cycle(
             config=RuntimeConfig(token="tkn"),
             adapter=adapter,
-            heartbeat_emitter=HeartbeatEventEmitter(enabled=False),
+            heartbeat_emitter=HeartbeatEventEmitter.DISABLED,
         )
 
         detail = result["error_details"][0]
@@ -1547,12 +1885,195 @@ class TestRuntimeRunnerP3Loop(unittest.TestCase):
             sleep_fn=sleep_calls.append,
             on_cycle=_on_cycle,
             max_cycles=2,
+            monotonic_fn=lambda: 100.0,
         )
 
         self.assertEqual(statuses, ["failed", "ok"])
         self.assertEqual(sleep_calls, [1.5])
         self.assertEqual(result["status"], "ok")
 
+    def test_run_loop_paces_cycles_against_poll_deadlines(self) -> None:
+        clock = {"now": 0.0}
+        cycle_costs = iter([0.5, 3.0, 0.25, 0.0])
+        sleep_calls: list[float] = []
+
+        def _cycle(*, config: RuntimeConfig) -> dict[str, Any]:
+            clock["now"] += next(cycle_costs)
+            return {"status": "ok", "reason": "processed"}
+
+        def _sleep(seconds: float) -> None:
+            sleep_calls.append(seconds)
+            clock["now"] += seconds
+
+        run_loop(
+            config=RuntimeConfig(token="tkn", once=False, poll_interval_s=2.0),
+            run_cycle_fn=_cycle,
+            sleep_fn=_sleep,
+            max_cycles=4,
+            monotonic_fn=lambda: clock["now"],
+        )
+
+        # 0.5s cycle sleeps the remaining 1.5s; the 3s overrun restarts pacing without a catch-up burst.
+        self.assertEqual(sleep_calls, [1.5, 1.75])
+
+    def test_run_loop_refreshes_memory_cache_each_cycle(self) -> None:
+        calls: list[str] = []
+
+        def _search(**kwargs: Any) -> dict[str, Any]:
+            calls.append(kwargs["query"])
+            return {"results": [{"snippet": f"note {len(calls)}"}]}
+
+        snippets: list[str | None] = []
+
+        def _cycle(*, config: RuntimeConfig) -> dict[str, Any]:
+            snippets.append(runtime_runner._default_memory_lookup("ping"))
+            snippets.append(runtime_runner._default_memory_lookup("ping"))
+            return {"status": "ok", "reason": "processed"}
+
+        self.addCleanup(runtime_runner.invalidate_memory_cache)
+        with patch.object(runtime_runner, "_memory_search_fn", _search):
+            run_loop(
+                config=RuntimeConfig(token="tkn", once=False, poll_interval_s=1.0),
+                run_cycle_fn=_cycle,
+                sleep_fn=lambda _seconds: None,
+                max_cycles=2,
+            )
+
+        # Repeat lookups within a cycle hit the cache; the next cycle re-reads memory.
+        self.assertEqual(calls, ["ping", "ping"])
+        self.assertEqual(snippets, ["note 1", "note 1", "note 2", "note 2"])
+
+    def test_run_loop_adaptive_poll_backs_off_on_idle_cycles_and_resets_on_work(self) -> None:
+        clock = {"now": 0.0}
+        fetched = iter([0, 0, 0, 0, 0, 1, 0, 0])
+        sleep_calls: list[float] = []
+
+        def _cycle(*, config: RuntimeConfig) -> dict[str, Any]:
+            return {"status": "ok", "reason": "processed", "fetched_count": next(fetched)}
+
+        def _sleep(seconds: float) -> None:
+            sleep_calls.append(seconds)
+            clock["now"] += seconds
+
+        run_loop(
+            config=RuntimeConfig(token="tkn", once=False, poll_interval_s=1.0, adaptive_poll=True, max_poll_interval_s=5.0),
+            run_cycle_fn=_cycle,
+            sleep_fn=_sleep,
+            max_cycles=8,
+            monotonic_fn=lambda: clock["now"],
+        )
+
+        self.assertEqual(sleep_calls, [1.0, 2.0, 4.0, 5.0, 5.0, 1.0, 1.0])
+
+    def test_adaptive_poll_fields_parsed_and_validated(self) -> None:
+        cfg = parse_runtime_config([], env={"CHANNEL_TOKEN": "x"})
+        self.assertFalse(cfg.adaptive_poll)
+        self.assertEqual(cfg.max_poll_interval_s, 30.0)
+        cfg = parse_runtime_config(
+            ["--adaptive-poll", "true", "--max-poll-interval-s", "12.5"],
+            env={"CHANNEL_TOKEN": "x"},
+        )
+        self.assertTrue(cfg.adaptive_poll)
+        self.assertEqual(cfg.max_poll_interval_s, 12.5)
+        with self.assertRaisesRegex(ConfigValidationError, "max_poll_interval_s must be a positive number"):
+            parse_runtime_config([], env={"CHANNEL_TOKEN": "x", "CHANNEL_MAX_POLL_INTERVAL_S": "0"})
+
+    def test_run_loop_reuses_default_wiring_across_cycles(self) -> None:
+        adapter = _AdapterStub(updates=[_inbound("1", text="ping")])
+        builds: list[RuntimeConfig] = []
+
+        def _build(config: RuntimeConfig) -> dict[str, Any]:
+            builds.append(config)
+            return {
+                "adapter": adapter,
+                "orchestrator": DefaultOrchestrator(),
+                "heartbeat_emitter": HeartbeatEventEmitter.DISABLED,
+            }
+
+        with patch("channel_runtime.runner._build_loop_dependencies", _build):
+            result = run_loop(
+                config=RuntimeConfig(token="tkn"),
+                run_cycle_fn=run_cycle,
+                sleep_fn=lambda _: None,
+                max_cycles=3,
+            )
+
+        self.assertEqual(result["status"], "ok")
+        self.assertEqual(len(builds), 1)
+        self.assertEqual(len(adapter.sent), 3)
+
+    def test_chat_id_normalization_matches_int_canonical_form(self) -> None:
+        cases = {
+            "100": "100",
+            " 007 ": "7",
+            "-00100": "-100",
+            "-0": "0",
+            "+5": "5",
+            "1_000": "1000",
+            "@channel": "@channel",
+            "12a": "12a",
+            "": None,
+        }
+        for raw, expected in cases.items():
+            with self.subTest(raw=raw):
+                self.assertEqual(runtime_runner._normalize_chat_id_text(raw), expected)
+
+    def test_unconfigured_allowlist_gate_forwards_directly_to_delegate(self) -> None:
+        delegate = DefaultOrchestrator()
+        gate = AllowlistGateOrchestrator(delegate, allowed_chat_ids=())
+
+        reply = gate.handle_message(_inbound("1", chat_id="999"), session_id="s1")
+        batch = gate.handle_messages([(_inbound("2", chat_id="998"), "s2")])
+
+        self.assertEqual(gate.handle_message, delegate.handle_message)
+        self.assertEqual(reply.text, "echo: hello")
+        self.assertEqual([item.text for item in batch], ["echo: hello"])
+        self.assertEqual(gate.drain_diagnostics(), [])
+
+    def test_allowlist_gate_bounds_undrained_diagnostics(self) -> None:
+        gate = AllowlistGateOrchestrator(DefaultOrchestrator(), allowed_chat_ids=("42",))
+
+        with patch.object(runtime_runner, "MAX_PENDING_DIAGNOSTICS", 3):
+            bounded = AllowlistGateOrchestrator(DefaultOrchestrator(), allowed_chat_ids=("42",))
+        for index in range(5):
+            gate.handle_message(_inbound(str(index), chat_id="100"), session_id="s1")
+            bounded.handle_message(_inbound(str(index), chat_id="100"), session_id="s1")
+
+        self.assertEqual(len(gate.drain_diagnostics()), 5)
+        self.assertEqual([item["update_id"] for item in bounded.drain_diagnostics()], ["2", "3", "4"])
+        self.assertEqual(bounded.drain_diagnostics(), [])
+
+    def test_run_cycle_reuses_prebuilt_allowlist_gate(self) -> None:
+        gate = AllowlistGateOrchestrator(DefaultOrchestrator(), allowed_chat_ids=("42",))
+        config = RuntimeConfig(token="tkn", allowed_chat_ids=("42",))
+
+        results = [
+            run_cycle(
+                config=config,
+                adapter=_AdapterStub(updates=[_inbound(str(index), chat_id="100"), _inbound("ok", chat_id="42")]),
+                heartbeat_emitter=HeartbeatEventEmitter.DISABLED,
+                _allowlist_gate=gate,
+            )
+            for index in range(2)
+        ]
+
+        self.assertEqual([result["dropped_count"] for result in results], [1, 1])
+        self.assertEqual([result["sent_count"] for result in results], [1, 1])
+
+    def test_caller_supplied_gate_still_gets_configured_allowlist(self) -> None:
+        permissive = AllowlistGateOrchestrator(DefaultOrchestrator(), allowed_chat_ids=())
+        adapter = _AdapterStub(updates=[_inbound("1", chat_id="100"), _inbound("2", chat_id="42")])
+
+        result = run_cycle(
+            config=RuntimeConfig(token="tkn", allowed_chat_ids=("42",)),
+            adapter=adapter,
+            orchestrator=permissive,
+            heartbeat_emitter=HeartbeatEventEmitter.DISABLED,
+        )
+
+        self.assertEqual(result["dropped_count"], 1)
+        self.assertEqual([item.chat_id for item in adapter.sent], ["42"])
+
     def test_run_loop_cycle_exception_includes_structured_error_detail(self) -> None:
         def _cycle(*, config: RuntimeConfig) -> dict[str, Any]:
             raise RuntimeError("loop crash")
@@ -1575,64 +2096,78 @@ class TestRuntimeRunnerP3Loop(unittest.TestCase):
 
     def test_main_once_mode_exits_cleanly_after_one_cycle(self) -> None:
         calls: list[int] = []
+        stdout = io.StringIO()
 
         def _fake_run_loop(*, config: RuntimeConfig, **_: Any) -> dict[str, Any]:
             calls.append(1)
             return {"status": "ok", "reason": "processed", "fetched_count": 1}
 
-        with patch.object(runtime_main, "run_loop", _fake_run_loop), patch(
-            "sys.stdout.write"
-        ) as stdout_write:
-            code = runtime_main.main(["--token", "abc", "--once"])
+        code = runtime_main.main(["--token", "abc", "--once"], run_loop_fn=_fake_run_loop, stdout=stdout)
 
         self.assertEqual(code, 0)
         self.assertEqual(len(calls), 1)
-        written = "".join(str(call.args[0]) for call in stdout_write.call_args_list)
-        self.assertIn('"status": "ok"', written)
+        self.assertIn('"status": "ok"', stdout.getvalue())
 
     def test_main_once_mode_failed_result_exits_one(self) -> None:
         def _fake_run_loop(*, config: RuntimeConfig, **_: Any) -> dict[str, Any]:
             return {"status": "failed", "reason": "adapter-fetch-exception"}
 
-        with patch.object(runtime_main, "run_loop", _fake_run_loop):
-            code = runtime_main.main(["--token", "abc", "--once"])
+        code = runtime_main.main(["--token", "abc", "--once"], run_loop_fn=_fake_run_loop, stdout=io.StringIO())
 
         self.assertEqual(code, 1)
 
     def test_main_invalid_config_exits_two_and_emits_payload(self) -> None:
-        with patch("sys.stdout.write") as stdout_write:
-            code = runtime_main.main(["--token", " "])
+        stdout = io.StringIO()
+
+        code = runtime_main.main(["--token", " "], stdout=stdout)
 
         self.assertEqual(code, 2)
-        written = "".join(str(call.args[0]) for call in stdout_write.call_args_list)
-        self.assertIn('"status": "failed"', written)
-        self.assertIn('"reason": "invalid-config"', written)
+        self.assertIn('"status": "failed"', stdout.getvalue())
+        self.assertIn('"reason": "invalid-config"', stdout.getvalue())
 
     def test_main_keyboard_interrupt_exits_130(self) -> None:
         def _interrupt(*, config: RuntimeConfig, **_: Any) -> dict[str, Any]:
             raise KeyboardInterrupt()
 
-        with patch.object(runtime_main, "run_loop", _interrupt):
-            code = runtime_main.main(["--token", "abc", "--once"])
+        code = runtime_main.main(["--token", "abc", "--once"], run_loop_fn=_interrupt, stdout=io.StringIO())
 
         self.assertEqual(code, 130)
 
+    def test_main_defaults_to_module_run_loop_and_sys_stdout(self) -> None:
+        def _fake_run_loop(*, config: RuntimeConfig, **_: Any) -> dict[str, Any]:
+            return {"status": "ok", "reason": "processed"}
+
+        with patch.object(runtime_main, "run_loop", _fake_run_loop), patch("sys.stdout.write") as stdout_write:
+            code = runtime_main.main(["--token", "abc", "--once"])
+
+        self.assertEqual(code, 0)
+        written = "".join(str(call.args[0]) for call in stdout_write.call_args_list)
+        self.assertIn('"reason": "processed"', written)
+
     def test_main_continuous_mode_emits_on_cycle_and_returns_zero(self) -> None:
+        stdout = io.StringIO()
+
         def _fake_run_loop(*, config: RuntimeConfig, on_cycle: Callable[[dict[str, Any]], None], **_: Any) -> dict[str, Any]:
             on_cycle({"status": "failed", "reason": "adapter-fetch-exception"})
             on_cycle({"status": "ok", "reason": "processed"})
             return {"status": "ok", "reason": "processed"}
 
-        with patch.object(runtime_main, "run_loop", _fake_run_loop), patch(
-            "sys.stdout.write"
-        ) as stdout_write:
-            code = runtime_main.main(["--token", "abc"])
+        code = runtime_main.main(["--token", "abc"], run_loop_fn=_fake_run_loop, stdout=stdout)
 
         self.assertEqual(code, 0)
-        written = "".join(str(call.args[0]) for call in stdout_write.call_args_list)
-        self.assertIn('"reason": "adapter-fetch-exception"', written)
-        self.assertIn('"reason": "processed"', written)
+        self.assertIn('"reason": "adapter-fetch-exception"', stdout.getvalue())
+        self.assertIn('"reason": "processed"', stdout.getvalue())
 
+    def test_main_continuous_mode_emits_summary_lines_unless_verbose(self) -> None:
+        def _fake_run_loop(*, config: RuntimeConfig, on_cycle: Callable[[dict[str, Any]], None], **_: Any) -> dict[str, Any]:
+            on_cycle({"status": "ok", "reason": "processed", "sent_count": 1, "telemetry": {"contract": "c"}})
+            return {}
+
+        for argv, expect_full in ((["--token", "abc"], False), (["--token", "abc", "--verbose"], True)):
+            stdout = io.StringIO()
+            self.assertEqual(runtime_main.main(argv, run_loop_fn=_fake_run_loop, stdout=stdout), 0)
+            self.assertIn('"sent_count": 1', stdout.getvalue())
+            self.assertEqual('"telemetry"' in stdout.getvalue(), expect_full)
 
 if __name__ == "__main__":
     unittest.main()
@@ -11,6 +11,9 @@ from .contracts import HeartbeatRequest, HeartbeatResponder, HeartbeatResponse
 from .heartbeat_file import load_heartbeat_prompt
 from .normalize import NormalizeResult, normalize_heartbeat_text
 
+# Longest error string a run result carries.
+_SANITIZED_MAX_CHARS = 500
+
 
 @dataclass(frozen=True)
 class HeartbeatRunResult:
@@ -146,6 +149,8 @@ def _now_ms() -> int:
 
 
 def _sanitize_exception(exc: Exception) -> str:
-    raw = f"{type(exc).__name__}: {exc}".strip()
-    compact = " ".join(raw.split())
-    return compact[:500]
+    raw = f"{type(exc).__name__}: {exc}"
+    # Common case: a short single-line message with nothing to collapse or strip.
+    if len(raw) <= _SANITIZED_MAX_CHARS and raw.isprintable() and "  " not in raw and not raw.endswith(" "):
+        return raw
+    return " ".join(raw.split())[:_SANITIZED_MAX_CHARS]
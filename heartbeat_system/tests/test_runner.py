@@ -129,6 +129,23 @@ class TestRunner(unittest.TestCase):
         self.assertEqual(result["error"], "RuntimeError: boom newline")
         self.assertEqual(result["run_reason"], "manual")
 
+    def test_run_once_responder_exception_keeps_clean_message_and_truncates_long_one(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            heartbeat_file = Path(tmp_dir) / "HEARTBEAT.md"
+            heartbeat_file.write_text("prompt", encoding="utf-8")
+
+            clean = run_heartbeat_once(
+                config=_config(heartbeat_file),
+                responder=_StubResponder(exc=RuntimeError("responder offline")),
+            )
+            long = run_heartbeat_once(
+                config=_config(heartbeat_file),
+                responder=_StubResponder(exc=RuntimeError("x" * 600 + "  ")),
+            )
+
+        self.assertEqual(clean["error"], "RuntimeError: responder offline")
+        self.assertEqual(long["error"], ("RuntimeError: " + "x" * 600)[:500])
+
 
 if __name__ == "__main__":
     unittest.main()
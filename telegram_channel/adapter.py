@@ -95,6 +95,18 @@ class TelegramChannelAdapter(ChannelAdapterPort):
         self._processed_ids.add(numeric_id)
         self._recompute_offset()
 
+    def ack_updates(self, update_ids: list[str]) -> None:
+        numeric_ids = [_to_int_update_id(update_id) for update_id in update_ids]
+        if any(numeric_id is None for numeric_id in numeric_ids):
+            raise ChannelRuntimeError("ack_updates requires numeric update_ids")
+        if not numeric_ids:
+            return
+
+        self._seen_update_ids.update(numeric_ids)
+        self._pending_ack_ids.difference_update(numeric_ids)
+        self._processed_ids.update(numeric_ids)
+        self._recompute_offset()
+
     def drain_diagnostics(self) -> list[dict[str, str]]:
         diagnostics = list(self._diagnostics)
         self._diagnostics.clear()
@@ -8,6 +8,7 @@ from pathlib import Path
 sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
 
 from channel_core.contracts import ChannelRuntimeError, OutboundMessage
+from channel_core.service import process_once
 from telegram_channel.adapter import TelegramChannelAdapter
 from telegram_channel.api import TelegramApiError
 from telegram_channel.cursor_state import CursorStateError, CursorStateSnapshot, DurableCursorStateStore
@@ -127,6 +128,39 @@ class TestTelegramAdapter(unittest.TestCase):
         self.assertEqual(api.offset_calls, [None, 13])
         self.assertEqual(second_fetch, [])
 
+    def test_ack_updates_batch_advances_offset_once(self) -> None:
+        batch = [
+            {
+                "update_id": update_id,
+                "message": {
+                    "message_id": update_id,
+                    "chat": {"id": 300},
+                    "from": {"id": 400},
+                    "text": f"m{update_id}",
+                },
+            }
+            for update_id in (30, 31, 32)
+        ]
+        api = _ApiStub([batch, []])
+        store = _StateStoreFailureStub()
+        adapter = TelegramChannelAdapter(api, cursor_state_store=store)
+
+        adapter.fetch_updates()
+        adapter.ack_updates(["31", "30", "32"])
+
+        self.assertEqual(adapter._next_offset, 33)
+        self.assertEqual(store.saved_floors, [30, 33])
+        adapter.fetch_updates()
+        self.assertEqual(api.offset_calls, [None, 33])
+
+    def test_ack_updates_rejects_non_numeric_ids_without_partial_ack(self) -> None:
+        adapter = TelegramChannelAdapter(_ApiStub([]))
+
+        with self.assertRaises(ChannelRuntimeError):
+            adapter.ack_updates(["40", "oops"])
+
+        self.assertIsNone(adapter._next_offset)
+
     def test_duplicate_update_id_not_reprocessed_in_later_poll(self) -> None:
         batch1 = [
             {
@@ -425,6 +459,39 @@ class TestTelegramAdapter(unittest.TestCase):
             )
         self.assertIn("cursor_state_load failed", str(ctx.exception))
 
+    def test_process_once_reports_strict_ack_persist_failure_without_reacking(self) -> None:
+        batch = [
+            {
+                "update_id": update_id,
+                "message": {
+                    "message_id": update_id,
+                    "chat": {"id": 500},
+                    "from": {"id": 600},
+                    "text": f"m{update_id}",
+                },
+            }
+            for update_id in (50, 51)
+        ]
+        store = _StateStoreFailureStub()
+        adapter = TelegramChannelAdapter(_ApiStub([batch]), cursor_state_store=store, strict_state_io=True)
+
+        class _FailSavesOnceFetched:
+            def handle_message(self, inbound, *, session_id):
+                # Fetch has persisted its floor; only the ack's save fails.
+                store.fail_save = True
+                return None
+
+        result = process_once(adapter, _FailSavesOnceFetched())
+
+        self.assertEqual(result["reason"], "completed-with-errors")
+        self.assertEqual(result["acked_count"], 0)
+        self.assertEqual(result["error_count"], 2)
+        for update_id, error in zip(("50", "51"), result["errors"]):
+            self.assertTrue(
+                error.startswith(f"update {update_id}: ack failed: ChannelRuntimeError: cursor_state_save failed")
+            )
+        self.assertEqual(store.saved_floors, [50])
+
     def test_ack_update_rejects_non_numeric_ids(self) -> None:
         adapter = TelegramChannelAdapter(_ApiStub([[]]))
 